@@ -0,0 +1,200 @@
+"""Store benchmark baselines and compare new runs against them.
+
+Baselines live in `benchmarks/baselines/<suite>.json`, one results file (see `results.py`)
+per suite holding the accepted value of every scenario. `compare` prints (or writes) a
+markdown report and exits with code 1 when any metric regressed beyond noise.
+
+A change is reported only if it is larger than the metric's threshold and, when both
+runs carry per-round samples, larger than 3 combined standard deviations of those rounds
+(robust estimate from the median absolute deviation).
+
+Usage:
+    python benchmarks/compare.py save benchmarks/results/throughput.json
+    python benchmarks/compare.py compare benchmarks/results/throughput.json \
+        [--baseline benchmarks/baselines/throughput.json] [--report report.md] [--threshold 0.05]
+"""
+
+import argparse
+import math
+import statistics
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from results import Results, Scenario
+
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+HIGHER_IS_BETTER = ("events_per_second",)
+# Tail percentiles move more between identical runs than medians and throughput
+THRESHOLDS = {"_p99_ms": 0.15, "_p95_ms": 0.10}
+NOISE_SIGMAS = 3
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    scenario: str
+    metric: str
+    baseline: float | None
+    current: float | None
+    relative: float | None  # signed, positive = larger value
+    band: float  # relative change treated as noise
+    verdict: str  # "improved" | "regressed" | "unchanged" | "new" | "missing"
+
+
+def baseline_path(suite: str) -> Path:
+    return BASELINE_DIR / f"{suite}.json"
+
+
+def save(results: Results, path: Path) -> None:
+    """Merge `results` into the baseline: its scenarios replace the stored ones."""
+    baseline = Results.read(path) if path.exists() else Results(suite=results.suite)
+    baseline.scenarios.update(results.scenarios)
+    baseline.environment = results.environment
+    baseline.created_at = results.created_at
+    baseline.write(path)
+
+
+def compare(baseline: Results, current: Results, threshold: float) -> list[Change]:
+    changes = []
+    for name in sorted(baseline.scenarios.keys() | current.scenarios.keys()):
+        old, new = baseline.scenarios.get(name), current.scenarios.get(name)
+        for metric in sorted((old.metrics if old else {}).keys() | (new.metrics if new else {})):
+            changes.append(_compare_metric(name, metric, old, new, threshold))
+    return changes
+
+
+def _compare_metric(
+    scenario: str, metric: str, old: Scenario | None, new: Scenario | None, threshold: float
+) -> Change:
+    before = old.metrics.get(metric) if old else None
+    after = new.metrics.get(metric) if new else None
+    band = metric_threshold(metric, threshold)
+
+    if before is None or after is None:
+        verdict = "new" if before is None else "missing"
+        return Change(scenario, metric, before, after, None, band, verdict)
+
+    if old and new and metric in old.samples and metric in new.samples:
+        noise = math.hypot(
+            _relative_sigma(old.samples[metric]), _relative_sigma(new.samples[metric])
+        )
+        band = max(band, NOISE_SIGMAS * noise)
+
+    relative = (after - before) / before if before else math.inf if after else 0.0
+    if abs(relative) <= band:
+        verdict = "unchanged"
+    elif (relative > 0) == metric.startswith(HIGHER_IS_BETTER):
+        verdict = "improved"
+    else:
+        verdict = "regressed"
+    return Change(scenario, metric, before, after, relative, band, verdict)
+
+
+def metric_threshold(metric: str, default: float) -> float:
+    for suffix, value in THRESHOLDS.items():
+        if metric.endswith(suffix):
+            return max(value, default)
+    return default
+
+
+def _relative_sigma(samples: list[float]) -> float:
+    if len(samples) < 2:
+        return 0.0
+    median = statistics.median(samples)
+    mad = statistics.median(abs(value - median) for value in samples)
+    return 1.4826 * mad / median if median else 0.0
+
+
+VERDICT_MARKS = {
+    "improved": "✅ improved",
+    "regressed": "❌ regressed",
+    "unchanged": "≈",
+    "new": "new",
+    "missing": "missing",
+}
+
+
+def render_markdown(baseline: Results, current: Results, changes: list[Change]) -> str:
+    regressions = sum(change.verdict == "regressed" for change in changes)
+    improvements = sum(change.verdict == "improved" for change in changes)
+    lines = [
+        f"# Benchmark comparison: {current.suite}",
+        "",
+        f"- Baseline: `{baseline.environment.get('git_commit')}` ({baseline.created_at})",
+        f"- Current: `{current.environment.get('git_commit')}` ({current.created_at})",
+        f"- Result: **{regressions} regressed**, {improvements} improved",
+    ]
+    for key in ("python", "machine", "cpu_count", "redis", "postgres"):
+        before, after = baseline.environment.get(key), current.environment.get(key)
+        if before != after:
+            lines.append(f"- ⚠️ `{key}` differs: {before} → {after}, numbers may not compare")
+
+    scenario = None
+    for change in changes:
+        if change.scenario != scenario:
+            scenario = change.scenario
+            lines += [
+                "",
+                f"## {scenario}",
+                "",
+                "| Metric | Baseline | Current | Change | Noise band | Verdict |",
+                "| ------ | -------: | ------: | -----: | ---------: | ------- |",
+            ]
+        lines.append(
+            f"| `{change.metric}` | {_number(change.baseline)} | {_number(change.current)} "
+            f"| {_percent(change.relative)} | ±{change.band:.1%} "
+            f"| {VERDICT_MARKS[change.verdict]} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _number(value: float | None) -> str:
+    if value is None:
+        return "—"
+    return f"{value:,.0f}" if abs(value) >= 100 else f"{value:.3g}"
+
+
+def _percent(value: float | None) -> str:
+    return "—" if value is None else f"{value:+.1%}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    save_parser = commands.add_parser("save", help="store a run as the suite's baseline")
+    save_parser.add_argument("results", type=Path)
+    save_parser.add_argument("--baseline", type=Path, default=None)
+
+    compare_parser = commands.add_parser("compare", help="compare a run against the baseline")
+    compare_parser.add_argument("results", type=Path)
+    compare_parser.add_argument("--baseline", type=Path, default=None)
+    compare_parser.add_argument("--report", type=Path, default=None, help="write markdown here")
+    compare_parser.add_argument("--threshold", type=float, default=0.05, help="minimum change")
+
+    args = parser.parse_args()
+    current = Results.read(args.results)
+    path = args.baseline or baseline_path(current.suite)
+
+    if args.command == "save":
+        save(current, path)
+        print(f"baseline {path} updated with {len(current.scenarios)} scenario(s)")
+        return 0
+
+    if not path.exists():
+        print(f"no baseline at {path}; run `compare.py save` first", file=sys.stderr)
+        return 2
+
+    baseline = Results.read(path)
+    changes = compare(baseline, current, args.threshold)
+    report = render_markdown(baseline, current, changes)
+    if args.report is not None:
+        args.report.write_text(report)
+    print(report)
+    return 1 if any(change.verdict == "regressed" for change in changes) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
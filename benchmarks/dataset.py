@@ -0,0 +1,377 @@
+"""Deterministic synthetic dataset for storage and query benchmarks.
+
+Generates N projects, M users and any number of events as files ready for Postgres:
+
+    projects.csv              `project` table rows
+    events-<shard>.csv[.gz]   `event` table rows, for `COPY event FROM ... (FORMAT csv, HEADER)`
+    events-<shard>.parquet    the same columns, with --format parquet (needs pyarrow)
+    manifest.json             parameters, per-shard row counts and sha256 of every file
+
+Events follow the seeder's funnel (`scripts/seeder.py`, `_simulate_user_journey`): a session
+views 1-5 pages and 1-4 products, adds some of them to the cart, sometimes removes one and
+sometimes buys the cart, with the seeder's think times between steps. Properties come from
+`tests/load/data_generator.py`; product fields come from a per-project catalog so a
+session's views, cart and purchases agree. Timestamps fall in a fixed window, not "now".
+
+Users are split into `--shards` independent shards, each with its own seed derived from
+`--seed`, and shards are written by `--processes` worker processes. The output depends only
+on (seed, projects, users, events, shards, window), not on the process count, so the
+manifest checksums can be compared to confirm two datasets are identical.
+
+Usage:
+    python benchmarks/dataset.py --out /data/bench --projects 50 --users 1000000 \
+        --events 1000000000 --shards 256 --processes 16 --gzip
+
+    psql -c "\\copy project FROM 'projects.csv' (FORMAT csv, HEADER)"
+    psql -c "\\copy event FROM 'events-0000.csv' (FORMAT csv, HEADER)"
+"""
+
+import argparse
+import csv
+import dataclasses
+import gzip
+import hashlib
+import io
+import json
+import multiprocessing
+import random
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import IO, Any
+from uuid import UUID
+
+from reference import ROOT  # noqa: F401  (puts the repo root and src on sys.path)
+
+from domain.event.models import Event, Properties
+from domain.event.types import EventType
+from domain.project.types import Plan
+from domain.utils.generate_uuid import derive_uuid
+from infrastructure.database.postgres.repositories.event import EVENT_COLUMNS, event_records
+from tests.load import data_generator
+
+
+PROJECT_COLUMNS = ("project_id", "name", "plan", "api_key", "created_at")
+PLANS = (Plan.FREE, Plan.PRO, Plan.PRO, Plan.ENTERPRISE)
+CATALOG_SIZE = 500
+CATEGORIES = ("Electronics", "Clothing", "Books", "Home", "Sports", "Beauty")
+WRITE_BATCH = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class DatasetConfig:
+    seed: int
+    projects: int
+    users: int
+    events: int
+    shards: int
+    start: datetime
+    days: int
+
+    def shard_seed(self, *parts: object) -> int:
+        key = ":".join(str(part) for part in (self.seed, *parts))
+        return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8])
+
+    def project_id(self, project: int) -> UUID:
+        return derive_uuid(self.start, f"{self.seed}:project:{project}")
+
+    def shard_events(self, shard: int) -> int:
+        return self.events // self.shards + (1 if shard < self.events % self.shards else 0)
+
+
+@dataclass(frozen=True, slots=True)
+class Product:
+    product_id: str
+    product_name: str
+    category: str
+    price: float
+
+
+def project_rows(config: DatasetConfig) -> list[tuple[Any, ...]]:
+    rng = random.Random(config.shard_seed("projects"))
+    return [
+        (
+            config.project_id(project),
+            f"bench_project_{project:05d}",
+            PLANS[project % len(PLANS)].value,
+            f"wk_bench_{rng.getrandbits(128):032x}",
+            config.start - timedelta(days=1),
+        )
+        for project in range(config.projects)
+    ]
+
+
+def catalog(config: DatasetConfig, project: int) -> list[Product]:
+    rng = random.Random(config.shard_seed("catalog", project))
+    return [
+        Product(
+            product_id=f"prod_{project:05d}_{index:05d}",
+            product_name=f"Product {index}",
+            category=rng.choice(CATEGORIES),
+            price=round(rng.uniform(9.99, 499.99), 2),
+        )
+        for index in range(CATALOG_SIZE)
+    ]
+
+
+class FunnelGenerator:
+    """One shard's events; `tests.load.data_generator` draws from the module-level `random`."""
+
+    def __init__(self, config: DatasetConfig, shard: int) -> None:
+        self._config = config
+        self._shard = shard
+        self._users = range(shard, config.users, config.shards)
+        self._catalogs = [catalog(config, project) for project in range(config.projects)]
+        self._project_ids = [config.project_id(project) for project in range(config.projects)]
+        self._window = config.days * 86_400
+        self._session = 0
+
+    def events(self) -> Iterator[Event]:
+        random.seed(self._config.shard_seed("shard", self._shard))
+        remaining = self._config.shard_events(self._shard)
+        if not self._users:
+            return
+        while remaining > 0:
+            for event in self._session_events(random.choice(self._users)):
+                yield event
+                remaining -= 1
+                if not remaining:
+                    return
+
+    def _session_events(self, user: int) -> Iterator[Event]:
+        project = user % self._config.projects
+        products = self._catalogs[project]
+        self._session += 1
+        context = _SessionContext(
+            project_id=self._project_ids[project],
+            user_id=f"user_{self._config.shard_seed('user', user):016x}",
+            session_id=f"session_{self._shard:04d}_{self._session:012d}",
+            clock=self._config.start + timedelta(seconds=random.random() * self._window),
+            key=f"{self._config.seed}:{self._shard}:{self._session}",
+        )
+
+        viewed: list[Product] = []
+        cart: list[Product] = []
+        for _ in range(random.randint(1, 5)):
+            yield context.event(EventType.PAGE_VIEW, _page_view_properties())
+            context.wait(2, 8)
+        for _ in range(random.randint(1, 4)):
+            product = random.choice(products)
+            viewed.append(product)
+            yield context.event(EventType.PRODUCT_VIEW, _product_properties("view", product))
+            context.wait(3, 10)
+        for product in viewed[-3:]:
+            if random.random() < 0.6:
+                cart.append(product)
+                yield context.event(EventType.ADD_TO_CART, _product_properties("cart", product))
+                context.wait(1, 3)
+        if cart and random.random() < 0.1:
+            product = cart.pop(random.randrange(len(cart)))
+            yield context.event(EventType.REMOVE_FROM_CART, _product_properties("remove", product))
+            context.wait(1, 2)
+        if cart and random.random() < 0.15:
+            for product in cart:
+                yield context.event(EventType.PURCHASE, _product_properties("purchase", product))
+                context.wait(0.1, 0.1)
+
+
+@dataclass(slots=True)
+class _SessionContext:
+    project_id: UUID
+    user_id: str
+    session_id: str
+    clock: datetime
+    key: str
+    sequence: int = 0
+
+    def event(self, event_type: EventType, properties: Properties) -> Event:
+        self.sequence += 1
+        return Event(
+            event_id=derive_uuid(self.clock, f"{self.key}:{self.sequence}"),
+            project_id=self.project_id,
+            user_id=self.user_id,
+            session_id=self.session_id,
+            event_type=event_type,
+            timestamp=self.clock,
+            properties=properties,
+            created_at=self.clock + timedelta(milliseconds=random.randint(20, 2_000)),
+        )
+
+    def wait(self, low: float, high: float) -> None:
+        self.clock += timedelta(seconds=random.uniform(low, high))
+
+
+def _page_view_properties() -> Properties:
+    return _to_properties(data_generator.generate_page_view_event()["properties"])
+
+
+PRODUCT_GENERATORS = {
+    "view": data_generator.generate_product_view_event,
+    "cart": data_generator.generate_add_to_cart_event,
+    "remove": data_generator.generate_remove_from_cart_event,
+    "purchase": data_generator.generate_purchase_event,
+}
+
+
+def _product_properties(kind: str, product: Product) -> Properties:
+    properties = PRODUCT_GENERATORS[kind]()["properties"]
+    properties["product_id"] = product.product_id
+    if kind != "remove":
+        properties.update(
+            product_name=product.product_name, category=product.category, price=product.price
+        )
+    return _to_properties(properties)
+
+
+def _to_properties(properties: dict[str, Any]) -> Properties:
+    """Same conversion as `PropertiesDTO.to_domain` (price in cents) without validation."""
+    price = properties.get("price")
+    return Properties(**{**properties, "price": round(price * 100) if price is not None else None})
+
+
+# Writers
+
+
+def _csv_value(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return "" if value is None else value
+
+
+def write_csv(
+    path: Path, columns: tuple[str, ...], rows: Iterator[tuple[Any, ...]], gz: bool
+) -> int:
+    count = 0
+    with path.open("wb") as out:
+        # No mtime or file name in the gzip header, so equal data gives equal checksums
+        raw: IO[bytes] = (
+            gzip.GzipFile(filename="", mode="wb", fileobj=out, compresslevel=1, mtime=0)
+            if gz
+            else out
+        )
+        with raw, io.TextIOWrapper(raw, encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(columns)
+            for row in rows:
+                writer.writerow([_csv_value(value) for value in row])
+                count += 1
+    return count
+
+
+def write_parquet(path: Path, columns: tuple[str, ...], rows: Iterator[tuple[Any, ...]]) -> int:
+    try:
+        import pyarrow as pa  # type: ignore[import-not-found]
+        import pyarrow.parquet as pq  # type: ignore[import-not-found]
+    except ImportError as e:
+        raise SystemExit("--format parquet requires pyarrow: pip install pyarrow") from e
+
+    count = 0
+    writer = None
+    try:
+        while batch := [row for _, row in zip(range(WRITE_BATCH), rows, strict=False)]:
+            table = pa.table(
+                {
+                    name: [str(v) if isinstance(v, UUID) else v for v in values]
+                    for name, values in zip(columns, zip(*batch, strict=True), strict=True)
+                }
+            )
+            writer = writer or pq.ParquetWriter(path, table.schema, compression="zstd")
+            writer.write_table(table)
+            count += len(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+def _event_rows(events: Iterator[Event]) -> Iterator[tuple[Any, ...]]:
+    batch: list[Event] = []
+    for event in events:
+        batch.append(event)
+        if len(batch) == WRITE_BATCH:
+            yield from event_records(batch)
+            batch.clear()
+    yield from event_records(batch)
+
+
+def write_shard(args: tuple[DatasetConfig, int, Path, str, bool]) -> dict[str, Any]:
+    config, shard, out, file_format, gz = args
+    events = _event_rows(FunnelGenerator(config, shard).events())
+    if file_format == "parquet":
+        path = out / f"events-{shard:04d}.parquet"
+        rows = write_parquet(path, EVENT_COLUMNS, events)
+    else:
+        path = out / f"events-{shard:04d}.csv{'.gz' if gz else ''}"
+        rows = write_csv(path, EVENT_COLUMNS, events, gz)
+    return {"file": path.name, "rows": rows, "sha256": _sha256(path)}
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a deterministic benchmark dataset")
+    parser.add_argument("--out", type=Path, required=True)
+    parser.add_argument("--seed", type=int, default=20_260_101)
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--events", type=int, default=10_000_000)
+    parser.add_argument("--shards", type=int, default=64, help="output files; fixes the data")
+    parser.add_argument("--processes", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--start", type=datetime.fromisoformat, default="2025-01-01T00:00:00+00:00")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--gzip", action="store_true", help="gzip CSV files")
+    args = parser.parse_args()
+
+    start = args.start if args.start.tzinfo else args.start.replace(tzinfo=UTC)
+    config = DatasetConfig(
+        seed=args.seed,
+        projects=args.projects,
+        users=args.users,
+        events=args.events,
+        shards=args.shards,
+        start=start,
+        days=args.days,
+    )
+    args.out.mkdir(parents=True, exist_ok=True)
+
+    started = time.perf_counter()
+    projects_path = args.out / "projects.csv"
+    write_csv(projects_path, PROJECT_COLUMNS, iter(project_rows(config)), gz=False)
+
+    tasks = [(config, shard, args.out, args.format, args.gzip) for shard in range(config.shards)]
+    files, written = [], 0
+    with multiprocessing.get_context("spawn").Pool(args.processes) as pool:
+        for result in pool.imap(write_shard, tasks):
+            files.append(result)
+            written += result["rows"]
+            elapsed = time.perf_counter() - started
+            print(
+                f"{result['file']}: {result['rows']:,} rows "
+                f"({written:,}/{config.events:,}, {written / elapsed:,.0f} events/s)"
+            )
+
+    manifest = {
+        "parameters": {
+            **{k: v for k, v in dataclasses.asdict(config).items() if k != "start"},
+            "start": config.start.isoformat(),
+            "format": args.format,
+            "gzip": args.gzip,
+        },
+        "projects": {"file": projects_path.name, "sha256": _sha256(projects_path)},
+        "events": files,
+    }
+    (args.out / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n")
+    print(f"{written:,} events in {time.perf_counter() - started:.1f}s -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
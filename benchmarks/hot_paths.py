@@ -0,0 +1,131 @@
+"""Per-event cost of each function on the ingestion and consumption hot paths.
+
+Every case runs over the same 500-event reference batch (see `reference.py`) and reports
+nanoseconds per event. Rounds are repeated so the spread is visible and comparisons can
+separate noise from real changes.
+
+    api:     IngestEventBatchDTO validation -> PropertiesDTO.to_domain -> Event.create
+             -> producer encoding (msgpack stream fields)
+    worker:  msgpack decode -> mapper.dict_to_event -> add_many column arrays
+             -> rollup bucket counts -> orjson jsonb encode/decode
+
+Usage:
+    PYTHONPATH=src python benchmarks/hot_paths.py [--rounds 20] [--json results/hot_paths.json]
+"""
+
+import argparse
+import gc
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import msgpack  # type: ignore[import-untyped]
+from reference import reference_payloads
+from results import Results, Scenario
+
+from application.event.schemas.ingest_dto import IngestEventBatchDTO, IngestEventDTO
+from domain.event.models import Event
+from domain.project.types import Plan
+from domain.rollup.models import count_events
+from domain.utils.generate_uuid import generate_uuid
+from infrastructure.database.postgres.init import decode_json, encode_json
+from infrastructure.database.postgres.repositories.event import event_columns
+from infrastructure.stream.mapper import dict_to_event
+from infrastructure.stream.redis_producer import event_to_fields
+
+
+def build_cases(payloads: list[dict[str, Any]]) -> dict[str, Callable[[], object]]:
+    """Name -> callable processing the whole batch once. Inputs are prepared up front."""
+    project_id = generate_uuid()
+    batch = {"events": payloads}
+    dtos: list[IngestEventDTO] = IngestEventBatchDTO.model_validate(batch).events
+    events = [
+        Event.create(
+            project_id=project_id,
+            user_id=dto.user_id,
+            session_id=dto.session_id,
+            event_type=dto.event_type,
+            timestamp=dto.timestamp,
+            properties=dto.properties.to_domain(),
+        )
+        for dto in dtos
+    ]
+    packed = [event_to_fields(event, Plan.PRO)["data"] for event in events]
+    decoded = [msgpack.unpackb(data, raw=False) for data in packed]
+    properties = [encode_json(data["properties"]) for data in decoded]
+
+    return {
+        "dto_batch_validation": lambda: IngestEventBatchDTO.model_validate(batch),
+        "properties_to_domain": lambda: [dto.properties.to_domain() for dto in dtos],
+        "event_create": lambda: [
+            Event.create(
+                project_id=project_id,
+                user_id=dto.user_id,
+                session_id=dto.session_id,
+                event_type=dto.event_type,
+                timestamp=dto.timestamp,
+                properties=dto.properties.to_domain(),
+            )
+            for dto in dtos
+        ],
+        "producer_encode": lambda: [event_to_fields(event, Plan.PRO) for event in events],
+        "consumer_msgpack_decode": lambda: [msgpack.unpackb(data, raw=False) for data in packed],
+        "mapper_dict_to_event": lambda: [dict_to_event(data) for data in decoded],
+        "add_many_columns": lambda: event_columns(events),
+        "rollup_count_events": lambda: count_events(events),
+        "orjson_encode": lambda: [encode_json(data["properties"]) for data in decoded],
+        "orjson_decode": lambda: [decode_json(value) for value in properties],
+    }
+
+
+def measure(case: Callable[[], object], events: int, rounds: int, min_time: float) -> list[float]:
+    """ns/event for each round; a round repeats the case until it ran for `min_time`."""
+    case()  # warm up caches and lazily built validators
+
+    samples = []
+    for _ in range(rounds):
+        gc.collect()
+        loops = 0
+        start = time.perf_counter_ns()
+        elapsed = 0
+        while elapsed < min_time * 1e9:
+            case()
+            loops += 1
+            elapsed = time.perf_counter_ns() - start
+        samples.append(elapsed / (loops * events))
+    return samples
+
+
+def main(rounds: int, min_time: float, output: Path | None) -> None:
+    payloads = reference_payloads()
+    results = Results(suite="hot_paths")
+
+    for name, case in build_cases(payloads).items():
+        scenario = Scenario()
+        samples = measure(case, len(payloads), rounds, min_time)
+        scenario.add_samples("ns_per_event", samples)
+        # Per-round samples too, so compare applies the same noise band to both metrics
+        scenario.add_samples("events_per_second", [1e9 / value for value in samples])
+        results.scenarios[name] = scenario
+
+    print(f"{'case':<26} {'ns/event':>10} {'min':>10} {'max':>10} {'events/s':>12}")
+    for name, scenario in results.scenarios.items():
+        values = scenario.samples["ns_per_event"]
+        print(
+            f"{name:<26} {scenario.metrics['ns_per_event']:>10.0f} {min(values):>10.0f} "
+            f"{max(values):>10.0f} {scenario.metrics['events_per_second']:>12,.0f}"
+        )
+
+    if output is not None:
+        results.write(output)
+        print(f"\nresults written to {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per round")
+    parser.add_argument("--json", type=Path, default=None, dest="output")
+    args = parser.parse_args()
+    main(args.rounds, args.min_time, args.output)
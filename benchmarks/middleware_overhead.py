@@ -0,0 +1,181 @@
+"""Per-request overhead of the API middleware stack.
+
+Drives the ASGI app in-process (no sockets, no server) with a trivial endpoint, so the
+difference between the two stacks is the cost of the middleware layers themselves.
+
+    before: ExceptionHandlerMiddleware + request logging middleware + Instrumentator middleware
+    after:  ObservabilityMiddleware
+
+The request logging middleware was removed from the API with the fusion; a minimal copy
+of it is kept here so the "before" stack can still be measured. The instrumentator is a
+dev dependency for the same reason.
+
+Usage:
+    PYTHONPATH=src python benchmarks/middleware_overhead.py [--requests 20000]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Callable
+
+import structlog
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from prometheus_client import CollectorRegistry
+from prometheus_fastapi_instrumentator import Instrumentator
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from entrypoint.api.middleware.exception_handler import ExceptionHandlerMiddleware
+from entrypoint.api.middleware.observability import ObservabilityMiddleware
+
+
+logger = structlog.get_logger("api")
+
+
+class StructlogMiddleware:
+    """The pre-fusion request logging middleware: bind request context, log on completion."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope.get("path") in ("/healthz", "/health", "/ready"):
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers", []))
+        client = scope.get("client")
+        structlog.contextvars.clear_contextvars()
+        structlog.contextvars.bind_contextvars(
+            request_id=headers.get(b"x-request-id", b"").decode("latin1") or str(uuid.uuid4()),
+            method=scope.get("method", "UNKNOWN"),
+            path=scope.get("path", ""),
+            client_ip=client[0] if client else "unknown",
+            user_agent=headers.get(b"user-agent", b"").decode("latin1") or "unknown",
+        )
+
+        status_code = [500]
+        start_time = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status_code[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+            logger.info(
+                "request_completed",
+                status_code=status_code[0],
+                duration=time.perf_counter() - start_time,
+            )
+        except Exception as exc:
+            logger.exception(
+                "request_failed",
+                status_code=500,
+                duration=time.perf_counter() - start_time,
+                error=str(exc),
+            )
+            raise
+
+
+def _base_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/api/v1/event")
+    async def endpoint() -> PlainTextResponse:
+        return PlainTextResponse("ok", status_code=202)
+
+    return app
+
+
+def build_before() -> ASGIApp:
+    app = _base_app()
+    app.add_middleware(ExceptionHandlerMiddleware)
+    app.add_middleware(StructlogMiddleware)
+    Instrumentator(registry=CollectorRegistry()).instrument(app)
+    return app
+
+
+def build_after() -> ASGIApp:
+    app = _base_app()
+    app.add_middleware(ObservabilityMiddleware)
+    return app
+
+
+def build_bare() -> ASGIApp:
+    return _base_app()
+
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "POST",
+    "scheme": "http",
+    "path": "/api/v1/event",
+    "raw_path": b"/api/v1/event",
+    "query_string": b"",
+    "root_path": "",
+    "headers": [
+        (b"host", b"localhost"),
+        (b"user-agent", b"bench"),
+        (b"x-api-key", b"wk_dev_0123456789"),
+        (b"content-type", b"application/json"),
+        (b"x-request-id", b"bench-request"),
+    ],
+    "client": ("127.0.0.1", 50000),
+    "server": ("127.0.0.1", 8000),
+}
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b"{}", "more_body": False}
+
+
+async def _send(message: Message) -> None:
+    return None
+
+
+async def run(app: ASGIApp, requests: int) -> float:
+    """Return mean microseconds per request."""
+    for _ in range(500):  # warm up: build middleware stack, route caches
+        await app(dict(SCOPE), _receive, _send)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(SCOPE), _receive, _send)
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+def _silence_logs() -> None:
+    structlog.configure(
+        processors=[structlog.processors.JSONRenderer()],
+        logger_factory=structlog.ReturnLoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+    logging.disable(logging.CRITICAL)
+
+
+async def main(requests: int) -> None:
+    _silence_logs()
+    stacks: dict[str, Callable[[], ASGIApp]] = {
+        "bare": build_bare,
+        "before": build_before,
+        "after": build_after,
+    }
+    results = {name: await run(build(), requests) for name, build in stacks.items()}
+
+    print(f"{'stack':<8} {'us/request':>11} {'overhead':>10}")
+    for name, mean in results.items():
+        print(f"{name:<8} {mean:>11.1f} {mean - results['bare']:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,33 @@
+"""Stable reference inputs for the benchmarks.
+
+Payloads come from the load-test generators (`tests/load/data_generator.py`) under a fixed
+seed, so every run and every machine measures the same event mix. Timestamps stay relative
+to "now" so they pass the API's age checks.
+"""
+
+import os
+import random
+import sys
+from typing import Any
+
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.extend([ROOT, os.path.join(ROOT, "src")])
+
+from tests.load.data_generator import generate_random_event
+
+
+REFERENCE_SEED = 20_260_101
+REFERENCE_BATCH_SIZE = 500  # IngestEventBatchDTO maximum
+
+
+def reference_payloads(
+    count: int = REFERENCE_BATCH_SIZE, seed: int = REFERENCE_SEED
+) -> list[dict[str, Any]]:
+    """`count` API event payloads; the same list for the same seed."""
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        return [generate_random_event() for _ in range(count)]
+    finally:
+        random.setstate(state)
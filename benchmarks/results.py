@@ -0,0 +1,106 @@
+"""Machine-readable benchmark results shared by every script in this directory.
+
+A results file is one JSON document per run:
+
+    {
+      "suite": "hot_paths",
+      "created_at": "2026-01-01T00:00:00+00:00",
+      "environment": {"python": "3.13.0", "platform": "...", "cpu_count": 8, "git_commit": "..."},
+      "scenarios": {
+        "<scenario>": {
+          "metrics": {"<metric>": 1.0},
+          "samples": {"<metric>": [1.0, 1.1]}
+        }
+      }
+    }
+
+`metrics` holds the headline value of each metric; `samples` (optional) holds the per-round
+values it was derived from, which comparisons use to tell noise from a regression.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(slots=True)
+class Scenario:
+    metrics: dict[str, float] = field(default_factory=dict)
+    samples: dict[str, list[float]] = field(default_factory=dict)
+
+    def add_samples(self, metric: str, values: list[float]) -> None:
+        """Record per-round values and use their median as the headline value."""
+        self.samples[metric] = values
+        self.metrics[metric] = statistics.median(values)
+
+    def to_json(self) -> dict[str, Any]:
+        return {"metrics": self.metrics, "samples": self.samples}
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "Scenario":
+        return cls(metrics=dict(data["metrics"]), samples=dict(data.get("samples", {})))
+
+
+@dataclass(slots=True)
+class Results:
+    suite: str
+    scenarios: dict[str, Scenario] = field(default_factory=dict)
+    environment: dict[str, Any] = field(default_factory=lambda: environment())
+    created_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "suite": self.suite,
+            "created_at": self.created_at,
+            "environment": self.environment,
+            "scenarios": {name: scenario.to_json() for name, scenario in self.scenarios.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "Results":
+        return cls(
+            suite=data["suite"],
+            scenarios={
+                name: Scenario.from_json(scenario) for name, scenario in data["scenarios"].items()
+            },
+            environment=data.get("environment", {}),
+            created_at=data.get("created_at", ""),
+        )
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_json(), indent=2) + "\n")
+
+    @classmethod
+    def read(cls, path: Path) -> "Results":
+        return cls.from_json(json.loads(path.read_text()))
+
+
+def environment() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "git_commit": _git_commit(),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
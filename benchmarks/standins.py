@@ -0,0 +1,345 @@
+"""Local stand-ins for Redis and Postgres used by the service-free benchmarks.
+
+Redis:    fakeredis (in-process, default) or a `redis-server`/`valkey-server` binary spawned
+          on a free port.
+Postgres: an in-memory unit of work (default) or a throwaway cluster created with the
+          `initdb`/`postgres` binaries (found on PATH or in $PG_BIN) with db/schema applied.
+
+The in-memory unit of work keeps the repository contract (ON CONFLICT DO NOTHING dedup,
+inserted-row counts, rollup upserts and recomputes, NotFoundError) and still builds the
+unnest column arrays, so the worker does the same Python work it does against Postgres
+minus the server round trips.
+"""
+
+import asyncio
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+
+from domain.event.models import Event
+from domain.event.types import EventType
+from domain.exceptions.app import NotFoundError
+from domain.project.models import Project
+from domain.rollup.models import RollupBucket, RollupCount, count_events
+from domain.rollup.types import Granularity
+from domain.types import ProjectID
+from infrastructure.database.postgres.repositories.event import event_columns
+
+
+SCHEMA_DIR = Path(__file__).parent.parent / "db" / "schema" / "postgres"
+
+
+# Postgres: in-memory
+
+
+@dataclass
+class InMemoryStore:
+    projects: dict[ProjectID, Project]
+    events: dict[UUID, Event]
+    rollups: dict[tuple[ProjectID, Granularity, datetime, str], int]
+    watermarks: dict[ProjectID, datetime]
+    dirty: dict[RollupBucket, None]  # insertion ordered, like ORDER BY marked_at
+
+    @classmethod
+    def empty(cls) -> "InMemoryStore":
+        return cls(projects={}, events={}, rollups={}, watermarks={}, dirty={})
+
+
+class InMemoryProjectRepository:
+    def __init__(self, store: InMemoryStore, staged: list[Any]) -> None:
+        self._store = store
+        self._staged = staged
+
+    async def add(self, project: Project) -> None:
+        self._staged.append(project)
+
+    async def get_by_api_key(self, api_key: str) -> Project:
+        for project in self._store.projects.values():
+            if project.api_key == api_key:
+                return project
+        raise NotFoundError(f"Project by api_key {api_key} not Found")
+
+    async def get_by_id(self, project_id: ProjectID) -> Project:
+        if project_id not in self._store.projects:
+            raise NotFoundError(f"Project by id {project_id} not found")
+        return self._store.projects[project_id]
+
+
+class InMemoryEventRepository:
+    def __init__(self, store: InMemoryStore, staged: list[Any], latency: float) -> None:
+        self._store = store
+        self._staged = staged
+        self._latency = latency
+
+    async def add(self, event: Event) -> None:
+        await self.add_many([event])
+
+    async def add_many(self, events: list[Event]) -> int:
+        return len(await self.add_new(events))
+
+    async def add_new(self, events: list[Event]) -> list[Event]:
+        event_columns(events)
+        if self._latency:
+            await asyncio.sleep(self._latency)
+
+        staged_ids = {item.event_id for item in self._staged if isinstance(item, Event)}
+        new_events = [
+            event
+            for event in {event.event_id: event for event in events}.values()
+            if event.event_id not in self._store.events and event.event_id not in staged_ids
+        ]
+        self._staged.extend(new_events)
+        return new_events
+
+    async def copy_many(self, events: list[Event]) -> int:
+        return await self.add_many(events)
+
+    async def get_by_project_id(
+        self, project_id: ProjectID, limit: int = 100, offset: int = 0
+    ) -> list[Event]:
+        events = [e for e in self._store.events.values() if e.project_id == project_id]
+        return events[offset : offset + limit]
+
+    async def get_by_id(self, event_id: UUID) -> Event:
+        if event_id not in self._store.events:
+            raise NotFoundError(f"Event by id {event_id} not found")
+        return self._store.events[event_id]
+
+
+class InMemoryRollupRepository:
+    def __init__(self, store: InMemoryStore, staged: list[Any], latency: float) -> None:
+        self._store = store
+        self._staged = staged
+        self._latency = latency
+
+    async def add(self, counts: list[RollupCount]) -> None:
+        if self._latency and counts:
+            await asyncio.sleep(self._latency)
+        self._staged.extend(counts)
+
+    async def get_series(
+        self,
+        project_id: ProjectID,
+        granularity: Granularity,
+        start: datetime,
+        end: datetime,
+        event_types: tuple[EventType, ...] = (),
+    ) -> list[RollupCount]:
+        return sorted(
+            (
+                RollupCount(key[0], key[1], key[2], EventType(key[3]), count)
+                for key, count in self._store.rollups.items()
+                if key[:2] == (project_id, granularity)
+                and start <= key[2] < end
+                and (not event_types or key[3] in event_types)
+            ),
+            key=lambda count: (count.bucket, count.event_type),
+        )
+
+    async def get_watermarks(self, project_ids: list[ProjectID]) -> dict[ProjectID, datetime]:
+        return {
+            project_id: self._store.watermarks[project_id]
+            for project_id in project_ids
+            if project_id in self._store.watermarks
+        }
+
+    async def advance_watermarks(self, watermarks: Mapping[ProjectID, datetime]) -> None:
+        self._staged.append(dict(watermarks))
+
+    async def mark_dirty(self, buckets: list[RollupBucket]) -> None:
+        self._staged.extend(buckets)
+
+    async def get_dirty(self, limit: int) -> list[RollupBucket]:
+        return list(self._store.dirty)[:limit]
+
+    async def recompute(self, bucket: RollupBucket) -> bool:
+        if bucket not in self._store.dirty:
+            return False
+        del self._store.dirty[bucket]
+
+        hour_end = bucket.bucket + Granularity.HOUR.step
+        events = [
+            event
+            for event in self._store.events.values()
+            if event.project_id == bucket.project_id and bucket.bucket <= event.timestamp < hour_end
+        ]
+        day = Granularity.DAY.truncate(bucket.bucket)
+        for key in list(self._store.rollups):
+            if key[0] == bucket.project_id and (
+                bucket.bucket <= key[2] < hour_end if key[1] != Granularity.DAY else key[2] == day
+            ):
+                del self._store.rollups[key]
+        for count in count_events(events):
+            if count.granularity != Granularity.DAY:
+                key = (count.project_id, count.granularity, count.bucket, count.event_type)
+                self._store.rollups[key] = count.count
+        for key, count in list(self._store.rollups.items()):
+            if (
+                key[:2] == (bucket.project_id, Granularity.HOUR)
+                and day <= key[2] < day + Granularity.DAY.step
+            ):
+                day_key = (key[0], Granularity.DAY, day, key[3])
+                self._store.rollups[day_key] = self._store.rollups.get(day_key, 0) + count
+        return True
+
+    async def get_complete_up_to(self, project_id: ProjectID) -> datetime | None:
+        watermark = self._store.watermarks.get(project_id)
+        if watermark is None:
+            return None
+        dirty = [bucket.bucket for bucket in self._store.dirty if bucket.project_id == project_id]
+        return min([watermark, *dirty])
+
+
+class InMemoryUnitOfWork:
+    """Writes are staged and applied on commit, like a transaction without isolation."""
+
+    def __init__(self, store: InMemoryStore, latency: float = 0.0) -> None:
+        self._store = store
+        self._latency = latency
+        self._staged: list[Any] = []
+        self.project = InMemoryProjectRepository(store, self._staged)
+        self.event = InMemoryEventRepository(store, self._staged, latency)
+        self.rollup = InMemoryRollupRepository(store, self._staged, latency)
+
+    async def __aenter__(self) -> "InMemoryUnitOfWork":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_tb: TracebackType,
+    ) -> None:
+        await self.rollback()
+
+    async def commit(self) -> None:
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        for item in self._staged:
+            if isinstance(item, Project):
+                self._store.projects[item.project_id] = item
+            elif isinstance(item, RollupCount):
+                key = (item.project_id, item.granularity, item.bucket, item.event_type)
+                self._store.rollups[key] = self._store.rollups.get(key, 0) + item.count
+            elif isinstance(item, RollupBucket):
+                self._store.dirty.setdefault(item)
+            elif isinstance(item, dict):
+                for project_id, watermark in item.items():
+                    current = self._store.watermarks.get(project_id, watermark)
+                    self._store.watermarks[project_id] = max(current, watermark)
+            else:
+                self._store.events[item.event_id] = item
+        self._staged.clear()
+
+    async def rollback(self) -> None:
+        self._staged.clear()
+
+
+# Spawned servers
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+def _wait_for_port(port: int, process: subprocess.Popen[bytes], timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{process.args[0]} exited with code {process.returncode}")
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.05)
+    raise TimeoutError(f"{process.args[0]} did not open port {port} in {timeout}s")
+
+
+@contextmanager
+def local_redis() -> Iterator[str]:
+    """Spawn a throwaway Redis (or Valkey) server without persistence and yield its URL."""
+    binary = shutil.which("redis-server") or shutil.which("valkey-server")
+    if binary is None:
+        raise RuntimeError("redis-server or valkey-server is not on PATH")
+
+    port = free_port()
+    process = subprocess.Popen(
+        [binary, "--port", str(port), "--save", "", "--appendonly", "no"],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        _wait_for_port(port, process)
+        yield f"redis://127.0.0.1:{port}/0"
+    finally:
+        process.terminate()
+        process.wait()
+
+
+@contextmanager
+def local_postgres() -> Iterator[dict[str, Any]]:
+    """Create and start a throwaway cluster with the schema applied; yield Settings kwargs."""
+    bin_dir = os.environ.get("PG_BIN") or os.path.dirname(shutil.which("initdb") or "")
+    initdb, postgres = Path(bin_dir, "initdb"), Path(bin_dir, "postgres")
+    if not initdb.exists() or not postgres.exists():
+        raise RuntimeError("initdb/postgres not found; put them on PATH or set PG_BIN")
+
+    port = free_port()
+    with tempfile.TemporaryDirectory(prefix="bench-pg-") as tmp:
+        data_dir = Path(tmp, "data")
+        subprocess.run(
+            [initdb, "-D", data_dir, "-U", "bench", "-A", "trust", "--no-sync"],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        process = subprocess.Popen(
+            [postgres, "-D", data_dir, "-p", str(port), "-k", tmp, "-h", "127.0.0.1"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            _wait_for_port(port, process)
+            settings_kwargs = {
+                "db_host": "127.0.0.1",
+                "db_port": port,
+                "db_user": "bench",
+                "db_password": "",
+                "db_name": "postgres",
+            }
+            asyncio.run(_apply_schema(port))
+            yield settings_kwargs
+        finally:
+            process.terminate()
+            process.wait()
+
+
+async def _apply_schema(port: int) -> None:
+    for attempt in range(50):
+        try:
+            connection = await asyncpg.connect(
+                host="127.0.0.1", port=port, user="bench", database="postgres"
+            )
+            break
+        except (OSError, asyncpg.CannotConnectNowError):
+            if attempt == 49:
+                raise
+            await asyncio.sleep(0.1)
+    try:
+        for path in sorted(SCHEMA_DIR.glob("*.sql")):
+            await connection.execute(path.read_text())
+    finally:
+        await connection.close()
@@ -0,0 +1,395 @@
+"""Sustained end-to-end ingestion throughput without docker-compose.
+
+Runs the real API app (in-process over ASGI), `RedisEventProducer`, `RedisEventConsumer`,
+`BatchProcessor` and the unit of work against local stand-ins (see `standins.py`):
+
+    clients --HTTP/ASGI--> API app --XADD--> stream --XREADGROUP--> N workers --> storage
+
+Clients post reference batches as fast as the API accepts them; workers run concurrently in
+the same event loop. Reported per scenario (batch size x worker count):
+
+    events_per_second        events committed / (last commit - first request)
+    api_p50/p95/p99_ms       POST /api/v1/event/batch latency
+    e2e_p50/p95/p99_ms       event created_at -> worker commit
+    cpu_seconds_per_1k       process CPU time per 1000 events
+    peak_rss_mb              peak resident set size of the process
+
+Usage:
+    PYTHONPATH=src python benchmarks/throughput.py --events 20000 --batch-sizes 100,500 \
+        --workers 1,4 [--spawn-redis] [--spawn-postgres] [--json results/throughput.json]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import resource
+import statistics
+import sys
+import time
+from collections.abc import AsyncIterable, Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import asyncpg
+import structlog
+from dishka import Provider, Scope, provide
+from fakeredis import FakeServer, aioredis
+from httpx import ASGITransport, AsyncClient
+from redis.asyncio import Redis, from_url
+from reference import reference_payloads
+from results import Results, Scenario
+from standins import InMemoryStore, InMemoryUnitOfWork, local_postgres, local_redis
+from structlog import BoundLogger
+
+from application.common.uow import IUnitOfWork
+from application.worker.batch_processor import BatchProcessor
+from domain.cache.repository import Cache, ProjectCache
+from domain.event.models import Event
+from domain.event.producer import EventProducer
+from entrypoint.api.main import create_app
+from infrastructure.cache.project import TwoTierProjectCache
+from infrastructure.cache.redis import RedisCache
+from infrastructure.config.settings import Settings
+from infrastructure.database.postgres.connection import LazyConnection
+from infrastructure.database.postgres.init import init_postgres_connection
+from infrastructure.database.postgres.uow import PostgresUnitOfWork
+from infrastructure.di.providers.types import CacheRedis, StreamRedis
+from infrastructure.stream.redis_consumer import RedisEventConsumer
+from infrastructure.stream.redis_producer import RedisEventProducer
+
+
+SECRET_TOKEN = "bench-secret-token"
+GROUP_NAME = "main_group"
+STALL_TIMEOUT = 30.0  # seconds without a new commit before a scenario is failed
+
+
+@dataclass
+class Backends:
+    """Where Redis and Postgres live for one scenario."""
+
+    redis_url: str | None = None  # None: fakeredis
+    postgres: dict[str, Any] | None = None  # Settings kwargs; None: in-memory store
+    db_latency: float = 0.0  # simulated per-statement latency for the in-memory store
+    fake_server: FakeServer = field(default_factory=FakeServer)
+    store: InMemoryStore = field(default_factory=InMemoryStore.empty)
+    pool: asyncpg.Pool | None = None
+
+    def redis(self, decode_responses: bool) -> Redis:
+        if self.redis_url is None:
+            return aioredis.FakeRedis(server=self.fake_server, decode_responses=decode_responses)
+        return from_url(self.redis_url, decode_responses=decode_responses)
+
+    def unit_of_work(self) -> IUnitOfWork:
+        if self.pool is None:
+            return InMemoryUnitOfWork(self.store, self.db_latency)
+        return PostgresUnitOfWork(LazyConnection(self.pool))
+
+
+class CommitLatencyRecorder:
+    """Unit of work wrapper recording created_at -> commit latency for every written event."""
+
+    def __init__(self, inner: IUnitOfWork, latencies: list[float]) -> None:
+        self._inner = inner
+        self._latencies = latencies
+        self._pending: list[Event] = []
+        self.project = inner.project
+        self.event = self
+        self.rollup = inner.rollup
+
+    async def add_new(self, events: list[Event]) -> list[Event]:
+        self._pending = events
+        return await self._inner.event.add_new(events)
+
+    async def __aenter__(self) -> "CommitLatencyRecorder":
+        await self._inner.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._inner.__aexit__(*exc_info)
+
+    async def commit(self) -> None:
+        await self._inner.commit()
+        committed_at = time.time()
+        self._latencies.extend(committed_at - e.created_at.timestamp() for e in self._pending)
+        self._pending = []
+
+    async def rollback(self) -> None:
+        self._pending = []
+        await self._inner.rollback()
+
+
+class FakeBlockingConsumer(RedisEventConsumer):
+    """fakeredis answers XREADGROUP BLOCK immediately and never yields to the event loop.
+
+    Yield on every read and back off briefly on empty ones, as a real round trip and
+    blocking read would, so in-process workers do not starve the API clients.
+    """
+
+    async def _fetch_messages(self, count: int, block_ms: int) -> list[Any]:
+        messages = await super()._fetch_messages(count=count, block_ms=block_ms)
+        await asyncio.sleep(0 if messages else 0.001)
+        return messages
+
+
+def _providers(backends: Backends, settings: Settings) -> dict[str, Provider]:
+    """Replacements for the app's settings, cache, stream and db providers."""
+
+    class BenchSettingsProvider(Provider):
+        @provide(scope=Scope.APP)
+        def get_settings(self) -> Settings:
+            return settings
+
+    class BenchCacheProvider(Provider):
+        scope = Scope.APP
+
+        @provide
+        async def get_client(self) -> AsyncIterable[CacheRedis]:
+            client = backends.redis(decode_responses=True)
+            yield CacheRedis(client)
+            await client.aclose()
+
+        @provide
+        def get_cache(self, client: CacheRedis) -> Cache:
+            return RedisCache(client)
+
+        @provide
+        def get_project_cache(
+            self, client: CacheRedis, settings: Settings, logger: BoundLogger
+        ) -> ProjectCache:
+            return TwoTierProjectCache(client, settings, logger)
+
+    class BenchStreamProvider(Provider):
+        scope = Scope.APP
+
+        @provide
+        async def get_client(self) -> AsyncIterable[StreamRedis]:
+            client = backends.redis(decode_responses=False)
+            yield StreamRedis(client)
+            await client.aclose()
+
+        @provide
+        def get_producer(self, client: StreamRedis) -> EventProducer:
+            return RedisEventProducer(client)
+
+    class BenchDbProvider(Provider):
+        @provide(scope=Scope.REQUEST)
+        def get_uow(self) -> IUnitOfWork:
+            return backends.unit_of_work()
+
+    return {
+        "SettingsProvider": BenchSettingsProvider(),
+        "CacheProvider": BenchCacheProvider(),
+        "StreamProvider": BenchStreamProvider(),
+        "DbProvider": BenchDbProvider(),
+    }
+
+
+@contextmanager
+def _bench_app(backends: Backends, settings: Settings) -> Iterator[Any]:
+    with ExitStack() as stack:
+        for name, provider in _providers(backends, settings).items():
+            stack.enter_context(patch(f"entrypoint.api.main.{name}", return_value=provider))
+        yield create_app()
+
+
+def _silence_logs() -> None:
+    structlog.configure(
+        processors=[structlog.processors.JSONRenderer()],
+        logger_factory=structlog.ReturnLoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+    logging.disable(logging.CRITICAL)
+
+
+def _percentile(values: list[float], q: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1] if len(values) > 1 else 0
+
+
+async def _client(
+    client: AsyncClient, bodies: asyncio.Queue[bytes], headers: dict[str, str], out: list[float]
+) -> None:
+    while not bodies.empty():
+        body = bodies.get_nowait()
+        start = time.perf_counter()
+        response = await client.post("/api/v1/event/batch", content=body, headers=headers)
+        out.append(time.perf_counter() - start)
+        response.raise_for_status()
+
+
+async def _worker(processor: BatchProcessor, done: asyncio.Event) -> None:
+    await processor.ensure_startup()
+    while not done.is_set():
+        await processor.process()
+
+
+async def _wait_for_commits(
+    latencies: list[float], events: int, worker_tasks: list[asyncio.Task[None]]
+) -> None:
+    """Wait until every event is committed, failing if a worker dies or commits stall."""
+    committed, deadline = 0, time.perf_counter() + STALL_TIMEOUT
+    while len(latencies) < events:
+        for task in worker_tasks:
+            if task.done():
+                task.result()  # re-raises the worker's exception
+                raise RuntimeError("worker exited before all events were committed")
+        if len(latencies) > committed:
+            committed, deadline = len(latencies), time.perf_counter() + STALL_TIMEOUT
+        elif time.perf_counter() > deadline:
+            raise TimeoutError(
+                f"{committed} of {events} events committed, none in the last {STALL_TIMEOUT:g}s"
+            )
+        await asyncio.sleep(0.005)
+
+
+async def run_scenario(
+    backends: Backends, events: int, batch_size: int, workers: int, clients: int
+) -> Scenario:
+    settings = Settings(
+        secret_token=SECRET_TOKEN,
+        batch_size=batch_size,
+        read_timeout_ms=50,
+        **(backends.postgres or {}),
+    )
+    if backends.postgres is not None:
+        backends.pool = await asyncpg.create_pool(
+            dsn=settings.db_dsn, min_size=2, max_size=workers + 4, init=init_postgres_connection
+        )
+
+    payloads = reference_payloads()
+    bodies: asyncio.Queue[bytes] = asyncio.Queue()
+    for offset in range(0, events, batch_size):
+        count = min(batch_size, events - offset)
+        batch = [payloads[(offset + i) % len(payloads)] for i in range(count)]
+        bodies.put_nowait(json.dumps({"events": batch}).encode())
+
+    with _bench_app(backends, settings) as app:
+        async with (
+            app.router.lifespan_context(app),
+            AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client,
+        ):
+            _silence_logs()
+            logger = structlog.get_logger()
+            response = await client.post(
+                "/api/v1/project",
+                json={"name": "bench", "plan": "enterprise"},
+                headers={"Authorization": f"Bearer {SECRET_TOKEN}"},
+            )
+            response.raise_for_status()
+            headers = {"X-Api-Key": response.json()["api_key"], "Content-Type": "application/json"}
+
+            stream = backends.redis(decode_responses=False)
+            api_latencies: list[float] = []
+            e2e_latencies: list[float] = []
+            done = asyncio.Event()
+            consumer_class = RedisEventConsumer if backends.redis_url else FakeBlockingConsumer
+            processors = [
+                BatchProcessor(
+                    consumer_class(stream, logger, GROUP_NAME, f"bench-worker-{i}"),
+                    CommitLatencyRecorder(backends.unit_of_work(), e2e_latencies),
+                    logger,
+                    settings,
+                )
+                for i in range(workers)
+            ]
+            worker_tasks = [asyncio.create_task(_worker(p, done)) for p in processors]
+
+            try:
+                cpu_start = time.process_time()
+                start = time.perf_counter()
+                await asyncio.gather(
+                    *(_client(client, bodies, headers, api_latencies) for _ in range(clients))
+                )
+                await _wait_for_commits(e2e_latencies, events, worker_tasks)
+                elapsed = time.perf_counter() - start
+                cpu = time.process_time() - cpu_start
+            finally:
+                done.set()
+                # a failed scenario already carries the worker's error
+                await asyncio.gather(*worker_tasks, return_exceptions=True)
+                await stream.aclose()
+
+    if backends.pool is not None:
+        await backends.pool.close()
+
+    scenario = Scenario()
+    scenario.metrics.update(
+        {
+            "events_per_second": events / elapsed,
+            "api_p50_ms": _percentile(api_latencies, 50) * 1000,
+            "api_p95_ms": _percentile(api_latencies, 95) * 1000,
+            "api_p99_ms": _percentile(api_latencies, 99) * 1000,
+            "e2e_p50_ms": _percentile(e2e_latencies, 50) * 1000,
+            "e2e_p95_ms": _percentile(e2e_latencies, 95) * 1000,
+            "e2e_p99_ms": _percentile(e2e_latencies, 99) * 1000,
+            "cpu_seconds_per_1k": cpu / events * 1000,
+            # ru_maxrss is KiB on Linux
+            "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        }
+    )
+    return scenario
+
+
+def main(args: argparse.Namespace) -> None:
+    results = Results(suite="throughput")
+    results.environment["redis"] = "spawned" if args.spawn_redis else "fakeredis"
+    results.environment["postgres"] = "spawned" if args.spawn_postgres else "in-memory"
+
+    with ExitStack() as stack:
+        redis_url = stack.enter_context(local_redis()) if args.spawn_redis else None
+        postgres = stack.enter_context(local_postgres()) if args.spawn_postgres else None
+
+        for batch_size in args.batch_sizes:
+            for workers in args.workers:
+                backends = Backends(
+                    redis_url=redis_url, postgres=postgres, db_latency=args.db_latency_ms / 1000
+                )
+                if redis_url is not None:
+                    asyncio.run(_flush(backends))
+                name = f"batch{batch_size}_workers{workers}"
+                print(f"running {name} ...", file=sys.stderr)
+                results.scenarios[name] = asyncio.run(
+                    run_scenario(backends, args.events, batch_size, workers, args.clients)
+                )
+
+    print(
+        f"{'scenario':<24} {'events/s':>10} {'api p99':>9} {'e2e p50':>9} {'e2e p99':>9} "
+        f"{'cpu s/1k':>9} {'rss MB':>8}"
+    )
+    for name, scenario in results.scenarios.items():
+        m = scenario.metrics
+        print(
+            f"{name:<24} {m['events_per_second']:>10,.0f} {m['api_p99_ms']:>9.1f} "
+            f"{m['e2e_p50_ms']:>9.1f} {m['e2e_p99_ms']:>9.1f} {m['cpu_seconds_per_1k']:>9.3f} "
+            f"{m['peak_rss_mb']:>8.0f}"
+        )
+
+    if args.output is not None:
+        results.write(args.output)
+        print(f"\nresults written to {args.output}")
+
+
+async def _flush(backends: Backends) -> None:
+    client = backends.redis(decode_responses=False)
+    await client.flushdb()
+    await client.aclose()
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",")]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20_000, help="events per scenario")
+    parser.add_argument("--batch-sizes", type=_int_list, default=[100, 500])
+    parser.add_argument("--workers", type=_int_list, default=[1, 4])
+    parser.add_argument("--clients", type=int, default=8, help="concurrent API clients")
+    parser.add_argument("--db-latency-ms", type=float, default=0.0, help="in-memory store only")
+    parser.add_argument("--spawn-redis", action="store_true", help="use redis-server from PATH")
+    parser.add_argument("--spawn-postgres", action="store_true", help="use initdb/postgres")
+    parser.add_argument("--json", type=Path, default=None, dest="output")
+    main(parser.parse_args())
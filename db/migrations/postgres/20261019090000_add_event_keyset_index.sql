@@ -0,0 +1,6 @@
+-- atlas:txmode none
+
+-- Create index "event_project_timestamp_idx" to table: "event"
+CREATE INDEX CONCURRENTLY "event_project_timestamp_idx" ON "event" ("project_id", "timestamp", "event_id");
+-- Drop index "project_idx" from table: "event"
+DROP INDEX CONCURRENTLY "project_idx";
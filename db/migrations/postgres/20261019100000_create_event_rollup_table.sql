@@ -0,0 +1,10 @@
+-- Create "event_rollup" table
+CREATE TABLE "event_rollup" (
+  "project_id" uuid NOT NULL,
+  "granularity" text NOT NULL,
+  "bucket" timestamptz NOT NULL,
+  "event_type" text NOT NULL,
+  "count" bigint NOT NULL,
+  PRIMARY KEY ("project_id", "granularity", "bucket", "event_type"),
+  CONSTRAINT "event_rollup_project_id_fkey" FOREIGN KEY ("project_id") REFERENCES "project" ("project_id") ON UPDATE NO ACTION ON DELETE CASCADE
+);
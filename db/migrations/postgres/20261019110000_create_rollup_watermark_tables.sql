@@ -0,0 +1,18 @@
+-- Create "rollup_watermark" table
+CREATE TABLE "rollup_watermark" (
+  "project_id" uuid NOT NULL,
+  "watermark" timestamptz NOT NULL,
+  "updated_at" timestamptz NOT NULL DEFAULT now(),
+  PRIMARY KEY ("project_id"),
+  CONSTRAINT "rollup_watermark_project_id_fkey" FOREIGN KEY ("project_id") REFERENCES "project" ("project_id") ON UPDATE NO ACTION ON DELETE CASCADE
+);
+-- Create "rollup_dirty" table
+CREATE TABLE "rollup_dirty" (
+  "project_id" uuid NOT NULL,
+  "bucket" timestamptz NOT NULL,
+  "marked_at" timestamptz NOT NULL DEFAULT now(),
+  PRIMARY KEY ("project_id", "bucket"),
+  CONSTRAINT "rollup_dirty_project_id_fkey" FOREIGN KEY ("project_id") REFERENCES "project" ("project_id") ON UPDATE NO ACTION ON DELETE CASCADE
+);
+-- Create index "rollup_dirty_marked_at_idx" to table: "rollup_dirty"
+CREATE INDEX "rollup_dirty_marked_at_idx" ON "rollup_dirty" ("marked_at");
@@ -9,6 +9,6 @@ CREATE TABLE IF NOT EXISTS event(
     created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
     FOREIGN KEY (project_id) REFERENCES "public"."project"(project_id) ON DELETE CASCADE
 );
-CREATE INDEX IF NOT EXISTS project_idx ON event (project_id);
+CREATE INDEX IF NOT EXISTS event_project_timestamp_idx ON event (project_id, timestamp, event_id);
 CREATE INDEX IF NOT EXISTS event_type_idx ON event (event_type);
 CREATE INDEX IF NOT EXISTS timestamp_idx ON event (timestamp);
@@ -0,0 +1,9 @@
+CREATE TABLE IF NOT EXISTS event_rollup(
+    project_id UUID NOT NULL,
+    granularity TEXT NOT NULL,
+    bucket TIMESTAMPTZ NOT NULL,
+    event_type TEXT NOT NULL,
+    count BIGINT NOT NULL,
+    PRIMARY KEY (project_id, granularity, bucket, event_type),
+    FOREIGN KEY (project_id) REFERENCES "public"."project"(project_id) ON DELETE CASCADE
+);
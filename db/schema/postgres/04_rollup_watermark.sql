@@ -0,0 +1,15 @@
+CREATE TABLE IF NOT EXISTS rollup_watermark(
+    project_id UUID PRIMARY KEY,
+    watermark TIMESTAMPTZ NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    FOREIGN KEY (project_id) REFERENCES "public"."project"(project_id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS rollup_dirty(
+    project_id UUID NOT NULL,
+    bucket TIMESTAMPTZ NOT NULL,
+    marked_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (project_id, bucket),
+    FOREIGN KEY (project_id) REFERENCES "public"."project"(project_id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS rollup_dirty_marked_at_idx ON rollup_dirty (marked_at);
@@ -1,8 +1,10 @@
 import asyncio
+import multiprocessing
 import os
 import random
 import signal
 import sys
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
@@ -25,6 +27,16 @@ SECRET_TOKEN = os.getenv("SECRET_TOKEN", "test-secret-token")
 SPEED_MULTIPLIER = float(os.getenv("SEEDER_SPEED", "1.0"))
 NUM_USERS = int(os.getenv("SEEDER_USERS", "5"))
 
+# SEEDER_MODE=throughput: fixed-rate load from several processes instead of simulated users
+SEEDER_MODE = os.getenv("SEEDER_MODE", "simulate")
+NUM_PROCESSES = int(os.getenv("SEEDER_PROCESSES", str(os.cpu_count() or 1)))
+CONNECTIONS_PER_PROCESS = int(os.getenv("SEEDER_CONNECTIONS", "64"))
+TARGET_RATE = float(os.getenv("SEEDER_TARGET_RATE", "1000"))  # events/s across all processes
+# Stages "seconds:rate,...": linear ramp from the previous rate; the last rate is held
+RAMP_PROFILE = os.getenv("SEEDER_RAMP", "")
+BATCH_SIZE = int(os.getenv("SEEDER_BATCH_SIZE", "50"))
+REPORT_INTERVAL = float(os.getenv("SEEDER_REPORT_INTERVAL", "5"))
+
 fake = Faker()
 
 PRODUCT_CATALOG = [
@@ -422,6 +434,198 @@ class EventSeeder:
             await self.client.aclose()
 
 
+# Throughput mode
+
+COUNTER_FIELDS = ("events_sent", "batches_sent", "errors", "rate_limited")
+PACING_TICK = 0.005
+PAYLOAD_POOL_SIZE = 200
+
+
+def parse_ramp(spec: str, target_rate: float) -> list[tuple[float, float]]:
+    """Parse "30:1000,60:5000" into (seconds, rate) stages; default is a 30s ramp to target."""
+    if not spec.strip():
+        return [(30.0, target_rate)]
+    stages = []
+    for stage in spec.split(","):
+        seconds, rate = stage.strip().split(":")
+        stages.append((float(seconds.rstrip("s")), float(rate)))
+    return stages
+
+
+def rate_at(stages: list[tuple[float, float]], elapsed: float) -> float:
+    """Target rate `elapsed` seconds into the run."""
+    previous_rate = 0.0
+    for seconds, rate in stages:
+        if elapsed < seconds:
+            return previous_rate + (rate - previous_rate) * elapsed / seconds
+        elapsed -= seconds
+        previous_rate = rate
+    return previous_rate
+
+
+class RateWorker:
+    """One process: sends its share of the target rate over pooled keep-alive connections."""
+
+    def __init__(
+        self, index: int, api_keys: list[str], stages: list[tuple[float, float]], counters
+    ):
+        self.index = index
+        self.api_keys = api_keys
+        self.stages = stages
+        self.counters = counters
+        self.share = 1 / NUM_PROCESSES
+        self.seeder = EventSeeder()
+        self.payloads: list[list[dict[str, Any]]] = []
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        self.counters[self.index * len(COUNTER_FIELDS) + COUNTER_FIELDS.index(name)] += amount
+
+    def _make_payloads(self) -> None:
+        """Pre-build batches so event generation does not compete with sending."""
+        project = Project(name="", plan=Plan.FREE, api_key="")
+        for _ in range(PAYLOAD_POOL_SIZE):
+            session = UserSession(
+                user_id=f"user_{fake.uuid4()[:12]}",
+                session_id=f"session_{fake.uuid4()[:16]}",
+                project=project,
+            )
+            events = []
+            for _ in range(BATCH_SIZE):
+                if random.random() < 0.6:
+                    events.append(self.seeder._make_page_view_event(session))
+                elif random.random() < 0.75:
+                    events.append(self.seeder._make_product_view_event(session))
+                else:
+                    product = random.choice(PRODUCT_CATALOG)
+                    events.append(self.seeder._make_add_to_cart_event(session, product))
+            self.payloads.append(events)
+
+    async def run(self, stop) -> None:
+        self._make_payloads()
+        limits = httpx.Limits(
+            max_connections=CONNECTIONS_PER_PROCESS,
+            max_keepalive_connections=CONNECTIONS_PER_PROCESS,
+        )
+        slots = asyncio.Semaphore(CONNECTIONS_PER_PROCESS)
+        tasks: set[asyncio.Task] = set()
+
+        async with httpx.AsyncClient(base_url=API_HOST, timeout=30.0, limits=limits) as client:
+            start = last = time.monotonic()
+            due = 0.0  # events this process should have sent by now
+            sent = 0
+            while not stop.is_set():
+                now = time.monotonic()
+                due += rate_at(self.stages, now - start) * self.share * (now - last)
+                last = now
+                # Open model: never wait for responses; only the connection pool limits in-flight
+                while sent + BATCH_SIZE <= due and not slots.locked():
+                    await slots.acquire()
+                    task = asyncio.create_task(self._send(client, slots, sent))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                    sent += BATCH_SIZE
+                await asyncio.sleep(PACING_TICK)
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _send(
+        self, client: httpx.AsyncClient, slots: asyncio.Semaphore, sequence: int
+    ) -> None:
+        # `sequence` advances by BATCH_SIZE; rotate payloads and projects per batch
+        batch = sequence // BATCH_SIZE
+        events = self.payloads[batch % len(self.payloads)]
+        try:
+            resp = await client.post(
+                "/api/v1/event/batch",
+                json={"events": events},
+                headers={"X-Api-Key": self.api_keys[batch % len(self.api_keys)]},
+            )
+            if resp.status_code == 202:
+                self._count("batches_sent")
+                self._count("events_sent", len(events))
+            elif resp.status_code == 429:
+                self._count("rate_limited")
+            else:
+                self._count("errors")
+        except httpx.HTTPError:
+            self._count("errors")
+        finally:
+            slots.release()
+
+
+def run_rate_worker(index: int, api_keys: list[str], stages, counters, stop) -> None:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the parent sets `stop`
+    asyncio.run(RateWorker(index, api_keys, stages, counters).run(stop))
+
+
+def run_throughput(api_keys: list[str]) -> None:
+    """Start the worker processes and report achieved vs target rate until stopped."""
+    stages = parse_ramp(RAMP_PROFILE, TARGET_RATE)
+    context = multiprocessing.get_context("spawn")
+    counters = context.Array("q", NUM_PROCESSES * len(COUNTER_FIELDS), lock=False)
+    stop = context.Event()
+    # SIGTERM stops like Ctrl+C; setting `stop` from a handler could deadlock on its lock
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    processes = [
+        context.Process(target=run_rate_worker, args=(i, api_keys, stages, counters, stop))
+        for i in range(NUM_PROCESSES)
+    ]
+    for process in processes:
+        process.start()
+    logger.info(
+        "throughput_seeder_started",
+        processes=NUM_PROCESSES,
+        connections_per_process=CONNECTIONS_PER_PROCESS,
+        batch_size=BATCH_SIZE,
+        stages=stages,
+    )
+
+    start = last_time = time.monotonic()
+    last_totals = dict.fromkeys(COUNTER_FIELDS, 0)
+    try:
+        while True:
+            time.sleep(REPORT_INTERVAL)
+            now = time.monotonic()
+            totals = {
+                name: sum(counters[i * len(COUNTER_FIELDS) + n] for i in range(NUM_PROCESSES))
+                for n, name in enumerate(COUNTER_FIELDS)
+            }
+            interval = now - last_time
+            rate = {name: (totals[name] - last_totals[name]) / interval for name in COUNTER_FIELDS}
+            logger.info(
+                "seeder_rate",
+                elapsed=round(now - start, 1),
+                target_eps=round(rate_at(stages, now - start)),
+                achieved_eps=round(rate["events_sent"]),
+                rate_limited_per_s=round(rate["rate_limited"], 1),
+                errors_per_s=round(rate["errors"], 1),
+                events_sent=totals["events_sent"],
+            )
+            last_time, last_totals = now, totals
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        for process in processes:
+            process.join()
+    logger.info("seeder_stopped", **last_totals)
+
+
+def main_throughput() -> int:
+    seeder = EventSeeder()
+
+    async def create_projects() -> bool:
+        try:
+            return await seeder.setup()
+        finally:
+            await seeder.shutdown()
+
+    if not asyncio.run(create_projects()):
+        return 1
+    run_throughput([project.api_key for project in seeder.projects])
+    return 0
+
+
 async def main():
     seeder = EventSeeder()
 
@@ -439,7 +643,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        exit_code = asyncio.run(main())
+        exit_code = main_throughput() if SEEDER_MODE == "throughput" else asyncio.run(main())
         sys.exit(exit_code)
     except KeyboardInterrupt:
         logger.info("seeder_stopped_by_user")
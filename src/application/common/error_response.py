@@ -16,6 +16,7 @@ RESPONSE = {
     401: {"model": ErrorResponse, "description": "Unauthorized"},
     403: {"model": ErrorResponse, "description": "Forbidden"},
     404: {"model": ErrorResponse, "description": "Not found"},
+    409: {"model": ErrorResponse, "description": "Conflict"},
     422: {
         "model": ErrorResponse,
         "description": "Validation error",
@@ -3,11 +3,13 @@ from typing import Protocol
 
 from domain.event.repository import IEventRepository
 from domain.project.repository import IProjectRepository
+from domain.rollup.repository import IRollupRepository
 
 
 class IUnitOfWork(Protocol):
     project: IProjectRepository
     event: IEventRepository
+    rollup: IRollupRepository
 
     async def commit(self) -> None: ...
     async def rollback(self) -> None: ...
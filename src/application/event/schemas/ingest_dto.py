@@ -1,5 +1,6 @@
 from datetime import UTC, datetime, timedelta
 from typing import Any
+from uuid import UUID
 
 from pydantic import BaseModel, Field, HttpUrl, ValidationError, field_validator, model_validator
 
@@ -91,6 +92,23 @@ class IngestEventDTO(BaseModel):
         return self
 
 
+class ImportEventDTO(IngestEventDTO):
+    """Historical event for the offline importer: same rules, without the 30-day window."""
+
+    event_id: UUID | None = None
+
+    @field_validator("timestamp")
+    @classmethod
+    def validate_timestamp(cls, v: datetime) -> datetime:
+        if v.tzinfo is None:
+            v = v.replace(tzinfo=UTC)
+
+        if v > datetime.now(UTC) + timedelta(minutes=5):
+            raise ValueError("timestamp cannot be in the future")
+
+        return v
+
+
 class IngestEventBatchDTO(BaseModel):
     events: list[IngestEventDTO] = Field(..., min_length=1, max_length=500)
 
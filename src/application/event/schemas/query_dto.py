@@ -0,0 +1,97 @@
+import base64
+import binascii
+from datetime import UTC, datetime
+from uuid import UUID
+
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, model_validator
+
+from application.event.schemas.ingest_dto import PropertiesDTO
+from domain.event.query import EventCursor, EventFilter
+from domain.event.types import EventType
+from domain.types import ProjectID
+
+
+MAX_PAGE_SIZE = 10_000
+
+
+def encode_cursor(cursor: EventCursor) -> str:
+    """Opaque page token: URL-safe base64 of `[timestamp, event_id]`."""
+    raw = orjson.dumps([cursor.timestamp.isoformat(), str(cursor.event_id)])
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> EventCursor:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        timestamp, event_id = orjson.loads(raw)
+        return EventCursor(datetime.fromisoformat(timestamp), UUID(event_id))
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError) as e:
+        raise ValueError("invalid cursor") from e
+
+
+def parse_property_filter(value: str) -> tuple[str, str | int]:
+    """`name:value` into the stored form, validated and converted like ingested properties."""
+    name, separator, raw = value.partition(":")
+    if not separator or name not in PropertiesDTO.model_fields:
+        raise ValueError(f"property filter must be <name>:<value>, got {value!r}")
+    try:
+        properties = PropertiesDTO.model_validate({name: raw}).to_domain()
+    except ValidationError as e:
+        raise ValueError(f"property {name}: {e.errors()[0]['msg']}") from e
+    stored: str | int = getattr(properties, name)
+    return name, stored
+
+
+class EventQueryDTO(BaseModel):
+    """Query string of `GET /events`: `event_type` values are OR-ed, other filters AND-ed."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    start: datetime | None = None
+    end: datetime | None = None
+    event_type: list[EventType] = Field(default_factory=list)
+    user_id: str | None = None
+    session_id: str | None = None
+    properties: list[str] = Field(default_factory=list, alias="property")
+    limit: int | None = Field(None, ge=1, le=MAX_PAGE_SIZE)
+    cursor: str | None = None
+
+    @field_validator("start", "end")
+    @classmethod
+    def validate_timezone(cls, v: datetime | None) -> datetime | None:
+        if v is not None and v.tzinfo is None:
+            v = v.replace(tzinfo=UTC)
+        return v
+
+    @field_validator("properties")
+    @classmethod
+    def validate_properties(cls, v: list[str]) -> list[str]:
+        for value in v:
+            parse_property_filter(value)
+        return v
+
+    @field_validator("cursor")
+    @classmethod
+    def validate_cursor(cls, v: str | None) -> str | None:
+        if v is not None:
+            decode_cursor(v)
+        return v
+
+    @model_validator(mode="after")
+    def validate_range(self) -> "EventQueryDTO":
+        if self.start and self.end and self.start >= self.end:
+            raise ValueError("start must be before end")
+        return self
+
+    def to_filter(self, project_id: ProjectID) -> EventFilter:
+        return EventFilter(
+            project_id=project_id,
+            start=self.start,
+            end=self.end,
+            event_types=tuple(self.event_type),
+            user_id=self.user_id,
+            session_id=self.session_id,
+            properties=dict(parse_property_filter(value) for value in self.properties),
+            after=decode_cursor(self.cursor) if self.cursor else None,
+        )
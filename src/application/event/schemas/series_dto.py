@@ -0,0 +1,51 @@
+from datetime import UTC, datetime
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from domain.event.types import EventType
+from domain.rollup.types import Granularity
+
+
+MAX_SERIES_BUCKETS = 10_000
+
+
+class TimeSeriesQueryDTO(BaseModel):
+    """Query string of `GET /events/series`; `end` defaults to now."""
+
+    granularity: Granularity = Granularity.HOUR
+    start: datetime
+    end: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    event_type: list[EventType] = Field(default_factory=list)
+
+    @field_validator("start", "end")
+    @classmethod
+    def validate_timezone(cls, v: datetime) -> datetime:
+        if v.tzinfo is None:
+            v = v.replace(tzinfo=UTC)
+        return v
+
+    @model_validator(mode="after")
+    def validate_range(self) -> "TimeSeriesQueryDTO":
+        if self.start >= self.end:
+            raise ValueError("start must be before end")
+        if (self.end - self.start) / self.granularity.step > MAX_SERIES_BUCKETS:
+            raise ValueError(
+                f"range spans more than {MAX_SERIES_BUCKETS} {self.granularity} buckets"
+            )
+        return self
+
+
+class TimeSeriesPointDTO(BaseModel):
+    bucket: datetime
+    event_type: EventType
+    count: int
+
+
+class TimeSeriesResponseDTO(BaseModel):
+    granularity: Granularity
+    start: datetime
+    end: datetime
+    # Buckets before this are final unless events older than it still arrive; later ones
+    # may be incomplete. None until the project's first event has been rolled up.
+    complete_up_to: datetime | None
+    points: list[TimeSeriesPointDTO]
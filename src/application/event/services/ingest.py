@@ -6,6 +6,7 @@ from application.event.schemas.ingest_dto import IngestEventDTO
 from application.event.schemas.response_dto import IngestEventResponseDTO
 from domain.event.models import Event
 from domain.event.producer import EventProducer
+from domain.project.types import Plan
 from infrastructure.config.settings import Settings
 
 
@@ -15,7 +16,9 @@ class IngestEventService:
         self._logger = logger
         self._settings = settings
 
-    async def __call__(self, project_id: UUID, data: IngestEventDTO) -> IngestEventResponseDTO:
+    async def __call__(
+        self, project_id: UUID, data: IngestEventDTO, plan: Plan | None = None
+    ) -> IngestEventResponseDTO:
         new_event = Event.create(
             project_id=project_id,
             user_id=data.user_id,
@@ -25,6 +28,6 @@ class IngestEventService:
             properties=data.properties.to_domain(),
         )
 
-        await self._producer.publish(new_event)
+        await self._producer.publish(new_event, plan=plan)
 
         return IngestEventResponseDTO(event_id=new_event.event_id)
@@ -6,6 +6,7 @@ from application.event.schemas.ingest_dto import IngestEventBatchDTO
 from application.event.schemas.response_dto import IngestEventBatchResponseDTO
 from domain.event.models import Event
 from domain.event.producer import EventProducer
+from domain.project.types import Plan
 from infrastructure.config.settings import Settings
 
 
@@ -16,7 +17,7 @@ class IngestEventBatchService:
         self._settings = settings
 
     async def __call__(
-        self, project_id: UUID, data: IngestEventBatchDTO
+        self, project_id: UUID, data: IngestEventBatchDTO, plan: Plan | None = None
     ) -> IngestEventBatchResponseDTO:
         new_events = [
             Event.create(
@@ -30,6 +31,6 @@ class IngestEventBatchService:
             for dto in data.events
         ]
 
-        await self._producer.publish_batch(new_events)
+        await self._producer.publish_batch(new_events, plan=plan)
 
         return IngestEventBatchResponseDTO(event_ids=[event.event_id for event in new_events])
@@ -0,0 +1,77 @@
+import dataclasses
+from collections.abc import AsyncIterator
+from typing import Any
+
+import orjson
+from structlog import BoundLogger
+
+from application.common.uow import IUnitOfWork
+from application.event.schemas.query_dto import EventQueryDTO, encode_cursor
+from domain.event.models import Event
+from domain.event.query import EventCursor
+from domain.types import ProjectID
+
+
+# Lines are buffered into chunks of about this size before each write to the client
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def event_payload(event: Event) -> dict[str, Any]:
+    """Event in the ingestion shape: price back in currency units, unset properties omitted."""
+    properties = {
+        key: value
+        for key, value in dataclasses.asdict(event.properties).items()
+        if value is not None
+    }
+    if event.properties.price is not None:
+        properties["price"] = event.properties.price / 100
+
+    # asyncpg and uuid6 UUIDs are subclasses orjson does not serialize natively
+    return {
+        "event_id": str(event.event_id),
+        "user_id": event.user_id,
+        "session_id": event.session_id,
+        "event_type": event.event_type,
+        "timestamp": event.timestamp,
+        "properties": properties,
+        "created_at": event.created_at,
+    }
+
+
+class QueryEventsService:
+    """Streams matching events as NDJSON from a server-side cursor.
+
+    Without `limit` every match is streamed (an export). With it, at most `limit` events
+    are returned and, if more match, a final `{"next_cursor": ...}` line resumes after them.
+    """
+
+    def __init__(self, uow: IUnitOfWork, logger: BoundLogger) -> None:
+        self._uow = uow
+        self._logger = logger
+
+    async def __call__(self, project_id: ProjectID, query: EventQueryDTO) -> AsyncIterator[bytes]:
+        event_filter = query.to_filter(project_id)
+        # One extra row tells whether another page exists
+        fetch_limit = query.limit + 1 if query.limit is not None else None
+
+        returned = 0
+        last: Event | None = None
+        buffer = bytearray()
+        async with self._uow:
+            async for event in self._uow.event.stream(event_filter, fetch_limit):
+                if returned == query.limit and last is not None:
+                    cursor = encode_cursor(EventCursor(last.timestamp, last.event_id))
+                    buffer += orjson.dumps({"next_cursor": cursor}) + b"\n"
+                    break
+
+                buffer += orjson.dumps(event_payload(event)) + b"\n"
+                returned += 1
+                last = event
+                if len(buffer) >= STREAM_CHUNK_BYTES:
+                    yield bytes(buffer)
+                    buffer.clear()
+
+        if buffer:
+            yield bytes(buffer)
+
+        self._logger.info("Events queried", project_id=str(project_id), events=returned)
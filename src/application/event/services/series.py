@@ -0,0 +1,42 @@
+from structlog import BoundLogger
+
+from application.common.uow import IUnitOfWork
+from application.event.schemas.series_dto import (
+    TimeSeriesPointDTO,
+    TimeSeriesQueryDTO,
+    TimeSeriesResponseDTO,
+)
+from domain.types import ProjectID
+
+
+class GetTimeSeriesService:
+    """Event counts per bucket and type, read from the rollups instead of raw events.
+
+    Buckets without events are omitted. `start` is aligned down to its bucket; the bucket
+    containing `end` is included only if it starts before `end`. `complete_up_to` is the
+    project's watermark, held back to the earliest hour still waiting for recomputation.
+    """
+
+    def __init__(self, uow: IUnitOfWork, logger: BoundLogger) -> None:
+        self._uow = uow
+        self._logger = logger
+
+    async def __call__(
+        self, project_id: ProjectID, query: TimeSeriesQueryDTO
+    ) -> TimeSeriesResponseDTO:
+        start = query.granularity.truncate(query.start)
+        counts = await self._uow.rollup.get_series(
+            project_id, query.granularity, start, query.end, tuple(query.event_type)
+        )
+        complete_up_to = await self._uow.rollup.get_complete_up_to(project_id)
+
+        return TimeSeriesResponseDTO(
+            granularity=query.granularity,
+            start=start,
+            end=query.end,
+            complete_up_to=complete_up_to,
+            points=[
+                TimeSeriesPointDTO(bucket=c.bucket, event_type=c.event_type, count=c.count)
+                for c in counts
+            ],
+        )
@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic import ValidationError
+from structlog import BoundLogger
+
+from application.common.uow import IUnitOfWork
+from application.event.schemas.ingest_dto import ImportEventDTO
+from domain.event.models import Event
+from domain.rollup.models import dirty_hours
+from domain.types import ProjectID
+from domain.utils.generate_uuid import derive_uuid
+from infrastructure.utils.retries import db_retry_policy
+
+
+@dataclass(frozen=True, slots=True)
+class RejectedRow:
+    row: int
+    error: str
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkResult:
+    rows: int
+    inserted: int
+    rejected: list[RejectedRow]
+
+    @property
+    def duplicates(self) -> int:
+        return self.rows - len(self.rejected) - self.inserted
+
+
+def build_events(
+    project_id: ProjectID, source: str, rows: list[tuple[int, Any]]
+) -> tuple[list[Event], list[RejectedRow]]:
+    """Validate rows with the ingestion rules (minus the 30-day window) and build events.
+
+    Rows without an `event_id` get one derived from the source and row number, so loading
+    the same file again inserts nothing new.
+    """
+    created_at = datetime.now(UTC)
+    events, rejected = [], []
+    for number, row in rows:
+        try:
+            dto = ImportEventDTO.model_validate(row)
+        except ValidationError as e:
+            error = e.errors()[0]
+            location = ".".join(str(part) for part in error["loc"])
+            rejected.append(RejectedRow(number, f"{location}: {error['msg']}".lstrip(": ")))
+            continue
+
+        key = f"{project_id}:{source}:{number}"
+        events.append(
+            Event(
+                event_id=dto.event_id or derive_uuid(dto.timestamp, key),
+                project_id=project_id,
+                user_id=dto.user_id,
+                session_id=dto.session_id,
+                event_type=dto.event_type,
+                timestamp=dto.timestamp,
+                properties=dto.properties.to_domain(),
+                created_at=created_at,
+            )
+        )
+    return events, rejected
+
+
+class ImportChunkService:
+    """Validates one chunk of rows and loads it with COPY in a single transaction."""
+
+    def __init__(self, uow: IUnitOfWork, logger: BoundLogger) -> None:
+        self._uow = uow
+        self._logger = logger
+
+    @db_retry_policy
+    async def __call__(
+        self, project_id: ProjectID, source: str, rows: list[tuple[int, Any]]
+    ) -> ChunkResult:
+        events, rejected = build_events(project_id, source, rows)
+
+        inserted = 0
+        if events:
+            async with self._uow:
+                inserted = await self._uow.event.copy_many(events)
+                # Imported events bypass incremental counting; their hours are rebuilt instead
+                await self._uow.rollup.mark_dirty(dirty_hours(events))
+                await self._uow.commit()
+
+        return ChunkResult(rows=len(rows), inserted=inserted, rejected=rejected)
@@ -0,0 +1,172 @@
+import asyncio
+import hashlib
+import itertools
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any
+
+import orjson
+from structlog import BoundLogger
+
+from application.importer.chunk import ChunkResult
+from domain.types import ProjectID
+from infrastructure.importer.checkpoint import ImportCheckpoint
+from infrastructure.importer.readers import FileFormat, read_rows
+
+
+type ChunkLoader = Callable[[ProjectID, str, list[tuple[int, Any]]], Awaitable[ChunkResult]]
+
+
+@dataclass(slots=True)
+class ImportProgress:
+    rows: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    rejected: int = 0
+    skipped: int = 0  # rows committed by an earlier run
+    chunks: int = 0
+
+    def add(self, result: ChunkResult) -> None:
+        self.rows += result.rows
+        self.inserted += result.inserted
+        self.duplicates += result.duplicates
+        self.rejected += len(result.rejected)
+        self.chunks += 1
+
+
+def source_key(path: Path) -> str:
+    """Identity of a source file in the checkpoint and in derived event ids.
+
+    Keyed by content, so files with the same name and size in different directories never
+    share progress, while a file moved elsewhere keeps its progress and event ids.
+    """
+    with path.open("rb") as file:
+        digest = hashlib.file_digest(file, "sha256").hexdigest()
+    return f"{path.name}:{digest[:16]}"
+
+
+def chunked[T](items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+class ImportRunner:
+    """Reads source files in chunks and loads up to `parallel` chunks at once.
+
+    A chunk is committed in one transaction and then its row range is recorded in the
+    checkpoint, so an interrupted import resumes with the first uncommitted row of each
+    file, even with a different chunk size. A chunk that was committed but not yet
+    recorded is loaded again and deduplicated by its event ids.
+    """
+
+    def __init__(
+        self,
+        load_chunk: ChunkLoader,
+        checkpoint: ImportCheckpoint,
+        logger: BoundLogger,
+        chunk_size: int = 10_000,
+        parallel: int = 4,
+        progress_interval: float = 10.0,
+        rejects: IO[bytes] | None = None,
+    ) -> None:
+        self._load_chunk = load_chunk
+        self._checkpoint = checkpoint
+        self._logger = logger
+        self._chunk_size = chunk_size
+        self._parallel = parallel
+        self._progress_interval = progress_interval
+        self._rejects = rejects
+        self.progress = ImportProgress()
+
+    async def run(
+        self, project_id: ProjectID, paths: list[Path], file_format: FileFormat | None = None
+    ) -> ImportProgress:
+        started = time.perf_counter()
+        reporter = asyncio.create_task(self._report(started))
+        try:
+            for path in paths:
+                await self._import_file(project_id, path, file_format)
+        finally:
+            reporter.cancel()
+            with suppress(asyncio.CancelledError):
+                await reporter
+
+        self._logger.info("import_finished", **self._summary(started))
+        return self.progress
+
+    async def _import_file(
+        self, project_id: ProjectID, path: Path, file_format: FileFormat | None
+    ) -> None:
+        source = source_key(path)
+        self._logger.info("import_file_started", path=str(path), source=source)
+
+        slots = asyncio.Semaphore(self._parallel)
+        tasks: set[asyncio.Task[None]] = set()
+        failed: list[BaseException] = []
+
+        def on_done(task: asyncio.Task[None]) -> None:
+            tasks.discard(task)
+            slots.release()
+            if not task.cancelled() and task.exception() is not None:
+                failed.append(task.exception())  # type: ignore[arg-type]
+
+        end = 0
+        for rows in chunked(read_rows(path, file_format), self._chunk_size):
+            start, end = end, end + len(rows)
+            pending = self._checkpoint.pending(source, start, end)
+            # Keep only rows not committed by an earlier run, which may have used other chunks
+            todo = [row for low, high in pending for row in rows[low - start : high - start]]
+            self.progress.skipped += len(rows) - len(todo)
+            if not todo:
+                continue
+            await slots.acquire()
+            if failed:
+                slots.release()
+                break
+            task = asyncio.create_task(self._load(project_id, source, (start, end), todo))
+            tasks.add(task)
+            task.add_done_callback(on_done)
+
+        if tasks:
+            await asyncio.wait(tasks)
+        if failed:
+            raise failed[0]
+
+    async def _load(
+        self,
+        project_id: ProjectID,
+        source: str,
+        span: tuple[int, int],
+        rows: list[tuple[int, Any]],
+    ) -> None:
+        result = await self._load_chunk(project_id, source, rows)
+        # The rest of the span was committed earlier, so the whole span is now done
+        self._checkpoint.mark_done(source, *span)
+        self.progress.add(result)
+
+        if self._rejects is not None:
+            for rejected in result.rejected:
+                line = {"source": source, "row": rejected.row, "error": rejected.error}
+                self._rejects.write(orjson.dumps(line) + b"\n")
+
+    async def _report(self, started: float) -> None:
+        while True:
+            await asyncio.sleep(self._progress_interval)
+            self._logger.info("import_progress", **self._summary(started))
+
+    def _summary(self, started: float) -> dict[str, int | float]:
+        elapsed = time.perf_counter() - started
+        return {
+            "rows": self.progress.rows,
+            "inserted": self.progress.inserted,
+            "duplicates": self.progress.duplicates,
+            "rejected": self.progress.rejected,
+            "skipped": self.progress.skipped,
+            "chunks": self.progress.chunks,
+            "rows_per_second": round(self.progress.rows / elapsed) if elapsed else 0,
+            "elapsed": round(elapsed, 1),
+        }
@@ -1,11 +1,24 @@
 import time
+from datetime import UTC, datetime, timedelta
 
 from structlog import BoundLogger
 
 from application.common.uow import IUnitOfWork
-from domain.event.consumer import EventConsumer
+from domain.event.consumer import ConsumedEvent, EventConsumer
+from domain.event.models import Event
+from domain.rollup.models import count_events, dirty_hours, next_watermarks, split_late
+from domain.types import ProjectID
 from infrastructure.config.settings import Settings
-from infrastructure.metrics.worker import BATCH_PROCESSING_TIME, EVENTS_PROCESSED, PROCESSING_ERRORS
+from infrastructure.metrics.worker import (
+    BATCH_PROCESSING_TIME,
+    BATCH_SIZE,
+    BATCH_STAGE_DURATION,
+    EVENTS_PROCESSED,
+    INGEST_TO_COMMIT_LATENCY,
+    PROCESSING_ERRORS,
+    ROLLUP_LATE_EVENTS,
+    ROWS_WRITTEN,
+)
 
 
 class BatchProcessor:
@@ -17,8 +30,11 @@ class BatchProcessor:
         self._logger = logger
         self._batch_size = settings.batch_size
         self._timeout_ms = settings.read_timeout_ms
+        self._allowed_lateness = timedelta(seconds=settings.rollup_allowed_lateness)
 
     async def process(self) -> None:
+        start_time = time.perf_counter()
+
         events = await self._consumer.read_batch(
             count=self._batch_size,
             block_ms=self._timeout_ms,
@@ -28,28 +44,61 @@ class BatchProcessor:
             return
 
         try:
-            start_time = time.time()
-
             self._logger.info("batch_received", count=len(events))
+            BATCH_SIZE.observe(len(events))
 
             domain_events = [consumed.event for consumed in events]
             msg_ids = [e.msg_id for e in events]
 
+            # Rollups count only newly inserted events, in the same transaction, so a
+            # redelivered batch adds nothing twice and a failed one adds nothing at all.
             async with self._uow:
-                await self._uow.event.add_many(domain_events)
-                await self._uow.commit()
+                with BATCH_STAGE_DURATION.labels(stage="insert").time():
+                    new_events = await self._uow.event.add_new(domain_events)
+                with BATCH_STAGE_DURATION.labels(stage="rollup").time():
+                    await self._update_rollups(new_events)
+                with BATCH_STAGE_DURATION.labels(stage="commit").time():
+                    await self._uow.commit()
+            inserted = len(new_events)
+
+            ROWS_WRITTEN.labels(result="inserted").inc(inserted)
+            ROWS_WRITTEN.labels(result="deduplicated").inc(len(domain_events) - inserted)
+            self._observe_ingest_latency(events)
 
-            await self._consumer.ack(msg_ids)
+            with BATCH_STAGE_DURATION.labels(stage="ack").time():
+                await self._consumer.ack(msg_ids)
             EVENTS_PROCESSED.inc(len(events))
 
-            self._logger.info("batch_processed_and_acked", count=len(msg_ids))
+            self._logger.info("batch_processed_and_acked", count=len(msg_ids), inserted=inserted)
         except Exception as e:
             self._logger.error("batch_processing_failed", error=str(e))
             PROCESSING_ERRORS.labels(error_type="batch_processing_failed").inc()
             raise e
         finally:
-            duration = time.time() - start_time
-            BATCH_PROCESSING_TIME.observe(duration)
+            BATCH_PROCESSING_TIME.observe(time.perf_counter() - start_time)
+
+    async def _update_rollups(self, events: list[Event]) -> None:
+        """Count on-time events now; queue the hours of late ones for recomputation."""
+        if not events:
+            return
+
+        project_ids = list({ProjectID(event.project_id) for event in events})
+        watermarks = await self._uow.rollup.get_watermarks(project_ids)
+        on_time, late = split_late(events, watermarks)
+
+        await self._uow.rollup.add(count_events(on_time))
+        if late:
+            await self._uow.rollup.mark_dirty(dirty_hours(late))
+            ROLLUP_LATE_EVENTS.inc(len(late))
+        await self._uow.rollup.advance_watermarks(next_watermarks(events, self._allowed_lateness))
+
+    @staticmethod
+    def _observe_ingest_latency(events: list[ConsumedEvent]) -> None:
+        committed_at = datetime.now(UTC)
+        for consumed in events:
+            plan = consumed.plan.value if consumed.plan else "unknown"
+            latency = (committed_at - consumed.event.created_at).total_seconds()
+            INGEST_TO_COMMIT_LATENCY.labels(plan=plan).observe(max(latency, 0.0))
 
     async def ensure_startup(self) -> None:
         await self._consumer.ensure_group()
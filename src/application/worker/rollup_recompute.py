@@ -0,0 +1,59 @@
+import asyncio
+import contextlib
+
+from structlog import BoundLogger
+
+from application.common.uow import IUnitOfWork
+from application.worker.graceful_killer import GracefulKiller
+from infrastructure.config.settings import Settings
+from infrastructure.metrics.worker import PROCESSING_ERRORS, ROLLUP_BUCKETS_RECOMPUTED
+
+
+class RollupRecomputer:
+    """Rebuilds rollup hours marked dirty by late or imported events.
+
+    Each job takes at most `rollup_recompute_batch` of the oldest dirty hours and rebuilds
+    each one in its own short transaction, so a backlog never holds long locks.
+    """
+
+    def __init__(
+        self, uow: IUnitOfWork, killer: GracefulKiller, logger: BoundLogger, settings: Settings
+    ) -> None:
+        self._uow = uow
+        self._killer = killer
+        self._logger = logger
+        self._batch = settings.rollup_recompute_batch
+        self._interval = settings.rollup_recompute_interval
+
+    async def run(self) -> None:
+        self._logger.info("rollup_recompute_started")
+        while not self._killer.shutdown_event.is_set():
+            try:
+                recomputed = await self.run_once()
+            except Exception as e:
+                self._logger.error("rollup_recompute_failed", error=str(e))
+                PROCESSING_ERRORS.labels(error_type="rollup_recompute_failed").inc()
+                recomputed = 0
+
+            # A full job means more hours are waiting: continue without sleeping
+            if recomputed < self._batch:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._killer.shutdown_event.wait(), self._interval)
+
+    async def run_once(self) -> int:
+        """Recompute one job's worth of dirty hours and return how many were rebuilt."""
+        dirty = await self._uow.rollup.get_dirty(self._batch)
+
+        recomputed = 0
+        for bucket in dirty:
+            if self._killer.shutdown_event.is_set():
+                break
+            async with self._uow:
+                if await self._uow.rollup.recompute(bucket):
+                    recomputed += 1
+                await self._uow.commit()
+
+        if recomputed:
+            ROLLUP_BUCKETS_RECOMPUTED.inc(recomputed)
+            self._logger.info("rollup_buckets_recomputed", count=recomputed)
+        return recomputed
@@ -1,7 +1,29 @@
+from collections.abc import Awaitable, Callable
 from typing import Any, Protocol
 
+from domain.project.models import ProjectIdentity
+
+
+ProjectLoader = Callable[[str], Awaitable[ProjectIdentity | None]]
+
 
 class Cache(Protocol):
     async def set(self, key: str, value: Any) -> None: ...  # noqa: ANN401
 
     async def get(self, key: str) -> Any | None: ...  # noqa: ANN401
+
+    async def delete(self, key: str) -> None: ...
+
+
+class ProjectCache(Protocol):
+    async def resolve(self, api_key: str, loader: ProjectLoader) -> ProjectIdentity | None:
+        """Return the project for an API key, or None if the key is unknown."""
+        ...
+
+    async def invalidate(self, api_key: str) -> None:
+        """Drop a cached API key on every API replica (plan change, key revocation)."""
+        ...
+
+    async def listen_for_invalidations(self) -> None:
+        """Apply invalidations published by other replicas until cancelled."""
+        ...
@@ -2,12 +2,14 @@ from dataclasses import dataclass
 from typing import Protocol
 
 from domain.event.models import Event
+from domain.project.types import Plan
 
 
 @dataclass(frozen=True, slots=True)
 class ConsumedEvent:
     msg_id: str
     event: Event
+    plan: Plan | None = None
 
 
 class EventConsumer(Protocol):
@@ -1,9 +1,10 @@
 from typing import Protocol
 
 from domain.event.models import Event
+from domain.project.types import Plan
 
 
 class EventProducer(Protocol):
-    async def publish(self, event: Event) -> None: ...
+    async def publish(self, event: Event, plan: Plan | None = None) -> None: ...
 
-    async def publish_batch(self, events: list[Event]) -> None: ...
+    async def publish_batch(self, events: list[Event], plan: Plan | None = None) -> None: ...
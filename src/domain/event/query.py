@@ -0,0 +1,28 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from domain.event.types import EventType
+from domain.types import ProjectID
+
+
+@dataclass(frozen=True, slots=True)
+class EventCursor:
+    """Keyset position: the `(timestamp, event_id)` of the last event already returned."""
+
+    timestamp: datetime
+    event_id: UUID
+
+
+@dataclass(frozen=True, slots=True)
+class EventFilter:
+    project_id: ProjectID
+    start: datetime | None = None
+    end: datetime | None = None
+    event_types: tuple[EventType, ...] = ()
+    user_id: str | None = None
+    session_id: str | None = None
+    # Stored property values (price in cents) the event must contain
+    properties: Mapping[str, str | int] = field(default_factory=dict)
+    after: EventCursor | None = None
@@ -1,14 +1,19 @@
+from collections.abc import AsyncIterator
 from typing import Protocol
 from uuid import UUID
 
 from domain.event.models import Event
+from domain.event.query import EventFilter
 from domain.types import ProjectID
 
 
 class IEventRepository(Protocol):
     async def add(self, event: Event) -> None: ...
-    async def add_many(self, events: list[Event]) -> None: ...
+    async def add_many(self, events: list[Event]) -> int: ...
+    async def add_new(self, events: list[Event]) -> list[Event]: ...
+    async def copy_many(self, events: list[Event]) -> int: ...
     async def get_by_project_id(
         self, project_id: ProjectID, limit: int, offset: int
     ) -> list[Event]: ...
     async def get_by_id(self, event_id: UUID) -> Event: ...
+    def stream(self, query: EventFilter, limit: int | None = None) -> AsyncIterator[Event]: ...
@@ -29,3 +29,7 @@ class RateLimitExceededError(BaseError):
 
 class ForbiddenError(BaseError):
     pass
+
+
+class ConflictError(BaseError):
+    pass
@@ -25,3 +25,15 @@ class Project:
             api_key=generate_api_key(env),
             created_at=datetime.now(UTC),
         )
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectIdentity:
+    """Part of a project needed to authorize and rate limit a request."""
+
+    project_id: ProjectID
+    plan: Plan
+
+    @classmethod
+    def from_project(cls, project: Project) -> "ProjectIdentity":
+        return cls(project_id=project.project_id, plan=project.plan)
@@ -0,0 +1,26 @@
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Protocol
+
+from domain.event.types import EventType
+from domain.rollup.models import RollupBucket, RollupCount
+from domain.rollup.types import Granularity
+from domain.types import ProjectID
+
+
+class IRollupRepository(Protocol):
+    async def add(self, counts: list[RollupCount]) -> None: ...
+    async def get_series(
+        self,
+        project_id: ProjectID,
+        granularity: Granularity,
+        start: datetime,
+        end: datetime,
+        event_types: tuple[EventType, ...] = (),
+    ) -> list[RollupCount]: ...
+    async def get_watermarks(self, project_ids: list[ProjectID]) -> dict[ProjectID, datetime]: ...
+    async def advance_watermarks(self, watermarks: Mapping[ProjectID, datetime]) -> None: ...
+    async def mark_dirty(self, buckets: list[RollupBucket]) -> None: ...
+    async def get_dirty(self, limit: int) -> list[RollupBucket]: ...
+    async def recompute(self, bucket: RollupBucket) -> bool: ...
+    async def get_complete_up_to(self, project_id: ProjectID) -> datetime | None: ...
@@ -0,0 +1,30 @@
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+
+
+class Granularity(StrEnum):
+    MINUTE = "minute"
+    HOUR = "hour"
+    DAY = "day"
+
+    @property
+    def step(self) -> timedelta:
+        return STEPS[self]
+
+    def truncate(self, timestamp: datetime) -> datetime:
+        """Start of the UTC bucket containing `timestamp`."""
+        timestamp = timestamp.astimezone(UTC)
+        match self:
+            case Granularity.MINUTE:
+                return timestamp.replace(second=0, microsecond=0)
+            case Granularity.HOUR:
+                return timestamp.replace(minute=0, second=0, microsecond=0)
+            case Granularity.DAY:
+                return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+STEPS = {
+    Granularity.MINUTE: timedelta(minutes=1),
+    Granularity.HOUR: timedelta(hours=1),
+    Granularity.DAY: timedelta(days=1),
+}
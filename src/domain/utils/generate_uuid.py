@@ -1,3 +1,5 @@
+import hashlib
+from datetime import datetime
 from uuid import UUID
 
 from uuid6 import uuid7
@@ -5,3 +7,16 @@ from uuid6 import uuid7
 
 def generate_uuid() -> UUID:
     return uuid7()
+
+
+def derive_uuid(timestamp: datetime, key: str) -> UUID:
+    """UUIDv7 layout with the timestamp's milliseconds and a hash of `key` as random bits.
+
+    The same (timestamp, key) always gives the same id, so re-importing a row is a no-op,
+    while ids stay time-ordered like `generate_uuid`.
+    """
+    millis = int(timestamp.timestamp() * 1000) & ((1 << 48) - 1)
+    digest = int.from_bytes(hashlib.sha256(key.encode()).digest()[:10])
+    value = (millis << 80) | (0x7 << 76) | ((digest >> 68) << 64) | (0b10 << 62)
+    value |= digest & ((1 << 62) - 1)
+    return UUID(int=value)
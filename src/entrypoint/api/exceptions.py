@@ -14,6 +14,7 @@ EXCEPTION_TO_STATUS_CODE = {
     "ValidationError": status.HTTP_422_UNPROCESSABLE_CONTENT,
     "RateLimitExceededError": status.HTTP_429_TOO_MANY_REQUESTS,
     "ForbiddenError": status.HTTP_403_FORBIDDEN,
+    "ConflictError": status.HTTP_409_CONFLICT,
 }
 
 
@@ -1,14 +1,20 @@
+import asyncio
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import Any
 
 from dishka import AsyncContainer
 from fastapi import FastAPI
 from fastapi_limiter import FastAPILimiter
+from structlog import BoundLogger
 
+from domain.cache.repository import ProjectCache
 from infrastructure.config.settings import settings
 from infrastructure.di.providers.types import CacheRedis
 from infrastructure.logger.setup import configure_logger
+from infrastructure.metrics.event_loop import EventLoopMonitor
+from infrastructure.metrics.registry import mark_process_dead
+from infrastructure.rate_limit.token_bucket import LocalTokenBuckets
 
 
 @asynccontextmanager
@@ -23,10 +29,30 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, Any]:
     container: AsyncContainer = app.state.dishka_container
     cache_client = await container.get(CacheRedis)
 
+    project_cache = await container.get(ProjectCache)
+    loop_monitor = EventLoopMonitor(
+        logger=await container.get(BoundLogger),
+        interval=settings.event_loop_monitor_interval,
+        block_threshold=settings.event_loop_block_threshold,
+    )
+    background_tasks = [
+        asyncio.create_task(project_cache.listen_for_invalidations()),
+        asyncio.create_task(loop_monitor.run()),
+    ]
+
     if settings.is_rate_limit_enabled:
         await FastAPILimiter.init(cache_client)
+        token_buckets = await container.get(LocalTokenBuckets)
+        background_tasks.append(asyncio.create_task(token_buckets.run_sync_loop()))
 
     yield
 
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
     if settings.is_rate_limit_enabled:
         await FastAPILimiter.close()
+
+    mark_process_dead()
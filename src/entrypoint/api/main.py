@@ -2,15 +2,14 @@ from dishka import make_async_container
 from dishka.integrations.fastapi import FastapiProvider, setup_dishka
 from fastapi import APIRouter, FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
-from prometheus_fastapi_instrumentator import Instrumentator
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.cors import CORSMiddleware
 
 from entrypoint.api.lifespan import lifespan
-from entrypoint.api.middleware.exception_handler import ExceptionHandlerMiddleware
-from entrypoint.api.middleware.logger import StructlogMiddleware
-from entrypoint.api.routers import health
+from entrypoint.api.middleware.observability import ObservabilityMiddleware
+from entrypoint.api.routers import admin, health, metrics
 from entrypoint.api.routers.v1.ingestion import event, project
+from entrypoint.api.routers.v1.query import event as event_query
 from infrastructure.config.settings import AppEnv, settings
 from infrastructure.di.providers.api_key import ApiKeyProvider
 from infrastructure.di.providers.application import ApplicationProvider
@@ -36,10 +35,9 @@ def create_app() -> FastAPI:
         exception_handlers={},
     )
 
-    app.add_middleware(ExceptionHandlerMiddleware)
+    app.add_middleware(ObservabilityMiddleware)
 
     if settings.app_env != AppEnv.TEST:
-        app.add_middleware(StructlogMiddleware)
         app.add_middleware(
             CORSMiddleware,
             allow_origins=["*"],
@@ -67,14 +65,16 @@ def create_app() -> FastAPI:
         StreamProvider(),
     )
     setup_dishka(container, app)
-    Instrumentator().instrument(app).expose(app)
 
     v1 = APIRouter(prefix="/api/v1")
     v1.include_router(project.router)
     v1.include_router(event.router)
+    v1.include_router(event_query.router)
 
     app.include_router(v1)
     app.include_router(health.router)
+    app.include_router(metrics.router)
+    app.include_router(admin.router)
 
     return app
 
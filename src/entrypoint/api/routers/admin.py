@@ -0,0 +1,43 @@
+import asyncio
+
+from dishka.integrations.fastapi import DishkaRoute, FromDishka
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import PlainTextResponse
+
+from application.common.error_response import RESPONSE
+from domain.exceptions.app import ForbiddenError
+from infrastructure.config.settings import Settings
+from infrastructure.profiling.sampler import DEFAULT_INTERVAL, MAX_PROFILE_SECONDS, profile
+from infrastructure.security.dependencies import token_auth_required
+
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    route_class=DishkaRoute,
+    dependencies=[Depends(token_auth_required)],
+)
+
+
+@router.get(
+    "/profile",
+    summary="Sample process stacks for a while and return them in collapsed format",
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_403_FORBIDDEN: RESPONSE[status.HTTP_403_FORBIDDEN],
+        status.HTTP_409_CONFLICT: RESPONSE[status.HTTP_409_CONFLICT],
+    },
+    include_in_schema=False,
+)
+async def profile_process(
+    settings: FromDishka[Settings],
+    seconds: float = Query(default=10, gt=0, le=MAX_PROFILE_SECONDS),
+    interval_ms: float = Query(default=DEFAULT_INTERVAL * 1000, ge=1, le=1000),
+) -> PlainTextResponse:
+    if not settings.secret_token:
+        raise ForbiddenError(message="Admin endpoints are disabled without a secret token")
+
+    # The sampler sleeps between samples, so it runs in a thread and the loop keeps serving
+    stacks = await asyncio.to_thread(profile, seconds, interval_ms / 1000)
+    return PlainTextResponse(stacks)
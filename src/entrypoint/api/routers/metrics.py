@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from infrastructure.metrics.registry import exposition_registry
+
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("", summary="Prometheus metrics", include_in_schema=False)
+def metrics() -> Response:
+    # Sync handler: collecting from the multiprocess directory reads files
+    return Response(generate_latest(exposition_registry()), media_type=CONTENT_TYPE_LATEST)
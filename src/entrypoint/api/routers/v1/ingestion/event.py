@@ -1,5 +1,5 @@
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 
 from application.common.error_response import RESPONSE
 from application.event.schemas.ingest_dto import IngestEventBatchDTO, IngestEventDTO
@@ -9,7 +9,7 @@ from application.event.schemas.response_dto import (
 )
 from application.event.services.ingest import IngestEventService
 from application.event.services.ingest_batch import IngestEventBatchService
-from domain.types import ProjectID
+from domain.project.models import ProjectIdentity
 from infrastructure.rate_limit.dependencies import PlanBasedRateLimiter
 from infrastructure.rate_limit.fastapi_dependency import rate_limit_dependency
 
@@ -36,11 +36,14 @@ router = APIRouter(
     },
 )
 async def ingest_event(
-    project_id: FromDishka[ProjectID],
+    request: Request,
+    project: FromDishka[ProjectIdentity],
     data: IngestEventDTO,
     service: FromDishka[IngestEventService],
+    limiter: FromDishka[PlanBasedRateLimiter],
 ) -> IngestEventResponseDTO:
-    return await service(project_id=project_id, data=data)
+    await limiter.charge_events(request, events=1)
+    return await service(project_id=project.project_id, data=data, plan=project.plan)
 
 
 @router.post(
@@ -57,8 +60,11 @@ async def ingest_event(
     },
 )
 async def ingest_event_batch(
-    project_id: FromDishka[ProjectID],
+    request: Request,
+    project: FromDishka[ProjectIdentity],
     data: IngestEventBatchDTO,
     service: FromDishka[IngestEventBatchService],
+    limiter: FromDishka[PlanBasedRateLimiter],
 ) -> IngestEventBatchResponseDTO:
-    return await service(project_id=project_id, data=data)
+    await limiter.charge_events(request, events=len(data.events))
+    return await service(project_id=project.project_id, data=data, plan=project.plan)
@@ -0,0 +1,67 @@
+from typing import Annotated
+
+from dishka.integrations.fastapi import DishkaRoute, FromDishka
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
+
+from application.common.error_response import RESPONSE
+from application.event.schemas.query_dto import EventQueryDTO
+from application.event.schemas.series_dto import TimeSeriesQueryDTO, TimeSeriesResponseDTO
+from application.event.services.query import QueryEventsService
+from application.event.services.series import GetTimeSeriesService
+from domain.project.models import ProjectIdentity
+from infrastructure.rate_limit.dependencies import PlanBasedRateLimiter
+from infrastructure.rate_limit.fastapi_dependency import rate_limit_dependency
+
+
+router = APIRouter(
+    prefix="/events",
+    tags=["Query"],
+    route_class=DishkaRoute,
+    dependencies=[Depends(rate_limit_dependency(PlanBasedRateLimiter))],
+)
+
+
+@router.get(
+    "",
+    summary="Query events",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "One JSON event per line, then `next_cursor` if more pages remain",
+            "content": {"application/x-ndjson": {}},
+        },
+        status.HTTP_401_UNAUTHORIZED: RESPONSE[status.HTTP_401_UNAUTHORIZED],
+        status.HTTP_422_UNPROCESSABLE_CONTENT: RESPONSE[status.HTTP_422_UNPROCESSABLE_CONTENT],
+        status.HTTP_429_TOO_MANY_REQUESTS: {"description": "Rate limit exceeded"},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: RESPONSE[status.HTTP_500_INTERNAL_SERVER_ERROR],
+    },
+)
+async def query_events(
+    project: FromDishka[ProjectIdentity],
+    query: Annotated[EventQueryDTO, Query()],
+    service: FromDishka[QueryEventsService],
+) -> StreamingResponse:
+    # The request scope (and its unit of work) stays open until the body is fully sent
+    return StreamingResponse(
+        service(project_id=project.project_id, query=query),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get(
+    "/series",
+    summary="Event counts over time",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: RESPONSE[status.HTTP_401_UNAUTHORIZED],
+        status.HTTP_422_UNPROCESSABLE_CONTENT: RESPONSE[status.HTTP_422_UNPROCESSABLE_CONTENT],
+        status.HTTP_429_TOO_MANY_REQUESTS: {"description": "Rate limit exceeded"},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: RESPONSE[status.HTTP_500_INTERNAL_SERVER_ERROR],
+    },
+)
+async def get_time_series(
+    project: FromDishka[ProjectIdentity],
+    query: Annotated[TimeSeriesQueryDTO, Query()],
+    service: FromDishka[GetTimeSeriesService],
+) -> TimeSeriesResponseDTO:
+    return await service(project_id=project.project_id, query=query)
@@ -1,16 +1,22 @@
 import asyncio
 import signal
+from contextlib import suppress
 
 from dishka import make_async_container
-from structlog import get_logger
+from structlog import BoundLogger, get_logger
 
 from application.worker.graceful_killer import GracefulKiller
 from application.worker.loop import WorkerLoop
+from application.worker.rollup_recompute import RollupRecomputer
+from infrastructure.config.settings import settings
 from infrastructure.di.providers.db import DbProvider
 from infrastructure.di.providers.logger import LoggerProvider
 from infrastructure.di.providers.settings import SettingsProvider
 from infrastructure.di.providers.stream import StreamProvider
 from infrastructure.di.providers.worker import WorkerProvider
+from infrastructure.logger.setup import configure_logger
+from infrastructure.metrics.event_loop import EventLoopMonitor
+from infrastructure.metrics.registry import mark_process_dead
 from infrastructure.metrics.worker import start_metrics_server
 
 
@@ -18,7 +24,8 @@ logger = get_logger()
 
 
 async def main() -> None:
-    start_metrics_server(8001)
+    configure_logger()
+    start_metrics_server(8001, secret_token=settings.secret_token)
     container = make_async_container(
         SettingsProvider(),
         LoggerProvider(),
@@ -28,18 +35,39 @@ async def main() -> None:
     )
 
     try:
-        async with container() as scope:
+        # The recomputer gets its own request scope, so its unit of work never shares a
+        # connection or transaction with the batch processor's
+        async with container() as scope, container() as recompute_scope:
             killer = await scope.get(GracefulKiller)
             worker = await scope.get(WorkerLoop)
+            recomputer = await recompute_scope.get(RollupRecomputer)
+
+            loop_monitor = EventLoopMonitor(
+                logger=await scope.get(BoundLogger),
+                interval=settings.event_loop_monitor_interval,
+                block_threshold=settings.event_loop_block_threshold,
+            )
+            monitor_task = asyncio.create_task(loop_monitor.run())
+            recompute_task = asyncio.create_task(recomputer.run())
 
             loop = asyncio.get_running_loop()
             for sig in (signal.SIGINT, signal.SIGTERM):
                 loop.add_signal_handler(sig, killer.signal_handler, sig, None)
 
-            await worker.run()
+            try:
+                await worker.run()
+            finally:
+                # Stops after its current hour once the shutdown event is set
+                killer.shutdown_event.set()
+                await recompute_task
+                monitor_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await monitor_task
     except Exception as e:
         logger.critical("worker_crashed_at_startup", error=str(e))
         raise
+    finally:
+        mark_process_dead()
 
 
 if __name__ == "__main__":
@@ -12,3 +12,6 @@ class InMemoryCache:
 
     async def get(self, key: str) -> Any | None:  # noqa: ANN401
         return self._cache.get(key)
+
+    async def delete(self, key: str) -> None:
+        self._cache.pop(key, None)
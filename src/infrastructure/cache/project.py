@@ -0,0 +1,155 @@
+import asyncio
+from typing import Any, cast
+from uuid import UUID
+
+from structlog import BoundLogger
+
+from application.common.uow import IUnitOfWork
+from domain.cache.repository import ProjectLoader
+from domain.exceptions.app import NotFoundError
+from domain.project.models import ProjectIdentity
+from domain.project.types import Plan
+from domain.types import ProjectID
+from infrastructure.cache.in_memory import InMemoryCache
+from infrastructure.cache.redis import RedisCache
+from infrastructure.cache.single_flight import SingleFlight
+from infrastructure.config.settings import Settings
+from infrastructure.di.providers.types import CacheRedis
+
+
+INVALIDATION_CHANNEL = "project_cache:invalidate"
+_UNKNOWN_KEY: dict[str, Any] = {"unknown": True}
+
+
+def project_loader(uow: IUnitOfWork) -> ProjectLoader:
+    """Build a loader that resolves an API key from the database."""
+
+    async def load(api_key: str) -> ProjectIdentity | None:
+        try:
+            project = await uow.project.get_by_api_key(api_key)
+        except NotFoundError:
+            return None
+
+        return ProjectIdentity.from_project(project) if project else None
+
+    return load
+
+
+class TwoTierProjectCache:
+    """API key -> project cache: in-process TTL layer in front of Redis.
+
+    Unknown keys are cached as short-lived negative entries in both tiers so that
+    clients with revoked keys do not reach the database on every request.
+    Invalidations are published on a Redis channel and every replica drops
+    its local entry when it receives one.
+
+    Concurrent misses for the same key share one lookup, and a hit on a shared entry
+    that is about to expire reloads it in the background so hot keys never miss.
+    """
+
+    def __init__(self, redis: CacheRedis, settings: Settings, logger: BoundLogger) -> None:
+        self._redis = redis
+        self._shared = RedisCache(redis)
+        self._local = InMemoryCache(
+            max_size=settings.project_cache_max_size, ttl=settings.project_cache_local_ttl
+        )
+        self._local_unknown = InMemoryCache(
+            max_size=settings.project_cache_max_size, ttl=settings.project_cache_negative_ttl
+        )
+        self._ttl = settings.project_cache_ttl
+        self._negative_ttl = settings.project_cache_negative_ttl
+        self._refresh_ahead = settings.project_cache_refresh_ahead
+        self._lookups: SingleFlight[ProjectIdentity | None] = SingleFlight()
+        self._logger = logger.bind(component="project_cache")
+
+    async def resolve(self, api_key: str, loader: ProjectLoader) -> ProjectIdentity | None:
+        key = self._key(api_key)
+
+        if identity := await self._local.get(key):
+            return cast(ProjectIdentity, identity)
+        if await self._local_unknown.get(key):
+            return None
+
+        return await self._lookups.run(key, lambda: self._lookup(key, api_key, loader))
+
+    async def invalidate(self, api_key: str) -> None:
+        key = self._key(api_key)
+        await self._drop_local(key)
+        await self._shared.delete(key)
+        await self._redis.publish(INVALIDATION_CHANNEL, key)
+
+    async def listen_for_invalidations(self) -> None:
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            await self._drop_local(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.warning("invalidation_listener_failed", error=str(e))
+                await asyncio.sleep(1)
+
+    async def _lookup(
+        self, key: str, api_key: str, loader: ProjectLoader
+    ) -> ProjectIdentity | None:
+        cached, ttl = await self._shared.get_with_ttl(key)
+        if cached is None:
+            return await self._load(key, api_key, loader)
+
+        identity = self._decode(cached)
+        await self._store_local(key, identity)
+
+        if identity and 0 <= ttl < self._refresh_ahead:
+            self._lookups.schedule(f"refresh:{key}", lambda: self._refresh(key, api_key, loader))
+
+        return identity
+
+    async def _load(self, key: str, api_key: str, loader: ProjectLoader) -> ProjectIdentity | None:
+        identity = await loader(api_key)
+        await self._store(key, identity)
+        return identity
+
+    async def _refresh(
+        self, key: str, api_key: str, loader: ProjectLoader
+    ) -> ProjectIdentity | None:
+        try:
+            return await self._load(key, api_key, loader)
+        except Exception as e:
+            self._logger.warning("refresh_ahead_failed", key=key, error=str(e))
+            return None
+
+    async def _store(self, key: str, identity: ProjectIdentity | None) -> None:
+        if identity is None:
+            await self._shared.set(key, _UNKNOWN_KEY, ttl=self._negative_ttl)
+        else:
+            await self._shared.set(key, self._encode(identity), ttl=self._ttl)
+        await self._store_local(key, identity)
+
+    async def _store_local(self, key: str, identity: ProjectIdentity | None) -> None:
+        if identity is None:
+            await self._local_unknown.set(key, True)
+        else:
+            await self._local.set(key, identity)
+
+    async def _drop_local(self, key: str) -> None:
+        await self._local.delete(key)
+        await self._local_unknown.delete(key)
+
+    @staticmethod
+    def _key(api_key: str) -> str:
+        return f"project:api_key:{api_key}"
+
+    @staticmethod
+    def _encode(identity: ProjectIdentity) -> dict[str, str]:
+        return {"project_id": str(identity.project_id), "plan": identity.plan.value}
+
+    @staticmethod
+    def _decode(data: dict[str, Any]) -> ProjectIdentity | None:
+        if data.get("unknown"):
+            return None
+        return ProjectIdentity(
+            project_id=ProjectID(UUID(data["project_id"])), plan=Plan(data["plan"])
+        )
@@ -23,7 +23,21 @@ class RedisCache:
         await self._redis.set(key, serialized_value, ex=ttl)
 
     async def get(self, key: str) -> Any | None:  # noqa: ANN401
-        value = await self._redis.get(key)
+        return self._deserialize(await self._redis.get(key))
+
+    async def get_with_ttl(self, key: str) -> tuple[Any | None, int]:
+        """Return the value and its remaining TTL in seconds in a single round trip."""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.ttl(key)
+            value, ttl = await pipe.execute()
+        return self._deserialize(value), ttl
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(key)
+
+    @staticmethod
+    def _deserialize(value: str | None) -> Any | None:  # noqa: ANN401
         if value is None:
             return None
 
@@ -0,0 +1,28 @@
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+
+class SingleFlight[T]:
+    """Collapse concurrent calls for the same key into a single coroutine.
+
+    The first caller starts the work as a task, later callers for the same key await
+    that task until it finishes. A cancelled caller does not cancel the shared task.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Task[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def run(self, key: str, factory: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        return await asyncio.shield(self.schedule(key, factory))
+
+    def schedule(self, key: str, factory: Callable[[], Coroutine[Any, Any, T]]) -> asyncio.Task[T]:
+        """Start the work in the background unless it is already in flight."""
+        if (task := self._inflight.get(key)) is None:
+            task = asyncio.create_task(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
@@ -30,6 +30,12 @@ class Settings(BaseSettings):
 
     # Logs
     log_level: LogLevel = LogLevel.INFO
+    log_async: bool = False  # write logs from a background thread through a queue
+    log_sample_rates: dict[str, float] = {}  # event name -> share of entries kept
+
+    # Event loop monitoring (seconds)
+    event_loop_monitor_interval: float = 0.5
+    event_loop_block_threshold: float | None = None  # log the loop's stack on longer stalls
 
     # Database
     db_user: str = "postgres"
@@ -42,6 +48,13 @@ class Settings(BaseSettings):
     cache_url: str = "redis://cache:6380/0"
     stream_url: str = "redis://stream:6379/0"
 
+    # Project cache (API key -> project resolution, seconds)
+    project_cache_ttl: int = 300
+    project_cache_local_ttl: int = 30
+    project_cache_negative_ttl: int = 15
+    project_cache_refresh_ahead: int = 60
+    project_cache_max_size: int = 10_000
+
     # Rate Limiting (requests per minute)
     rate_limit_enabled: bool = False
     rate_limit_free_rpm: int = 100
@@ -49,11 +62,26 @@ class Settings(BaseSettings):
     rate_limit_enterprise_rpm: int = 10000
     rate_limit_no_auth_rpm: int = 10  # fallback without API key
     rate_limit_project_create_rpm: int = 5
+    # Ingestion budgets (admitted events and request bytes per minute)
+    rate_limit_free_events_per_minute: int = 1_000
+    rate_limit_pro_events_per_minute: int = 10_000
+    rate_limit_enterprise_events_per_minute: int = 100_000
+    rate_limit_free_bytes_per_minute: int = 1_048_576
+    rate_limit_pro_bytes_per_minute: int = 10_485_760
+    rate_limit_enterprise_bytes_per_minute: int = 104_857_600
+    rate_limit_sync_interval: float = 0.25  # seconds between Redis reconciliations
+    rate_limit_bucket_idle_ttl: int = 120
 
     # Worker settings
     batch_size: int = 100
     read_timeout_ms: int = 1000
     metrics_update_interval: int = 15
+    pel_sample_size: int = 100  # oldest PEL entries inspected for delivery counts
+
+    # Rollups: events further than this behind a project's newest one are late (seconds)
+    rollup_allowed_lateness: int = 300
+    rollup_recompute_interval: float = 5.0  # seconds between recompute jobs
+    rollup_recompute_batch: int = 20  # dirty hours recomputed per job
 
     # Security
     secret_token: str = ""
@@ -1,19 +1,26 @@
+from collections.abc import AsyncIterator, Iterable, Sequence
 from typing import cast
 
 import asyncpg
 
+from infrastructure.database.postgres.connection import LazyConnection
+
 
 class PostgresBaseRepository:
-    def __init__(self, connection: asyncpg.Connection) -> None:
+    def __init__(self, connection: asyncpg.Connection | LazyConnection) -> None:
         self._connection = connection
 
-    async def execute(self, query: str, *args: object) -> None:
+    async def execute(self, query: str, *args: object) -> str:
         """Wrapper for (INSERT, UPDATE, DELETE)
 
         Attrs:
             query: SQL query in string format
+
+        Returns:
+            Command status tag, e.g. "INSERT 0 5"
         """
-        await self._connection.execute(query, *args)
+        result: str = await self._connection.execute(query, *args)
+        return result
 
     async def executemany(self, query: str, *args: object) -> None:
         """Wrapper for (INSERT, UPDATE, DELETE)
@@ -23,6 +30,20 @@ class PostgresBaseRepository:
         """
         await self._connection.executemany(query, *args)
 
+    async def copy_records(
+        self, table_name: str, records: Iterable[Sequence[object]], columns: Sequence[str]
+    ) -> str:
+        """Wrapper for binary COPY FROM STDIN
+
+        Attrs:
+            table_name: target table
+            records: rows as tuples in `columns` order
+        """
+        result: str = await self._connection.copy_records_to_table(
+            table_name, records=records, columns=columns
+        )
+        return result
+
     async def fetch_one(self, query: str, *args: object) -> asyncpg.Record | None:
         """Wrapper for get one row
 
@@ -39,3 +60,15 @@ class PostgresBaseRepository:
         """
         result = await self._connection.fetch(query, *args)
         return cast(list[asyncpg.Record], result)
+
+    async def iterate(
+        self, query: str, *args: object, prefetch: int
+    ) -> AsyncIterator[asyncpg.Record]:
+        """Wrapper for a server-side cursor (must run inside a transaction)
+
+        Attrs:
+            query: SQL query in string format
+            prefetch: rows fetched from the server per round trip
+        """
+        async for record in self._connection.cursor(query, *args, prefetch=prefetch):
+            yield record
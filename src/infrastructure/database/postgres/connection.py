@@ -0,0 +1,68 @@
+from collections.abc import Iterable, Sequence
+
+import asyncpg
+from asyncpg.cursor import CursorFactory
+
+
+class LazyConnection:
+    """Request-scoped handle that checks out a pool connection only when it is needed.
+
+    Outside a transaction every query borrows a connection from the pool for the duration
+    of that single query. A connection is pinned only between `acquire` and `release`,
+    which the unit of work does around a transaction.
+    """
+
+    def __init__(self, pool: asyncpg.Pool) -> None:
+        self._pool = pool
+        self._connection: asyncpg.Connection | None = None
+
+    @property
+    def is_acquired(self) -> bool:
+        return self._connection is not None
+
+    async def acquire(self) -> asyncpg.Connection:
+        """Pin a pool connection to this handle until `release` is called."""
+        if self._connection is None:
+            self._connection = await self._pool.acquire()
+        return self._connection
+
+    async def release(self) -> None:
+        """Return the pinned connection (if any) back to the pool."""
+        if self._connection is None:
+            return
+
+        connection, self._connection = self._connection, None
+        await self._pool.release(connection)
+
+    async def execute(self, query: str, *args: object) -> str:
+        result: str = await self._executor.execute(query, *args)
+        return result
+
+    async def executemany(self, query: str, *args: object) -> None:
+        await self._executor.executemany(query, *args)
+
+    async def copy_records_to_table(
+        self, table_name: str, *, records: Iterable[Sequence[object]], columns: Sequence[str]
+    ) -> str:
+        result: str = await self._executor.copy_records_to_table(
+            table_name, records=records, columns=columns
+        )
+        return result
+
+    async def fetchrow(self, query: str, *args: object) -> asyncpg.Record | None:
+        return await self._executor.fetchrow(query, *args)
+
+    async def fetch(self, query: str, *args: object) -> list[asyncpg.Record]:
+        result: list[asyncpg.Record] = await self._executor.fetch(query, *args)
+        return result
+
+    def cursor(self, query: str, *args: object, prefetch: int) -> CursorFactory:
+        # Server-side cursors live inside a transaction, so they need the pinned connection.
+        if self._connection is None:
+            raise RuntimeError("A cursor needs a pinned connection; use the unit of work")
+        return self._connection.cursor(query, *args, prefetch=prefetch)
+
+    @property
+    def _executor(self) -> asyncpg.Connection | asyncpg.Pool:
+        # asyncpg.Pool exposes the same query API and releases the connection right after.
+        return self._connection if self._connection is not None else self._pool
@@ -1,17 +1,27 @@
+from typing import Any
+
 import asyncpg
 import orjson
 
 
+def encode_json(value: Any) -> str:  # noqa: ANN401
+    return orjson.dumps(value).decode()
+
+
+def decode_json(value: str | bytes) -> Any:  # noqa: ANN401
+    return orjson.loads(value)
+
+
 async def init_postgres_connection(conn: asyncpg.Connection) -> None:
     await conn.set_type_codec(
         "jsonb",
-        encoder=lambda v: orjson.dumps(v).decode(),
-        decoder=orjson.loads,
+        encoder=encode_json,
+        decoder=decode_json,
         schema="pg_catalog",
     )
     await conn.set_type_codec(
         "json",
-        encoder=lambda v: orjson.dumps(v).decode(),
-        decoder=orjson.loads,
+        encoder=encode_json,
+        decoder=decode_json,
         schema="pg_catalog",
     )
@@ -1,15 +1,126 @@
 import dataclasses
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any, cast
 from uuid import UUID
 
 from domain.event.models import Event, Properties
+from domain.event.query import EventFilter
 from domain.exceptions.app import NotFoundError
 from domain.types import ProjectID
 from infrastructure.database.postgres.base import PostgresBaseRepository
+from infrastructure.database.postgres.init import encode_json
 from infrastructure.utils.retries import db_retry_policy
 
 
+def event_columns(events: list[Event]) -> tuple[list[Any], ...]:
+    """Column arrays for `INSERT ... SELECT FROM unnest(...)`, in `event` column order."""
+    return (
+        [event.event_id for event in events],
+        [event.project_id for event in events],
+        [event.user_id for event in events],
+        [event.session_id for event in events],
+        [event.event_type for event in events],
+        [event.timestamp for event in events],
+        [dataclasses.asdict(event.properties) for event in events],
+        [event.created_at for event in events],
+    )
+
+
+EVENT_COLUMNS = (
+    "event_id",
+    "project_id",
+    "user_id",
+    "session_id",
+    "event_type",
+    "timestamp",
+    "properties",
+    "created_at",
+)
+
+
+def event_records(events: list[Event]) -> list[tuple[Any, ...]]:
+    """Rows for binary COPY into the `event_import` staging table (properties as JSON text)."""
+    return [
+        (
+            event.event_id,
+            event.project_id,
+            event.user_id,
+            event.session_id,
+            event.event_type,
+            event.timestamp,
+            encode_json(dataclasses.asdict(event.properties)),
+            event.created_at,
+        )
+        for event in events
+    ]
+
+
+INSERT_EVENTS = """
+    INSERT INTO event(
+        event_id,
+        project_id,
+        user_id,
+        session_id,
+        event_type,
+        timestamp,
+        properties,
+        created_at
+    )
+    SELECT * FROM unnest(
+        $1::uuid[],
+        $2::uuid[],
+        $3::text[],
+        $4::text[],
+        $5::text[],
+        $6::timestamptz[],
+        $7::jsonb[],
+        $8::timestamptz[]
+    )
+    ON CONFLICT
+    DO NOTHING
+"""
+
+# Rows pulled from the server-side cursor per round trip while streaming
+STREAM_PREFETCH = 1_000
+
+
+def event_query(query: EventFilter, limit: int | None = None) -> tuple[str, list[object]]:
+    """`SELECT` for the filter in keyset order, with its positional arguments."""
+    args: list[object] = [query.project_id]
+
+    def param(value: object) -> str:
+        args.append(value)
+        return f"${len(args)}"
+
+    conditions = ["project_id = $1"]
+    if query.start is not None:
+        conditions.append(f"timestamp >= {param(query.start)}")
+    if query.end is not None:
+        conditions.append(f"timestamp < {param(query.end)}")
+    if query.event_types:
+        conditions.append(f"event_type = ANY({param(list(query.event_types))}::text[])")
+    if query.user_id is not None:
+        conditions.append(f"user_id = {param(query.user_id)}")
+    if query.session_id is not None:
+        conditions.append(f"session_id = {param(query.session_id)}")
+    if query.properties:
+        conditions.append(f"properties @> {param(dict(query.properties))}::jsonb")
+    if query.after is not None:
+        after = f"({param(query.after.timestamp)}, {param(query.after.event_id)})"
+        conditions.append(f"(timestamp, event_id) > {after}")
+
+    sql = f"""
+        SELECT {", ".join(EVENT_COLUMNS)}
+        FROM event
+        WHERE {" AND ".join(conditions)}
+        ORDER BY timestamp, event_id
+    """  # noqa: S608 - only placeholders are interpolated
+    if limit is not None:
+        sql += f"LIMIT {param(limit)}"
+    return sql, args
+
+
 class PostgresEventRepository(PostgresBaseRepository):
     @db_retry_policy
     async def add(self, event: Event) -> None:
@@ -40,8 +151,58 @@ class PostgresEventRepository(PostgresBaseRepository):
         )
 
     @db_retry_policy
-    async def add_many(self, events: list[Event]) -> None:
-        await self.executemany(
+    async def add_many(self, events: list[Event]) -> int:
+        """Insert events in one statement, skipping ones already stored.
+
+        Returns:
+            Number of rows actually inserted
+        """
+        status = await self.execute(INSERT_EVENTS, *event_columns(events))
+        # "INSERT <oid> <rows>"
+        return int(status.rsplit(" ", 1)[-1])
+
+    @db_retry_policy
+    async def add_new(self, events: list[Event]) -> list[Event]:
+        """Like `add_many`, but returns the events actually inserted (not already stored).
+
+        An id repeated within `events` is inserted once, so only its first copy is returned.
+        """
+        rows = await self.fetch_all(f"{INSERT_EVENTS} RETURNING event_id", *event_columns(events))
+        inserted = {row["event_id"] for row in rows}
+        new_events = []
+        for event in events:
+            if event.event_id in inserted:
+                inserted.discard(event.event_id)
+                new_events.append(event)
+        return new_events
+
+    async def copy_many(self, events: list[Event]) -> int:
+        """Bulk-load events with COPY, skipping ones already stored.
+
+        COPY cannot skip conflicts, so rows go to a session-local staging table first and
+        are moved with `INSERT ... ON CONFLICT DO NOTHING`. The staging table lives on the
+        connection, so call this inside a unit of work (one pinned connection).
+
+        Returns:
+            Number of rows actually inserted
+        """
+        await self.execute(
+            """
+                CREATE TEMP TABLE IF NOT EXISTS event_import(
+                    event_id UUID,
+                    project_id UUID,
+                    user_id TEXT,
+                    session_id TEXT,
+                    event_type TEXT,
+                    timestamp TIMESTAMPTZ,
+                    properties TEXT,
+                    created_at TIMESTAMPTZ
+                )
+            """
+        )
+        await self.execute("TRUNCATE event_import")
+        await self.copy_records("event_import", event_records(events), EVENT_COLUMNS)
+        status = await self.execute(
             """
                 INSERT INTO event(
                     event_id,
@@ -53,24 +214,21 @@ class PostgresEventRepository(PostgresBaseRepository):
                     properties,
                     created_at
                 )
-                VALUES($1, $2, $3, $4, $5, $6, $7::jsonb, $8)
+                SELECT
+                    event_id,
+                    project_id,
+                    user_id,
+                    session_id,
+                    event_type,
+                    timestamp,
+                    properties::jsonb,
+                    created_at
+                FROM event_import
                 ON CONFLICT
                 DO NOTHING
-            """,
-            [
-                (
-                    event.event_id,
-                    event.project_id,
-                    event.user_id,
-                    event.session_id,
-                    event.event_type,
-                    event.timestamp,
-                    dataclasses.asdict(event.properties),
-                    event.created_at,
-                )
-                for event in events
-            ],
+            """
         )
+        return int(status.rsplit(" ", 1)[-1])
 
     async def get_by_project_id(
         self, project_id: ProjectID, limit: int = 100, offset: int = 0
@@ -118,6 +276,15 @@ class PostgresEventRepository(PostgresBaseRepository):
 
         return self._map_row_to_entity(row)
 
+    async def stream(self, query: EventFilter, limit: int | None = None) -> AsyncIterator[Event]:
+        """Matching events ordered by `(timestamp, event_id)`, read through a server-side cursor.
+
+        Only `STREAM_PREFETCH` rows are held at a time, so call this inside a unit of work.
+        """
+        sql, args = event_query(query, limit)
+        async for row in self.iterate(sql, *args, prefetch=STREAM_PREFETCH):
+            yield self._map_row_to_entity(row)
+
     def _map_row_to_entity(self, row: dict[str, Any]) -> Event:
         return Event(
             event_id=cast(UUID, row["event_id"]),
@@ -0,0 +1,219 @@
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, cast
+
+from domain.event.types import EventType
+from domain.rollup.models import RollupBucket, RollupCount
+from domain.rollup.types import Granularity
+from domain.types import ProjectID
+from infrastructure.database.postgres.base import PostgresBaseRepository
+from infrastructure.utils.retries import db_retry_policy
+
+
+# Transaction-level advisory lock per project. Writers (incremental counts, dirty marks)
+# hold it shared; a recompute holds it exclusively, so it never reads raw events while
+# another transaction has uncommitted events or counts for the same project.
+LOCK_PROJECTS_SHARED = """
+    SELECT pg_advisory_xact_lock_shared(hashtextextended(project_id::text, 0))
+    FROM unnest($1::uuid[]) AS project_id
+    ORDER BY project_id
+"""
+LOCK_PROJECT = "SELECT pg_advisory_xact_lock(hashtextextended($1::uuid::text, 0))"
+
+
+class PostgresRollupRepository(PostgresBaseRepository):
+    @db_retry_policy
+    async def add(self, counts: list[RollupCount]) -> None:
+        """Add counts to their buckets, creating missing ones (rows are locked in list order)."""
+        if not counts:
+            return
+
+        await self.execute(LOCK_PROJECTS_SHARED, list({count.project_id for count in counts}))
+        await self.execute(
+            """
+                INSERT INTO event_rollup(project_id, granularity, bucket, event_type, count)
+                SELECT * FROM unnest(
+                    $1::uuid[],
+                    $2::text[],
+                    $3::timestamptz[],
+                    $4::text[],
+                    $5::bigint[]
+                )
+                ON CONFLICT (project_id, granularity, bucket, event_type)
+                DO UPDATE SET count = event_rollup.count + EXCLUDED.count
+            """,
+            [count.project_id for count in counts],
+            [count.granularity for count in counts],
+            [count.bucket for count in counts],
+            [count.event_type for count in counts],
+            [count.count for count in counts],
+        )
+
+    async def get_series(
+        self,
+        project_id: ProjectID,
+        granularity: Granularity,
+        start: datetime,
+        end: datetime,
+        event_types: tuple[EventType, ...] = (),
+    ) -> list[RollupCount]:
+        query = """
+            SELECT project_id, granularity, bucket, event_type, count
+            FROM event_rollup
+            WHERE project_id = $1
+                AND granularity = $2
+                AND bucket >= $3
+                AND bucket < $4
+                AND (cardinality($5::text[]) = 0 OR event_type = ANY($5::text[]))
+            ORDER BY bucket, event_type
+        """
+        rows = await self.fetch_all(query, project_id, granularity, start, end, list(event_types))
+        return [self._map_row_to_entity(row) for row in rows]
+
+    async def get_watermarks(self, project_ids: list[ProjectID]) -> dict[ProjectID, datetime]:
+        rows = await self.fetch_all(
+            "SELECT project_id, watermark FROM rollup_watermark WHERE project_id = ANY($1::uuid[])",
+            project_ids,
+        )
+        return {cast(ProjectID, row["project_id"]): row["watermark"] for row in rows}
+
+    async def advance_watermarks(self, watermarks: Mapping[ProjectID, datetime]) -> None:
+        """Move watermarks forward; an older value never replaces a newer one."""
+        if not watermarks:
+            return
+
+        project_ids = sorted(watermarks)
+        await self.execute(
+            """
+                INSERT INTO rollup_watermark(project_id, watermark)
+                SELECT * FROM unnest($1::uuid[], $2::timestamptz[])
+                ON CONFLICT (project_id) DO UPDATE
+                SET watermark = GREATEST(rollup_watermark.watermark, EXCLUDED.watermark),
+                    updated_at = now()
+            """,
+            project_ids,
+            [watermarks[project_id] for project_id in project_ids],
+        )
+
+    async def mark_dirty(self, buckets: list[RollupBucket]) -> None:
+        """Queue hours for recomputation; an hour already queued keeps its place."""
+        if not buckets:
+            return
+
+        await self.execute(LOCK_PROJECTS_SHARED, list({bucket.project_id for bucket in buckets}))
+        await self.execute(
+            """
+                INSERT INTO rollup_dirty(project_id, bucket)
+                SELECT * FROM unnest($1::uuid[], $2::timestamptz[])
+                ON CONFLICT (project_id, bucket) DO NOTHING
+            """,
+            [bucket.project_id for bucket in buckets],
+            [bucket.bucket for bucket in buckets],
+        )
+
+    async def get_dirty(self, limit: int) -> list[RollupBucket]:
+        """Oldest queued hours first."""
+        rows = await self.fetch_all(
+            "SELECT project_id, bucket FROM rollup_dirty ORDER BY marked_at LIMIT $1", limit
+        )
+        return [
+            RollupBucket(project_id=cast(ProjectID, row["project_id"]), bucket=row["bucket"])
+            for row in rows
+        ]
+
+    async def recompute(self, bucket: RollupBucket) -> bool:
+        """Rebuild one queued hour from raw events (must run inside a transaction).
+
+        Replaces the hour's minute and hour rows, then re-sums its day from the hour rows.
+        Returns False if the hour is no longer queued (another worker recomputed it).
+        """
+        hour_end = bucket.bucket + Granularity.HOUR.step
+        day = Granularity.DAY.truncate(bucket.bucket)
+        day_end = day + Granularity.DAY.step
+
+        await self.execute(LOCK_PROJECT, bucket.project_id)
+        queued = await self.fetch_one(
+            "DELETE FROM rollup_dirty WHERE project_id = $1 AND bucket = $2 RETURNING bucket",
+            bucket.project_id,
+            bucket.bucket,
+        )
+        if queued is None:
+            return False
+
+        await self.execute(
+            """
+                DELETE FROM event_rollup
+                WHERE project_id = $1
+                    AND granularity IN ('minute', 'hour')
+                    AND bucket >= $2
+                    AND bucket < $3
+            """,
+            bucket.project_id,
+            bucket.bucket,
+            hour_end,
+        )
+        await self.execute(
+            """
+                INSERT INTO event_rollup(project_id, granularity, bucket, event_type, count)
+                SELECT e.project_id, g.granularity, date_trunc(g.granularity, e.timestamp, 'UTC'),
+                    e.event_type, count(*)
+                FROM event e
+                CROSS JOIN (VALUES ('minute'), ('hour')) AS g(granularity)
+                WHERE e.project_id = $1
+                    AND e.timestamp >= $2
+                    AND e.timestamp < $3
+                    AND e.event_type IS NOT NULL
+                GROUP BY 1, 2, 3, 4
+            """,
+            bucket.project_id,
+            bucket.bucket,
+            hour_end,
+        )
+        await self.execute(
+            """
+                DELETE FROM event_rollup
+                WHERE project_id = $1 AND granularity = 'day' AND bucket = $2
+            """,
+            bucket.project_id,
+            day,
+        )
+        await self.execute(
+            """
+                INSERT INTO event_rollup(project_id, granularity, bucket, event_type, count)
+                SELECT project_id, 'day', $2::timestamptz, event_type, sum(count)
+                FROM event_rollup
+                WHERE project_id = $1
+                    AND granularity = 'hour'
+                    AND bucket >= $2
+                    AND bucket < $3
+                GROUP BY project_id, event_type
+            """,
+            bucket.project_id,
+            day,
+            day_end,
+        )
+        return True
+
+    async def get_complete_up_to(self, project_id: ProjectID) -> datetime | None:
+        """Watermark, held back to the earliest hour still queued for recomputation."""
+        row = await self.fetch_one(
+            """
+                SELECT LEAST(
+                    watermark,
+                    (SELECT min(bucket) FROM rollup_dirty WHERE project_id = $1)
+                ) AS complete_up_to
+                FROM rollup_watermark
+                WHERE project_id = $1
+            """,
+            project_id,
+        )
+        return row["complete_up_to"] if row else None
+
+    def _map_row_to_entity(self, row: dict[str, Any]) -> RollupCount:
+        return RollupCount(
+            project_id=cast(ProjectID, row["project_id"]),
+            granularity=Granularity(row["granularity"]),
+            bucket=cast(datetime, row["bucket"]),
+            event_type=EventType(row["event_type"]),
+            count=cast(int, row["count"]),
+        )
@@ -1,25 +1,41 @@
 from types import TracebackType
 
-import asyncpg
 from asyncpg.transaction import Transaction
 
 from domain.event.repository import IEventRepository
 from domain.project.repository import IProjectRepository
+from domain.rollup.repository import IRollupRepository
+from infrastructure.database.postgres.connection import LazyConnection
 from infrastructure.database.postgres.repositories.event import PostgresEventRepository
 from infrastructure.database.postgres.repositories.project import PostgresProjectRepository
+from infrastructure.database.postgres.repositories.rollup import PostgresRollupRepository
 
 
 class PostgresUnitOfWork:
-    def __init__(self, connection: asyncpg.Connection) -> None:
-        self._connection: asyncpg.Connection = connection
-        self._transaction: Transaction = None
+    """Unit of work over a lazily acquired connection.
+
+    Repositories used outside of `async with uow` run each query on a short-lived pool
+    connection. Entering the unit of work pins one connection for the transaction and
+    returns it to the pool on commit or rollback.
+    """
+
+    def __init__(self, connection: LazyConnection) -> None:
+        self._connection = connection
+        self._transaction: Transaction | None = None
 
         self.project: IProjectRepository = PostgresProjectRepository(connection)
         self.event: IEventRepository = PostgresEventRepository(connection)
+        self.rollup: IRollupRepository = PostgresRollupRepository(connection)
 
     async def __aenter__(self) -> "PostgresUnitOfWork":
-        self._transaction = self._connection.transaction()
-        await self._transaction.start()
+        connection = await self._connection.acquire()
+        self._transaction = connection.transaction()
+        try:
+            await self._transaction.start()
+        except BaseException:
+            self._transaction = None
+            await self._connection.release()
+            raise
         return self
 
     async def __aexit__(
@@ -28,17 +44,20 @@ class PostgresUnitOfWork:
         exc_value: BaseException | None,
         exc_tb: TracebackType,
     ) -> None:
-        if exc_value:
-            await self._transaction.rollback()
-        elif self._transaction:
-            await self.rollback()
+        await self.rollback()
 
     async def commit(self) -> None:
         if self._transaction:
-            await self._transaction.commit()
-            self._transaction = None
+            try:
+                await self._transaction.commit()
+            finally:
+                self._transaction = None
+                await self._connection.release()
 
     async def rollback(self) -> None:
         if self._transaction:
-            await self._transaction.rollback()
-            self._transaction = None
+            try:
+                await self._transaction.rollback()
+            finally:
+                self._transaction = None
+                await self._connection.release()
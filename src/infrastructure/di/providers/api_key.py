@@ -2,36 +2,36 @@ from dishka import Provider, Scope, provide
 from fastapi import Request
 
 from application.common.uow import IUnitOfWork
-from domain.cache.repository import Cache
-from domain.exceptions.app import UnauthorizedError
+from domain.cache.repository import ProjectCache
+from domain.project.models import ProjectIdentity
 from domain.types import ProjectID
 from infrastructure.config.settings import Settings
+from infrastructure.security.project_context import (
+    API_KEY_HEADER,
+    ProjectContext,
+    resolve_project_context,
+)
 
 
 class ApiKeyProvider(Provider):
     scope = Scope.REQUEST
 
     @provide
-    async def get_project_id(
+    async def get_project_context(
         self,
         request: Request,
         uow: IUnitOfWork,
-        cache: Cache,
+        project_cache: ProjectCache,
         settings: Settings,
-    ) -> ProjectID:
-        api_key = request.headers.get("X-Api-Key")
-        if not api_key:
-            raise UnauthorizedError("Missing API Key")
+    ) -> ProjectContext:
+        return await resolve_project_context(
+            request.headers.get(API_KEY_HEADER), settings, uow, project_cache
+        )
 
-        if not api_key.startswith(f"wk_{settings.app_env}"):
-            raise UnauthorizedError("Bad API Key")
-
-        cache_api_key = f"api_key:{api_key}"
-        if cached_project_id := await cache.get(cache_api_key):
-            return ProjectID(cached_project_id)
-
-        if project := await uow.project.get_by_api_key(api_key):
-            await cache.set(cache_api_key, project.project_id)
-            return project.project_id
+    @provide
+    def get_project(self, context: ProjectContext) -> ProjectIdentity:
+        return context.require()
 
-        raise UnauthorizedError("Invalid API Key")
+    @provide
+    def get_project_id(self, project: ProjectIdentity) -> ProjectID:
+        return project.project_id
@@ -4,6 +4,8 @@ from structlog import BoundLogger
 from application.common.uow import IUnitOfWork
 from application.event.services.ingest import IngestEventService
 from application.event.services.ingest_batch import IngestEventBatchService
+from application.event.services.query import QueryEventsService
+from application.event.services.series import GetTimeSeriesService
 from application.project.services.create import CreateProjectService
 from domain.event.producer import EventProducer
 from infrastructure.config.settings import Settings
@@ -36,3 +38,19 @@ class ApplicationProvider(Provider):
         settings: Settings,
     ) -> IngestEventBatchService:
         return IngestEventBatchService(producer, logger, settings)
+
+    @provide(scope=Scope.REQUEST)
+    async def get_query_events_service(
+        self,
+        uow: IUnitOfWork,
+        logger: BoundLogger,
+    ) -> QueryEventsService:
+        return QueryEventsService(uow, logger)
+
+    @provide(scope=Scope.REQUEST)
+    async def get_time_series_service(
+        self,
+        uow: IUnitOfWork,
+        logger: BoundLogger,
+    ) -> GetTimeSeriesService:
+        return GetTimeSeriesService(uow, logger)
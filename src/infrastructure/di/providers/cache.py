@@ -2,8 +2,10 @@ from collections.abc import AsyncIterable
 
 from dishka import Provider, Scope, provide
 from redis.asyncio import from_url
+from structlog import BoundLogger
 
-from domain.cache.repository import Cache
+from domain.cache.repository import Cache, ProjectCache
+from infrastructure.cache.project import TwoTierProjectCache
 from infrastructure.cache.redis import RedisCache
 from infrastructure.config.settings import Settings
 from infrastructure.di.providers.types import CacheRedis
@@ -25,3 +27,9 @@ class CacheProvider(Provider):
     @provide
     def get_cache(self, client: CacheRedis) -> Cache:
         return RedisCache(client)
+
+    @provide
+    def get_project_cache(
+        self, client: CacheRedis, settings: Settings, logger: BoundLogger
+    ) -> ProjectCache:
+        return TwoTierProjectCache(client, settings, logger)
@@ -5,6 +5,7 @@ from dishka import Provider, Scope, provide
 
 from application.common.uow import IUnitOfWork
 from infrastructure.config.settings import Settings
+from infrastructure.database.postgres.connection import LazyConnection
 from infrastructure.database.postgres.init import init_postgres_connection
 from infrastructure.database.postgres.uow import PostgresUnitOfWork
 
@@ -25,10 +26,14 @@ class DbProvider(Provider):
             await pool.close()
 
     @provide(scope=Scope.REQUEST)
-    async def get_connection(self, pool: asyncpg.Pool) -> AsyncGenerator[asyncpg.Connection]:
-        async with pool.acquire() as conn:
-            yield conn
+    async def get_connection(self, pool: asyncpg.Pool) -> AsyncGenerator[LazyConnection]:
+        connection = LazyConnection(pool)
+        try:
+            yield connection
+        finally:
+            # Safety net for a transaction that was never committed or rolled back.
+            await connection.release()
 
     @provide(scope=Scope.REQUEST)
-    async def get_uow(self, connection: asyncpg.Connection) -> IUnitOfWork:
+    async def get_uow(self, connection: LazyConnection) -> IUnitOfWork:
         return PostgresUnitOfWork(connection)
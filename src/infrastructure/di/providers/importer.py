@@ -0,0 +1,11 @@
+from dishka import Provider, Scope, provide
+from structlog import BoundLogger
+
+from application.common.uow import IUnitOfWork
+from application.importer.chunk import ImportChunkService
+
+
+class ImporterProvider(Provider):
+    @provide(scope=Scope.REQUEST)
+    def get_import_chunk_service(self, uow: IUnitOfWork, logger: BoundLogger) -> ImportChunkService:
+        return ImportChunkService(uow, logger)
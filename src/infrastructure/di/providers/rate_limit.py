@@ -1,23 +1,28 @@
 from dishka import Provider, Scope, provide
+from structlog import BoundLogger
 
-from application.common.uow import IUnitOfWork
-from domain.cache.repository import Cache
 from infrastructure.config.settings import Settings
+from infrastructure.di.providers.types import CacheRedis
 from infrastructure.rate_limit.dependencies import IPRateLimiter, PlanBasedRateLimiter
+from infrastructure.rate_limit.token_bucket import LocalTokenBuckets
+from infrastructure.security.project_context import ProjectContext
 from infrastructure.security.token_validators.secret_token_validator import SecretTokenValidator
 
 
 class RateLimitProvider(Provider):
     scope = Scope.REQUEST
 
+    @provide(scope=Scope.APP)
+    def get_token_buckets(
+        self, client: CacheRedis, settings: Settings, logger: BoundLogger
+    ) -> LocalTokenBuckets:
+        return LocalTokenBuckets(client, settings, logger)
+
     @provide
     def get_plan_based_limiter(
-        self,
-        settings: Settings,
-        uow: IUnitOfWork,
-        cache: Cache,
+        self, settings: Settings, context: ProjectContext, buckets: LocalTokenBuckets
     ) -> PlanBasedRateLimiter:
-        return PlanBasedRateLimiter(settings=settings, uow=uow, cache=cache)
+        return PlanBasedRateLimiter(settings=settings, context=context, buckets=buckets)
 
     @provide
     def get_ip_limiter(
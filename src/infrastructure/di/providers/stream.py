@@ -31,7 +31,9 @@ class StreamProvider(Provider):
         return RedisEventProducer(client)
 
     @provide(scope=Scope.REQUEST)
-    def get_consumer(self, client: StreamRedis, logger: BoundLogger) -> EventConsumer:
+    def get_consumer(
+        self, client: StreamRedis, logger: BoundLogger, settings: Settings
+    ) -> EventConsumer:
         import socket
 
         worker_name = socket.gethostname()
@@ -41,4 +43,5 @@ class StreamProvider(Provider):
             logger=logger,
             group_name="main_group",
             consumer_name=worker_name,
+            pel_sample_size=settings.pel_sample_size,
         )
@@ -5,6 +5,7 @@ from application.common.uow import IUnitOfWork
 from application.worker.batch_processor import BatchProcessor
 from application.worker.graceful_killer import GracefulKiller
 from application.worker.loop import WorkerLoop
+from application.worker.rollup_recompute import RollupRecomputer
 from domain.event.consumer import EventConsumer
 from infrastructure.config.settings import Settings
 
@@ -35,3 +36,13 @@ class WorkerProvider(Provider):
         settings: Settings,
     ) -> WorkerLoop:
         return WorkerLoop(processor, killer, logger, settings)
+
+    @provide(scope=Scope.REQUEST)
+    def get_rollup_recomputer(
+        self,
+        uow: IUnitOfWork,
+        killer: GracefulKiller,
+        logger: BoundLogger,
+        settings: Settings,
+    ) -> RollupRecomputer:
+        return RollupRecomputer(uow, killer, logger, settings)
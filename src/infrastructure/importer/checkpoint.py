@@ -0,0 +1,74 @@
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import orjson
+
+
+@dataclass(slots=True)
+class SourceProgress:
+    committed: int = 0  # every row offset below it is committed
+    spans: list[tuple[int, int]] = field(default_factory=list)  # sorted [start, end) above it
+
+
+class ImportCheckpoint:
+    """Committed row ranges per source file, persisted as JSON after every chunk.
+
+    Progress is kept in row offsets rather than chunk numbers, so a resumed import may use
+    a different chunk size. Chunks finish out of order when loaded in parallel, so each
+    source keeps a committed offset plus the disjoint committed spans above it, which stays
+    small however long the file is. The file is replaced atomically, so a crash leaves
+    either the old or the new state.
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        self._path = path
+        self._sources: dict[str, SourceProgress] = {}
+        if path is not None and path.exists():
+            for source, state in orjson.loads(path.read_bytes()).items():
+                self._sources[source] = SourceProgress(
+                    state["committed"], [(start, end) for start, end in state["spans"]]
+                )
+
+    def pending(self, source: str, start: int, end: int) -> list[tuple[int, int]]:
+        """Uncommitted parts of the row range [start, end)."""
+        progress = self._sources.get(source)
+        if progress is None:
+            return [(start, end)] if start < end else []
+
+        gaps = []
+        cursor = max(start, progress.committed)
+        for span_start, span_end in progress.spans:
+            if span_start >= end:
+                break
+            if span_start > cursor:
+                gaps.append((cursor, span_start))
+            cursor = max(cursor, span_end)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def mark_done(self, source: str, start: int, end: int) -> None:
+        progress = self._sources.setdefault(source, SourceProgress())
+        committed = progress.committed
+        spans: list[tuple[int, int]] = []
+        for span_start, span_end in sorted([*progress.spans, (start, end)]):
+            if span_start <= committed:
+                committed = max(committed, span_end)
+            elif spans and span_start <= spans[-1][1]:
+                spans[-1] = (spans[-1][0], max(spans[-1][1], span_end))
+            else:
+                spans.append((span_start, span_end))
+        progress.committed, progress.spans = committed, spans
+        self._save()
+
+    def _save(self) -> None:
+        if self._path is None:
+            return
+        data = {
+            source: {"committed": progress.committed, "spans": progress.spans}
+            for source, progress in self._sources.items()
+        }
+        tmp = self._path.with_name(f"{self._path.name}.tmp")
+        tmp.write_bytes(orjson.dumps(data))
+        os.replace(tmp, self._path)
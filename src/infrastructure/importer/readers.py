@@ -0,0 +1,130 @@
+"""Row readers for the offline importer.
+
+Every reader yields `(row_number, row)` with 1-based row numbers (data rows, header excluded)
+and leaves validation to the caller. A row that cannot be decoded is yielded as `None` so it
+is rejected with its row number instead of aborting a long import.
+"""
+
+import csv
+import gzip
+import io
+from collections.abc import Iterator
+from enum import StrEnum
+from pathlib import Path
+from typing import IO, Any, cast
+
+import orjson
+
+
+type Row = dict[str, Any] | None
+
+PROPERTIES_PREFIX = "properties."
+PARQUET_BATCH_ROWS = 10_000
+
+
+class FileFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+SUFFIXES = {
+    ".ndjson": FileFormat.NDJSON,
+    ".jsonl": FileFormat.NDJSON,
+    ".json": FileFormat.NDJSON,
+    ".csv": FileFormat.CSV,
+    ".parquet": FileFormat.PARQUET,
+}
+
+
+def detect_format(path: Path) -> FileFormat:
+    """Format from the file suffix, ignoring a trailing `.gz`."""
+    suffixes = [suffix for suffix in path.suffixes if suffix != ".gz"]
+    if suffixes and suffixes[-1].lower() in SUFFIXES:
+        return SUFFIXES[suffixes[-1].lower()]
+    raise ValueError(f"Cannot detect format of {path}; pass it explicitly")
+
+
+def read_rows(path: Path, file_format: FileFormat | None = None) -> Iterator[tuple[int, Row]]:
+    match file_format or detect_format(path):
+        case FileFormat.NDJSON:
+            return read_ndjson(path)
+        case FileFormat.CSV:
+            return read_csv(path)
+        case FileFormat.PARQUET:
+            return read_parquet(path)
+
+
+def read_ndjson(path: Path) -> Iterator[tuple[int, Row]]:
+    with _open_binary(path) as file:
+        number = 0
+        for line in file:
+            if not line.strip():
+                continue
+            number += 1
+            try:
+                row = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                row = None
+            yield number, row if isinstance(row, dict) else None
+
+
+def read_csv(path: Path) -> Iterator[tuple[int, Row]]:
+    """CSV with a header; `properties` holds a JSON object and/or `properties.<name>` columns."""
+    with io.TextIOWrapper(_open_binary(path), encoding="utf-8", newline="") as file:
+        for number, record in enumerate(csv.DictReader(file), start=1):
+            yield number, _csv_row(record)
+
+
+def read_parquet(path: Path) -> Iterator[tuple[int, Row]]:
+    """Parquet via pyarrow (optional dependency); `properties` may be a struct or JSON text."""
+    try:
+        import pyarrow.parquet as pq  # type: ignore[import-not-found, unused-ignore]
+    except ImportError as e:
+        raise RuntimeError("Reading Parquet requires pyarrow: pip install pyarrow") from e
+
+    number = 0
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=PARQUET_BATCH_ROWS):
+        for record in batch.to_pylist():
+            number += 1
+            yield number, _nested_properties(record)
+
+
+def _open_binary(path: Path) -> IO[bytes]:
+    if path.suffix == ".gz":
+        return cast(IO[bytes], gzip.open(path, "rb"))
+    return path.open("rb")
+
+
+def _csv_row(record: dict[str, str]) -> Row:
+    row: dict[str, Any] = {}
+    properties: dict[str, Any] = {}
+    for key, value in record.items():
+        if value is None or value == "":
+            continue
+        if key.startswith(PROPERTIES_PREFIX):
+            properties[key.removeprefix(PROPERTIES_PREFIX)] = value
+        elif key == "properties":
+            try:
+                decoded = orjson.loads(value)
+            except orjson.JSONDecodeError:
+                return None
+            if not isinstance(decoded, dict):
+                return None
+            properties.update(decoded)
+        else:
+            row[key] = value
+    row["properties"] = properties
+    return row
+
+
+def _nested_properties(record: dict[str, Any]) -> Row:
+    properties = record.get("properties")
+    if isinstance(properties, str | bytes):
+        try:
+            properties = orjson.loads(properties)
+        except orjson.JSONDecodeError:
+            return None
+    if isinstance(properties, dict):
+        properties = {key: value for key, value in properties.items() if value is not None}
+    return {**record, "properties": properties or {}}
@@ -0,0 +1,61 @@
+import random
+from collections.abc import Callable, Mapping
+
+import structlog
+from structlog.types import EventDict, WrappedLogger
+
+
+# Method names of warning and above; these entries are never sampled away.
+ALWAYS_LOGGED = frozenset(("warning", "warn", "error", "exception", "critical", "fatal"))
+
+
+def _is_important(method_name: str, event_dict: EventDict) -> bool:
+    return method_name in ALWAYS_LOGGED or event_dict.get("status_code", 0) >= 500
+
+
+class EventSampler:
+    """Keep only a share of the entries for noisy event names.
+
+    `rates` maps an event name to the share of its entries that is kept, e.g.
+    `{"request_completed": 0.01}`. Warnings, errors and 5xx responses are always kept,
+    and kept entries carry `sample_rate` so counts can be scaled back up.
+    """
+
+    def __init__(
+        self, rates: Mapping[str, float], rand: Callable[[], float] = random.random
+    ) -> None:
+        self._rates = dict(rates)
+        self._rand = rand
+
+    def __call__(self, logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+        rate = self._rates.get(event_dict.get("event", ""))
+        if rate is None or rate >= 1 or _is_important(method_name, event_dict):
+            return event_dict
+
+        if self._rand() >= rate:
+            raise structlog.DropEvent
+
+        event_dict["sample_rate"] = rate
+        return event_dict
+
+
+class WarningCallsiteAdder:
+    """Add file, function and line only to warnings and above.
+
+    Walking the stack for every info entry is the most expensive step of the chain.
+    """
+
+    def __init__(self) -> None:
+        self._adder = structlog.processors.CallsiteParameterAdder(
+            {
+                structlog.processors.CallsiteParameter.FILENAME,
+                structlog.processors.CallsiteParameter.FUNC_NAME,
+                structlog.processors.CallsiteParameter.LINENO,
+            },
+            additional_ignores=[__name__],
+        )
+
+    def __call__(self, logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+        if method_name in ALWAYS_LOGGED:
+            return self._adder(logger, method_name, event_dict)
+        return event_dict
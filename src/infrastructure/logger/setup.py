@@ -1,10 +1,24 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 import structlog
 from structlog.types import Processor
 
 from infrastructure.config.settings import settings
+from infrastructure.logger.processors import EventSampler, WarningCallsiteAdder
+
+
+_listener: QueueListener | None = None
+
+
+class RecordQueueHandler(QueueHandler):
+    """Queue records untouched so that formatting runs on the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
 
 def configure_logger() -> None:
@@ -18,7 +32,25 @@ def configure_logger() -> None:
 
     handler = logging.StreamHandler(stream=sys.stdout)
     handler.setFormatter(formatter)
-    root_logger.addHandler(handler)
+
+    if settings.log_async:
+        root_logger.addHandler(start_queue_listener(handler))
+    else:
+        root_logger.addHandler(handler)
+
+
+def start_queue_listener(handler: logging.Handler) -> QueueHandler:
+    """Write records from a background thread so logging never blocks on stdout."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    return RecordQueueHandler(log_queue)
 
 
 def configure_structlogger() -> structlog.stdlib.ProcessorFormatter:
@@ -35,7 +67,13 @@ def configure_structlogger() -> structlog.stdlib.ProcessorFormatter:
 
     # Configure structlog
     structlog.configure(
-        processors=[*shared_processors, renderer_processor],
+        processors=[
+            # Drop sampled-out entries before any other work is done for them
+            EventSampler(settings.log_sample_rates),
+            *shared_processors,
+            # Rendering is left to the handler's formatter (a background thread in async mode)
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.make_filtering_bound_logger(settings.log_level),
         cache_logger_on_first_use=True,
@@ -61,12 +99,6 @@ def create_shared_configuration() -> list[Processor]:
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.StackInfoRenderer(),
-        structlog.processors.CallsiteParameterAdder(
-            {
-                structlog.processors.CallsiteParameter.FILENAME,
-                structlog.processors.CallsiteParameter.FUNC_NAME,
-                structlog.processors.CallsiteParameter.LINENO,
-            },
-        ),
+        WarningCallsiteAdder(),  # Call-site info only for warnings and above
         structlog.processors.format_exc_info,  # Tracebacks -> text
     ]
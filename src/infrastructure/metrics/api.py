@@ -0,0 +1,24 @@
+from prometheus_client import Counter, Histogram
+
+
+# Counters
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "Total number of HTTP requests by method, status class and route template",
+    ["method", "status", "handler"],
+)
+
+# Histograms
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling an HTTP request, including error mapping",
+    ["method", "handler"],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+)
+
+
+def observe_request(method: str, handler: str, status_code: int, duration: float) -> None:
+    HTTP_REQUESTS.labels(method, f"{status_code // 100}xx", handler).inc()
+    HTTP_REQUEST_DURATION.labels(method, handler).observe(duration)
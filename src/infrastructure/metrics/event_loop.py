@@ -0,0 +1,81 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Callable
+
+from prometheus_client import Histogram
+from structlog import BoundLogger
+
+
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop resumed a sleeping task (time the loop was busy elsewhere)",
+    buckets=[0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+
+
+class EventLoopMonitor:
+    """Samples event loop lag by sleeping for a fixed interval and measuring the overshoot.
+
+    With `block_threshold` set, a watchdog thread also logs the loop thread's stack
+    whenever the loop has not come back to the monitor for longer than the threshold,
+    which points at the callback holding it.
+    """
+
+    def __init__(
+        self,
+        logger: BoundLogger,
+        interval: float = 0.5,
+        block_threshold: float | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._logger = logger.bind(component="event_loop_monitor")
+        self._block_threshold = block_threshold
+        self._clock = clock
+        # The watchdog can only see a stall once the monitor misses a heartbeat
+        self._interval = min(interval, block_threshold / 2) if block_threshold else interval
+        self._heartbeat = clock()
+        self._stopped = threading.Event()
+
+    async def run(self) -> None:
+        if self._block_threshold is not None:
+            self._start_watchdog(threading.get_ident(), self._block_threshold)
+
+        try:
+            while True:
+                started = self._clock()
+                await asyncio.sleep(self._interval)
+                self._heartbeat = self._clock()
+                EVENT_LOOP_LAG.observe(max(self._heartbeat - started - self._interval, 0.0))
+        finally:
+            self._stopped.set()
+
+    def _start_watchdog(self, loop_thread_id: int, threshold: float) -> None:
+        self._stopped.clear()
+        self._heartbeat = self._clock()
+        threading.Thread(
+            target=self._watch,
+            args=(loop_thread_id, threshold),
+            name="event-loop-watchdog",
+            daemon=True,
+        ).start()
+
+    def _watch(self, loop_thread_id: int, threshold: float) -> None:
+        reported_heartbeat: float | None = None
+
+        while not self._stopped.wait(threshold / 2):
+            heartbeat = self._heartbeat
+            blocked_for = self._clock() - heartbeat - self._interval
+            if blocked_for < threshold or heartbeat == reported_heartbeat:
+                continue
+
+            # One report per stall, taken while the offending code is still on the stack
+            reported_heartbeat = heartbeat
+            frame = sys._current_frames().get(loop_thread_id)
+            self._logger.warning(
+                "event_loop_blocked",
+                blocked_for=round(blocked_for, 3),
+                stack="".join(traceback.format_stack(frame)) if frame else None,
+            )
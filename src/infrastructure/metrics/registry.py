@@ -0,0 +1,31 @@
+import os
+
+from prometheus_client import REGISTRY, CollectorRegistry, multiprocess
+
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def is_multiprocess() -> bool:
+    """Metrics are written to mmap files shared by all processes of the service.
+
+    The variable has to be set before the process starts: prometheus_client picks
+    the value storage when it is imported.
+    """
+    return bool(os.environ.get(MULTIPROC_DIR_ENV))
+
+
+def exposition_registry() -> CollectorRegistry:
+    """Registry to serve on a scrape: in multiprocess mode it aggregates every process."""
+    if not is_multiprocess():
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+    return registry
+
+
+def mark_process_dead(pid: int | None = None) -> None:
+    """Drop live gauges of an exited process from the shared metrics directory."""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(pid if pid is not None else os.getpid())  # type: ignore[no-untyped-call]
@@ -1,4 +1,11 @@
-from prometheus_client import Counter, Gauge, Histogram, start_http_server
+import threading
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+from prometheus_client import Counter, Gauge, Histogram, make_wsgi_app
+from prometheus_client.exposition import ThreadingWSGIServer
+
+from infrastructure.metrics.registry import exposition_registry
+from infrastructure.profiling.wsgi import with_profiler
 
 
 # Counters
@@ -12,6 +19,22 @@ PROCESSING_ERRORS = Counter(
     "worker_processing_errors_total", "Total number of processing errors", ["error_type"]
 )
 
+ROWS_WRITTEN = Counter(
+    "worker_rows_written_total",
+    "Events written to Postgres by outcome (inserted or deduplicated by ON CONFLICT)",
+    ["result"],
+)
+
+ROLLUP_LATE_EVENTS = Counter(
+    "worker_rollup_late_events_total",
+    "Inserted events older than their project's watermark, left to bucket recomputation",
+)
+
+ROLLUP_BUCKETS_RECOMPUTED = Counter(
+    "worker_rollup_buckets_recomputed_total",
+    "Dirty rollup hours rebuilt from raw events",
+)
+
 # Histograms
 
 BATCH_PROCESSING_TIME = Histogram(
@@ -20,17 +43,96 @@ BATCH_PROCESSING_TIME = Histogram(
     buckets=[0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0],
 )
 
+# read: XREADGROUP incl. block wait, decode: msgpack -> Event,
+# insert/rollup/commit: Postgres, ack: XACK
+BATCH_STAGE_DURATION = Histogram(
+    "worker_batch_stage_seconds",
+    "Time spent in each stage of batch processing",
+    ["stage"],
+    buckets=[0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+
+BATCH_SIZE = Histogram(
+    "worker_batch_size",
+    "Number of events in each non-empty batch read from the stream",
+    buckets=[1, 5, 10, 25, 50, 100, 250, 500, 1000],
+)
+
+INGEST_TO_COMMIT_LATENCY = Histogram(
+    "worker_ingest_to_commit_seconds",
+    "Time from event creation in the API to its commit in Postgres",
+    ["plan"],
+    buckets=[0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0],
+)
+
 # Gauges
 
 # Lag.
 CONSUMER_LAG = Gauge(
     "worker_consumer_group_lag",
     "Approximate number of pending messages in the stream for this group",
+    multiprocess_mode="mostrecent",
+)
+
+# Age of the oldest message not yet acked by the group (pending or undelivered)
+OLDEST_UNACKED_AGE = Gauge(
+    "worker_oldest_unacked_age_seconds",
+    "Age of the oldest message in the stream that the consumer group has not acked",
+    multiprocess_mode="mostrecent",
+)
+
+# Oldest entry in the PEL (delivered, not acked)
+OLDEST_PENDING_AGE = Gauge(
+    "worker_oldest_pending_age_seconds",
+    "Age of the oldest entry in the consumer group's pending entries list",
+    multiprocess_mode="mostrecent",
+)
+
+# Per-consumer PEL
+CONSUMER_PENDING = Gauge(
+    "worker_consumer_pending",
+    "Number of pending (delivered, not acked) entries per consumer",
+    ["consumer"],
+    multiprocess_mode="mostrecent",
+)
+
+CONSUMER_IDLE = Gauge(
+    "worker_consumer_idle_seconds",
+    "Time since each consumer last interacted with the group",
+    ["consumer"],
+    multiprocess_mode="mostrecent",
+)
+
+# Head sample: only the oldest pel_sample_size PEL entries, not the whole PEL
+OLDEST_PENDING_DELIVERY_COUNT = Gauge(
+    "worker_oldest_pending_delivery_count",
+    "Number of entries among the oldest pel_sample_size pending entries by times delivered",
+    ["deliveries"],
+    multiprocess_mode="mostrecent",
+)
+
+# Stream memory
+STREAM_MEMORY = Gauge(
+    "worker_stream_memory_bytes",
+    "Memory used by the events stream as reported by MEMORY USAGE",
+    multiprocess_mode="mostrecent",
 )
 
 # DLQ size
-DLQ_SIZE = Gauge("worker_dlq_size", "Current number of messages in the Dead Letter Queue stream")
+DLQ_SIZE = Gauge(
+    "worker_dlq_size",
+    "Current number of messages in the Dead Letter Queue stream",
+    multiprocess_mode="mostrecent",
+)
+
+
+class _SilentHandler(WSGIRequestHandler):
+    def log_message(self, format: str, *args: object) -> None:
+        """Scrapes are not worth an access log line each."""
 
 
-def start_metrics_server(port: int = 8001) -> None:
-    start_http_server(port)
+def start_metrics_server(port: int = 8001, secret_token: str = "") -> None:
+    """Serve /metrics (and the token-guarded /admin/profile) from a daemon thread."""
+    app = with_profiler(make_wsgi_app(exposition_registry()), secret_token)
+    server = make_server("0.0.0.0", port, app, ThreadingWSGIServer, handler_class=_SilentHandler)  # noqa: S104
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
@@ -0,0 +1,58 @@
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+
+from domain.exceptions.app import ConflictError
+
+
+MAX_PROFILE_SECONDS = 60
+DEFAULT_INTERVAL = 0.01  # 100 Hz
+
+_profile_lock = threading.Lock()
+
+
+def profile(seconds: float, interval: float = DEFAULT_INTERVAL) -> str:
+    """Sample the stacks of every thread for `seconds` and return them in collapsed format.
+
+    Blocks the calling thread, so call it off the event loop (`asyncio.to_thread`).
+    Only one profile runs per process at a time.
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ConflictError(message="A profile is already running")
+    try:
+        return render_collapsed(sample_stacks(seconds, interval))
+    finally:
+        _profile_lock.release()
+
+
+def sample_stacks(seconds: float, interval: float = DEFAULT_INTERVAL) -> Counter[str]:
+    """Count how often each distinct stack was seen, skipping the sampling thread itself."""
+    own_thread = threading.get_ident()
+    deadline = time.monotonic() + seconds
+    counts: Counter[str] = Counter()
+
+    while time.monotonic() < deadline:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id != own_thread:
+                counts[collapse(names.get(thread_id, str(thread_id)), frame)] += 1
+        time.sleep(interval)
+
+    return counts
+
+
+def collapse(thread_name: str, frame: FrameType | None) -> str:
+    """`thread;module:function;...` from the outermost frame to the innermost."""
+    functions = []
+    while frame is not None:
+        code = frame.f_code
+        functions.append(f"{frame.f_globals.get('__name__', code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join([thread_name, *reversed(functions)])
+
+
+def render_collapsed(counts: Counter[str]) -> str:
+    """One `stack count` line per stack, as read by flamegraph.pl, speedscope and inferno."""
+    return "".join(f"{stack} {count}\n" for stack, count in counts.most_common())
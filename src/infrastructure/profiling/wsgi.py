@@ -0,0 +1,53 @@
+import secrets
+from collections.abc import Iterable
+from urllib.parse import parse_qs
+from wsgiref.types import StartResponse, WSGIApplication, WSGIEnvironment
+
+from domain.exceptions.app import ConflictError
+from infrastructure.profiling.sampler import DEFAULT_INTERVAL, MAX_PROFILE_SECONDS, profile
+
+
+PROFILE_PATH = "/admin/profile"
+
+
+def with_profiler(app: WSGIApplication, secret_token: str) -> WSGIApplication:
+    """Serve `GET /admin/profile` next to `app`, guarded by the same Bearer token as the API.
+
+    Mirrors the API endpoint for processes that only expose a WSGI metrics server. Each
+    request runs in its own server thread, so sampling does not stop the process's event loop.
+    """
+
+    def dispatch(environ: WSGIEnvironment, start_response: StartResponse) -> Iterable[bytes]:
+        if environ.get("PATH_INFO") != PROFILE_PATH:
+            return app(environ, start_response)
+
+        status, body = _profile_response(environ, secret_token)
+        start_response(status, [("Content-Type", "text/plain; charset=utf-8")])
+        return [body.encode()]
+
+    return dispatch
+
+
+def _profile_response(environ: WSGIEnvironment, secret_token: str) -> tuple[str, str]:
+    authorization = environ.get("HTTP_AUTHORIZATION", "")
+    if not secret_token or not secrets.compare_digest(
+        authorization.encode(), f"Bearer {secret_token}".encode()
+    ):
+        return "403 Forbidden", "Invalid secret token\n"
+
+    query = parse_qs(environ.get("QUERY_STRING", ""))
+    try:
+        seconds = float(query.get("seconds", ["10"])[0])
+        interval_ms = float(query.get("interval_ms", [str(DEFAULT_INTERVAL * 1000)])[0])
+    except ValueError:
+        return "400 Bad Request", "seconds and interval_ms must be numbers\n"
+    if not 0 < seconds <= MAX_PROFILE_SECONDS or not 1 <= interval_ms <= 1000:
+        return (
+            "400 Bad Request",
+            f"seconds must be in (0, {MAX_PROFILE_SECONDS}], interval_ms in [1, 1000]\n",
+        )
+
+    try:
+        return "200 OK", profile(seconds, interval_ms / 1000)
+    except ConflictError as e:
+        return "409 Conflict", f"{e.message}\n"
@@ -9,3 +9,21 @@ def get_plan_rate_limit(plan: Plan, settings: Settings) -> int:
         Plan.PRO: settings.rate_limit_pro_rpm,
         Plan.ENTERPRISE: settings.rate_limit_enterprise_rpm,
     }.get(plan, settings.rate_limit_no_auth_rpm)
+
+
+def get_plan_event_rate_limit(plan: Plan, settings: Settings) -> int:
+    """Return admitted events per minute based on plan."""
+    return {
+        Plan.FREE: settings.rate_limit_free_events_per_minute,
+        Plan.PRO: settings.rate_limit_pro_events_per_minute,
+        Plan.ENTERPRISE: settings.rate_limit_enterprise_events_per_minute,
+    }.get(plan, settings.rate_limit_free_events_per_minute)
+
+
+def get_plan_byte_rate_limit(plan: Plan, settings: Settings) -> int:
+    """Return ingested request bytes per minute based on plan."""
+    return {
+        Plan.FREE: settings.rate_limit_free_bytes_per_minute,
+        Plan.PRO: settings.rate_limit_pro_bytes_per_minute,
+        Plan.ENTERPRISE: settings.rate_limit_enterprise_bytes_per_minute,
+    }.get(plan, settings.rate_limit_free_bytes_per_minute)
@@ -1,72 +1,79 @@
 from fastapi import Request, Response
 from fastapi_limiter.depends import RateLimiter
 
-from application.common.uow import IUnitOfWork
-from domain.cache.repository import Cache
 from domain.exceptions.app import RateLimitExceededError
 from infrastructure.config.settings import Settings
-from infrastructure.rate_limit.config import get_plan_rate_limit
+from infrastructure.rate_limit.config import (
+    get_plan_byte_rate_limit,
+    get_plan_event_rate_limit,
+    get_plan_rate_limit,
+)
+from infrastructure.rate_limit.token_bucket import Charge, LocalTokenBuckets
+from infrastructure.security.project_context import ProjectContext
 from infrastructure.security.token_validators.secret_token_validator import SecretTokenValidator
 
 
+# Retry-After sent with every 429: limits are per minute, whichever check rejected the request
+RETRY_AFTER_SECONDS = 60
+
+
 class PlanBasedRateLimiter:
     """Rate limiter for event endpoints based on project plan.
 
     If a valid API key is provided, applies plan-based rate limiting.
     If no API key or invalid key, falls back to IP-based rate limiting.
+    Checks run against in-process token buckets that are reconciled with Redis
+    in the background.
+
+    On top of the per-request limit, ingestion endpoints call `charge_events` once the
+    body is validated, charging the plan's event and byte budgets for what is admitted.
     """
 
-    def __init__(self, settings: Settings, uow: IUnitOfWork, cache: Cache) -> None:
+    def __init__(
+        self, settings: Settings, context: ProjectContext, buckets: LocalTokenBuckets
+    ) -> None:
         self._settings = settings
-        self._uow = uow
-        self._cache = cache
+        self._context = context
+        self._buckets = buckets
 
     async def __call__(self, request: Request, response: Response) -> None:
         if not self._settings.is_rate_limit_enabled:
             return
 
-        api_key = request.headers.get("X-Api-Key")
-        identifier_str, rpm = await self._get_identifier_and_rpm(api_key, request)
-
-        async def get_identifier(request: Request) -> str:
-            return identifier_str
+        identifier, rpm = self._get_identifier_and_rpm(request)
 
-        limiter = RateLimiter(
-            times=rpm,
-            seconds=60,
-            identifier=get_identifier,
-        )
+        if self._buckets.consume(identifier, rpm):
+            raise RateLimitExceededError(retry_after=RETRY_AFTER_SECONDS)
 
-        try:
-            await limiter(request, response)
-        except Exception as exc:
-            if hasattr(exc, "detail") and "Too Many Requests" in str(exc.detail):
-                raise RateLimitExceededError(retry_after=60) from exc
-            raise
+    async def charge_events(self, request: Request, events: int) -> None:
+        """Charge admitted events and request bytes against the project's plan budgets."""
+        project = self._context.project
+        if not self._settings.is_rate_limit_enabled or project is None:
+            return
 
-    async def _get_identifier_and_rpm(
-        self, api_key: str | None, request: Request
-    ) -> tuple[str, int]:
+        identifier = f"project:{project.project_id}"
+        size = len(await request.body())
+        charges = [
+            Charge(
+                f"events:{identifier}",
+                get_plan_event_rate_limit(project.plan, self._settings),
+                events,
+            ),
+            Charge(
+                f"bytes:{identifier}", get_plan_byte_rate_limit(project.plan, self._settings), size
+            ),
+        ]
+
+        if self._buckets.consume_all(charges):
+            raise RateLimitExceededError(retry_after=RETRY_AFTER_SECONDS)
+
+    def _get_identifier_and_rpm(self, request: Request) -> tuple[str, int]:
         """Get rate limit identifier and requests per minute."""
-        if not api_key or not api_key.startswith(f"wk_{self._settings.app_env}"):
-            return self._get_ip_identifier(request), self._settings.rate_limit_no_auth_rpm
-
-        # Try to get project from cache
-        cache_api_key = f"api_key:{api_key}"
-        if cached_project_id := await self._cache.get(cache_api_key):
-            project = await self._uow.project.get_by_id(cached_project_id)
-            if project:
-                rpm = get_plan_rate_limit(project.plan, self._settings)
-                return f"project:{project.project_id}", rpm
-
-        # Try to get project from database
-        project = await self._uow.project.get_by_api_key(api_key)
-        if project:
-            await self._cache.set(api_key, project.project_id)
+        if project := self._context.project:
             rpm = get_plan_rate_limit(project.plan, self._settings)
             return f"project:{project.project_id}", rpm
 
-        # Invalid API key - fallback to IP-based limit
+        # Missing or invalid API key - fallback to IP-based limit
         return self._get_ip_identifier(request), self._settings.rate_limit_no_auth_rpm
 
     def _get_ip_identifier(self, request: Request) -> str:
@@ -110,7 +117,7 @@ class IPRateLimiter:
             await limiter(request, response)
         except Exception as exc:
             if hasattr(exc, "detail") and "Too Many Requests" in str(exc.detail):
-                raise RateLimitExceededError(retry_after=60) from exc
+                raise RateLimitExceededError(retry_after=RETRY_AFTER_SECONDS) from exc
             raise
 
     def _is_authorized(self, request: Request) -> bool:
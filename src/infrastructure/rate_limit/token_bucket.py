@@ -0,0 +1,171 @@
+import asyncio
+import math
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from structlog import BoundLogger
+
+from infrastructure.config.settings import Settings
+from infrastructure.di.providers.types import CacheRedis
+
+
+@dataclass(frozen=True, slots=True)
+class Charge:
+    identifier: str
+    limit_per_minute: int
+    cost: int = 1
+
+
+@dataclass(slots=True)
+class TokenBucket:
+    capacity: float
+    refill_per_second: float
+    tokens: float
+    updated_at: float
+
+    @classmethod
+    def per_minute(cls, limit: int, now: float) -> "TokenBucket":
+        return cls(capacity=limit, refill_per_second=limit / 60, tokens=limit, updated_at=now)
+
+    def take(self, cost: int, now: float) -> float:
+        """Take `cost` tokens and return 0, or return seconds until they are available."""
+        if wait := self.wait_for(cost, now):
+            return wait
+        self.tokens -= min(cost, self.capacity)
+        return 0.0
+
+    def wait_for(self, cost: int, now: float) -> float:
+        """Seconds until `cost` tokens are available; a cost above capacity needs a full bucket."""
+        self._refill(now)
+        needed = min(cost, self.capacity)
+        if self.tokens >= needed:
+            return 0.0
+        return (needed - self.tokens) / self.refill_per_second
+
+    def drain(self, amount: int, now: float) -> None:
+        """Remove tokens spent elsewhere, going into debt of at most one full bucket."""
+        self._refill(now)
+        self.tokens = max(self.tokens - amount, -self.capacity)
+
+    def resize(self, limit: int) -> None:
+        if limit != self.capacity:
+            self.capacity = limit
+            self.refill_per_second = limit / 60
+            self.tokens = min(self.tokens, self.capacity)
+
+    def is_idle(self, now: float, idle_after: float) -> bool:
+        return now - self.updated_at >= idle_after
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+            self.updated_at = now
+
+
+class LocalTokenBuckets:
+    """Per-process token buckets kept roughly in line with the other API replicas.
+
+    Limit checks are answered from memory. Tokens consumed locally are flushed to a
+    Redis counter per identifier every `rate_limit_sync_interval` seconds, and whatever
+    the other replicas consumed since the previous sync is drained from the local bucket.
+    """
+
+    def __init__(
+        self,
+        redis: CacheRedis,
+        settings: Settings,
+        logger: BoundLogger,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._redis = redis
+        self._sync_interval = settings.rate_limit_sync_interval
+        self._idle_after = settings.rate_limit_bucket_idle_ttl
+        self._clock = clock
+        self._logger = logger.bind(component="rate_limit_sync")
+
+        self._buckets: dict[str, TokenBucket] = {}
+        self._pending: dict[str, int] = {}
+        self._seen: dict[str, int] = {}
+
+    def consume(self, identifier: str, limit_per_minute: int, cost: int = 1) -> int:
+        """Charge `cost` tokens; return 0 when allowed, otherwise seconds until they refill."""
+        return self.consume_all([Charge(identifier, limit_per_minute, cost)])
+
+    def consume_all(self, charges: Sequence[Charge]) -> int:
+        """Charge several buckets at once: either every charge is taken or none is."""
+        now = self._clock()
+        buckets = [self._bucket(charge, now) for charge in charges]
+
+        wait = max(
+            bucket.wait_for(charge.cost, now)
+            for bucket, charge in zip(buckets, charges, strict=True)
+        )
+        if wait:
+            return max(1, math.ceil(wait))
+
+        for bucket, charge in zip(buckets, charges, strict=True):
+            bucket.take(charge.cost, now)
+            self._pending[charge.identifier] = self._pending.get(charge.identifier, 0) + charge.cost
+        return 0
+
+    async def sync(self) -> None:
+        """Flush local consumption to Redis and apply what other replicas consumed."""
+        identifiers = list(self._buckets)
+        if not identifiers:
+            return
+
+        pending, self._pending = self._pending, {}
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for identifier in identifiers:
+                    key = self._key(identifier)
+                    pipe.incrby(key, pending.get(identifier, 0))
+                    pipe.expire(key, self._idle_after * 2)
+                results = await pipe.execute()
+        except Exception:
+            for identifier, cost in pending.items():
+                self._pending[identifier] = self._pending.get(identifier, 0) + cost
+            raise
+
+        now = self._clock()
+        for identifier, total in zip(identifiers, results[::2], strict=True):
+            last_seen = self._seen.get(identifier)
+            self._seen[identifier] = total
+            bucket = self._buckets.get(identifier)
+            if last_seen is None or bucket is None:
+                continue
+
+            remote = total - last_seen - pending.get(identifier, 0)
+            if remote > 0:
+                bucket.drain(remote, now)
+
+        self._evict_idle(now)
+
+    async def run_sync_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._sync_interval)
+            try:
+                await self.sync()
+            except Exception as e:
+                self._logger.warning("rate_limit_sync_failed", error=str(e))
+
+    def _bucket(self, charge: Charge, now: float) -> TokenBucket:
+        bucket = self._buckets.get(charge.identifier)
+        if bucket is None:
+            bucket = TokenBucket.per_minute(charge.limit_per_minute, now)
+            self._buckets[charge.identifier] = bucket
+        else:
+            bucket.resize(charge.limit_per_minute)
+        return bucket
+
+    def _evict_idle(self, now: float) -> None:
+        for identifier, bucket in list(self._buckets.items()):
+            if bucket.is_idle(now, self._idle_after) and identifier not in self._pending:
+                del self._buckets[identifier]
+                self._seen.pop(identifier, None)
+
+    @staticmethod
+    def _key(identifier: str) -> str:
+        return f"rate_limit:consumed:{identifier}"
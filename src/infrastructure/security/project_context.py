@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+
+from application.common.uow import IUnitOfWork
+from domain.cache.repository import ProjectCache
+from domain.exceptions.app import UnauthorizedError
+from domain.project.models import ProjectIdentity
+from infrastructure.cache.project import project_loader
+from infrastructure.config.settings import Settings
+
+
+API_KEY_HEADER = "X-Api-Key"
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectContext:
+    """Project that sent the current request, resolved once from its API key."""
+
+    api_key: str | None
+    project: ProjectIdentity | None
+    error: str | None = None
+
+    def require(self) -> ProjectIdentity:
+        if self.project is None:
+            raise UnauthorizedError(self.error or "Invalid API Key")
+        return self.project
+
+
+async def resolve_project_context(
+    api_key: str | None,
+    settings: Settings,
+    uow: IUnitOfWork,
+    project_cache: ProjectCache,
+) -> ProjectContext:
+    if not api_key:
+        return ProjectContext(api_key=None, project=None, error="Missing API Key")
+
+    if not api_key.startswith(f"wk_{settings.app_env}"):
+        return ProjectContext(api_key=api_key, project=None, error="Bad API Key")
+
+    project = await project_cache.resolve(api_key, project_loader(uow))
+    return ProjectContext(api_key=api_key, project=project, error="Invalid API Key")
@@ -6,11 +6,19 @@ from redis.exceptions import ResponseError
 from structlog import BoundLogger
 
 from domain.event.consumer import ConsumedEvent
+from domain.project.types import Plan
 from infrastructure.di.providers.types import StreamRedis
 from infrastructure.metrics.worker import (
+    BATCH_STAGE_DURATION,
+    CONSUMER_IDLE,
     CONSUMER_LAG,
+    CONSUMER_PENDING,
     DLQ_SIZE,
+    OLDEST_PENDING_AGE,
+    OLDEST_PENDING_DELIVERY_COUNT,
+    OLDEST_UNACKED_AGE,
     PROCESSING_ERRORS,
+    STREAM_MEMORY,
 )
 from infrastructure.stream.mapper import dict_to_event
 from infrastructure.utils.retries import db_retry_policy
@@ -25,12 +33,14 @@ class RedisEventConsumer:
         consumer_name: str,
         stream_name: str = "events_stream",
         dlq_stream_name: str = "events_dlq",
+        pel_sample_size: int = 100,
     ) -> None:
         self._redis = redis
         self._group_name = group_name
         self._consumer_name = consumer_name
         self._stream_name = stream_name
         self._dlq_stream_name = dlq_stream_name
+        self._pel_sample_size = pel_sample_size
 
         self._logger = logger.bind(
             component="redis_event_consumer",
@@ -40,22 +50,93 @@ class RedisEventConsumer:
 
     async def update_stream_metrics(self) -> None:
         try:
-            # Lag
-            groups_info = await self._redis.xinfo_groups(self._stream_name)  # type: ignore[no-untyped-call]
-            for group in groups_info:
-                if group["name"] == self._group_name.encode():
-                    lag = group.get("lag")
-                    if lag is not None:
-                        CONSUMER_LAG.set(lag)
-                    break
-
-            # DLQ
-            dlq_len = await self._redis.xlen(self._dlq_stream_name)
-            DLQ_SIZE.set(dlq_len)
+            # One round trip; the PEL is only sampled, so the cost does not grow with its size
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.xinfo_groups(self._stream_name)
+                pipe.xinfo_consumers(self._stream_name, self._group_name)
+                pipe.xpending_range(
+                    self._stream_name,
+                    self._group_name,
+                    min="-",
+                    max="+",
+                    count=self._pel_sample_size,
+                )
+                pipe.memory_usage(self._stream_name)
+                pipe.xlen(self._dlq_stream_name)
+                results = await pipe.execute(raise_on_error=False)
+
+            groups_info, consumers_info, pending_sample, memory, dlq_len = (
+                self._pipeline_result(result) for result in results
+            )
+
+            if groups_info is not None:
+                await self._export_group_metrics(groups_info, pending_sample or [])
+            if consumers_info is not None:
+                self._export_consumer_metrics(consumers_info)
+            if pending_sample is not None:
+                self._export_pel_metrics(pending_sample)
+            if memory is not None:
+                STREAM_MEMORY.set(memory)
+            if dlq_len is not None:
+                DLQ_SIZE.set(dlq_len)
 
         except Exception as e:
             self._logger.warning("metrics_update_failed", error=str(e))
 
+    def _pipeline_result(self, result: object) -> Any:  # noqa: ANN401
+        # MEMORY USAGE may be unsupported or restricted; skip just that metric
+        if isinstance(result, Exception):
+            self._logger.debug("metrics_command_failed", error=str(result))
+            return None
+        return result
+
+    async def _export_group_metrics(
+        self, groups_info: list[dict[str, Any]], pending_sample: list[dict[str, Any]]
+    ) -> None:
+        for group in groups_info:
+            if group["name"] == self._group_name.encode():
+                lag = group.get("lag")
+                if lag is not None:
+                    CONSUMER_LAG.set(lag)
+
+                oldest_id = await self._oldest_unacked_id(group, pending_sample)
+                OLDEST_UNACKED_AGE.set(message_age(oldest_id) if oldest_id else 0)
+                break
+
+    @staticmethod
+    def _export_consumer_metrics(consumers_info: list[dict[str, Any]]) -> None:
+        # Drop consumers that have left the group since the last update
+        CONSUMER_PENDING.clear()
+        CONSUMER_IDLE.clear()
+        for consumer in consumers_info:
+            name = consumer["name"].decode()
+            CONSUMER_PENDING.labels(consumer=name).set(consumer["pending"])
+            CONSUMER_IDLE.labels(consumer=name).set(consumer["idle"] / 1000)
+
+    @staticmethod
+    def _export_pel_metrics(pending_sample: list[dict[str, Any]]) -> None:
+        # XPENDING returns entries in ID order, so the first one is the oldest
+        OLDEST_PENDING_AGE.set(
+            message_age(pending_sample[0]["message_id"]) if pending_sample else 0
+        )
+        for bucket, count in delivery_count_buckets(pending_sample).items():
+            OLDEST_PENDING_DELIVERY_COUNT.labels(deliveries=bucket).set(count)
+
+    async def _oldest_unacked_id(
+        self, group: dict[str, Any], pending_sample: list[dict[str, Any]]
+    ) -> bytes | None:
+        # Delivered but not acked messages are always older than undelivered ones
+        if pending_sample:
+            return cast(bytes, pending_sample[0]["message_id"])
+
+        if not group.get("lag"):
+            return None
+
+        entries = await self._redis.xrange(
+            self._stream_name, min=b"(" + group["last-delivered-id"], count=1
+        )
+        return cast(bytes, entries[0][0]) if entries else None
+
     @db_retry_policy
     async def ensure_group(self) -> None:
         try:
@@ -73,16 +154,18 @@ class RedisEventConsumer:
 
     @db_retry_policy
     async def read_batch(self, count: int = 100, block_ms: int = 1000) -> list[ConsumedEvent]:
-        raw_messages = await self._fetch_messages(count=count, block_ms=block_ms)
+        with BATCH_STAGE_DURATION.labels(stage="read").time():
+            raw_messages = await self._fetch_messages(count=count, block_ms=block_ms)
 
         if not raw_messages:
             return []
 
         result = []
-        for msg_id_bytes, fields in raw_messages:
-            consumed_events = await self._process_message(msg_id_bytes, fields)
-            if consumed_events:
-                result.append(consumed_events)
+        with BATCH_STAGE_DURATION.labels(stage="decode").time():
+            for msg_id_bytes, fields in raw_messages:
+                consumed_events = await self._process_message(msg_id_bytes, fields)
+                if consumed_events:
+                    result.append(consumed_events)
 
         return result
 
@@ -139,7 +222,7 @@ class RedisEventConsumer:
         try:
             data_dict = msgpack.unpackb(raw_data, raw=False)
             event = dict_to_event(data_dict)
-            return ConsumedEvent(msg_id=msg_id, event=event)
+            return ConsumedEvent(msg_id=msg_id, event=event, plan=self._parse_plan(fields))
         except Exception as e:
             self._logger.error("deserialization_failed", msg_id=msg_id, error=str(e))
 
@@ -148,3 +231,36 @@ class RedisEventConsumer:
             await self.send_to_dlq(msg_id, raw_data, error=f"DeserializationError: {e!s}")
 
             return None
+
+    @staticmethod
+    def _parse_plan(fields: dict[bytes, bytes]) -> Plan | None:
+        raw_plan = fields.get(b"plan")
+        if raw_plan is None:
+            return None
+        try:
+            return Plan(raw_plan.decode("utf-8"))
+        except ValueError:
+            return None
+
+
+def message_age(msg_id: bytes | str) -> float:
+    """Seconds since a stream entry was added, taken from the ms timestamp in its ID."""
+    if isinstance(msg_id, bytes):
+        msg_id = msg_id.decode()
+    added_ms = int(msg_id.split("-", 1)[0])
+    return max(datetime.now(UTC).timestamp() - added_ms / 1000, 0.0)
+
+
+DELIVERY_COUNT_BUCKETS = (("1", 1), ("2", 2), ("3-5", 5), ("6-10", 10), ("11+", None))
+
+
+def delivery_count_buckets(pending_sample: list[dict[str, Any]]) -> dict[str, int]:
+    """Group the oldest PEL entries (the XPENDING head) by how many times they were delivered."""
+    counts = dict.fromkeys((name for name, _ in DELIVERY_COUNT_BUCKETS), 0)
+    for entry in pending_sample:
+        times_delivered = entry["times_delivered"]
+        for name, upper in DELIVERY_COUNT_BUCKETS:
+            if upper is None or times_delivered <= upper:
+                counts[name] += 1
+                break
+    return counts
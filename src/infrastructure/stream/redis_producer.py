@@ -6,6 +6,7 @@ from uuid import UUID
 import msgpack  # type: ignore[import-untyped]
 
 from domain.event.models import Event
+from domain.project.types import Plan
 from infrastructure.di.providers.types import StreamRedis
 from infrastructure.utils.retries import db_retry_policy
 
@@ -18,6 +19,18 @@ def msgpack_encoder(obj: Any) -> Any:  # noqa: ANN401
     return obj
 
 
+def event_to_fields(event: Event, plan: Plan | None = None) -> dict[str, bytes | str]:
+    """Stream entry fields for an event: the msgpack payload plus optional metadata."""
+    event_dict = dataclasses.asdict(event)
+    payload = msgpack.packb(event_dict, default=msgpack_encoder, use_bin_type=True)
+
+    fields: dict[str, bytes | str] = {"data": payload}
+    if plan is not None:
+        # Stream metadata for worker metrics, not part of the stored event
+        fields["plan"] = plan.value
+    return fields
+
+
 class RedisEventProducer:
     def __init__(
         self, redis: StreamRedis, stream_name: str = "events_stream", max_len: int = 100_000
@@ -27,27 +40,21 @@ class RedisEventProducer:
         self._max_len = max_len
 
     @db_retry_policy
-    async def publish(self, event: Event) -> None:
-        event_dict = dataclasses.asdict(event)
-        payload = msgpack.packb(event_dict, default=msgpack_encoder, use_bin_type=True)
-
+    async def publish(self, event: Event, plan: Plan | None = None) -> None:
         await self._redis.xadd(
             name=self._stream_name,
-            fields={"data": payload},
+            fields=event_to_fields(event, plan),
             maxlen=self._max_len,
             approximate=True,
         )
 
     @db_retry_policy
-    async def publish_batch(self, events: list[Event]) -> None:
+    async def publish_batch(self, events: list[Event], plan: Plan | None = None) -> None:
         async with self._redis.pipeline() as pipe:
             for event in events:
-                event_dict = dataclasses.asdict(event)
-                payload = msgpack.packb(event_dict, default=msgpack_encoder, use_bin_type=True)
-
                 pipe.xadd(
                     name=self._stream_name,
-                    fields={"data": payload},
+                    fields=event_to_fields(event, plan),
                     maxlen=self._max_len,
                     approximate=True,
                 )
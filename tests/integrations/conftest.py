@@ -8,19 +8,21 @@ import pytest
 import pytest_asyncio
 from fastapi import FastAPI
 from httpx import AsyncClient, ASGITransport
-from structlog import get_logger
+from structlog import BoundLogger, get_logger
 from testcontainers.postgres import PostgresContainer
 from fakeredis import aioredis
 
-from domain.cache.repository import Cache
+from domain.cache.repository import Cache, ProjectCache
 from domain.event.consumer import EventConsumer
 from domain.event.producer import EventProducer
 from entrypoint.api.main import create_app
+from infrastructure.cache.project import TwoTierProjectCache
 from infrastructure.cache.redis import RedisCache
 from infrastructure.config.settings import Settings
 from infrastructure.database.postgres.init import init_postgres_connection
 from infrastructure.database.postgres.repositories.event import PostgresEventRepository
 from infrastructure.database.postgres.repositories.project import PostgresProjectRepository
+from infrastructure.database.postgres.repositories.rollup import PostgresRollupRepository
 from infrastructure.di.providers.types import CacheRedis, StreamRedis
 from infrastructure.stream.redis_consumer import RedisEventConsumer
 from infrastructure.stream.redis_producer import RedisEventProducer
@@ -105,6 +107,12 @@ async def app(
         def get_cache(self, client: CacheRedis) -> Cache:
             return RedisCache(client)
 
+        @provide
+        def get_project_cache(
+            self, client: CacheRedis, settings: Settings, logger: BoundLogger
+        ) -> ProjectCache:
+            return TwoTierProjectCache(client, settings, logger)
+
 
     class TestStreamProvider(Provider):
         scope = Scope.APP
@@ -184,6 +192,11 @@ async def event_repository(db_conn):
     return PostgresEventRepository(connection=db_conn)
 
 
+@pytest_asyncio.fixture
+async def rollup_repository(db_conn):
+    return PostgresRollupRepository(connection=db_conn)
+
+
 @pytest.fixture
 async def fake_redis_client():
     client = aioredis.FakeRedis(decode_responses=True)
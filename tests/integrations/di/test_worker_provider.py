@@ -6,6 +6,7 @@ from application.common.uow import IUnitOfWork
 from application.worker.batch_processor import BatchProcessor
 from application.worker.graceful_killer import GracefulKiller
 from application.worker.loop import WorkerLoop
+from application.worker.rollup_recompute import RollupRecomputer
 from infrastructure.di.providers.worker import WorkerProvider
 from domain.event.consumer import EventConsumer
 from infrastructure.config.settings import Settings
@@ -53,5 +54,9 @@ async def test_worker_container_assembly():
             assert loop._processor is processor
             assert loop._killer is killer
 
+            recomputer = await scope.get(RollupRecomputer)
+            assert isinstance(recomputer, RollupRecomputer)
+            assert recomputer._killer is killer
+
     finally:
         await container.close()
@@ -0,0 +1,96 @@
+from datetime import UTC, datetime, timedelta
+
+import orjson
+import pytest
+from httpx import AsyncClient
+
+from domain.event.types import EventType
+from domain.rollup.models import count_events
+
+
+@pytest.mark.asyncio
+async def test_query_events_paginates_with_cursor(
+    client: AsyncClient, project_repository, event_repository, make_project, make_event
+):
+    project = make_project()
+    other_project = make_project(name="other-project")
+    await project_repository.add(project)
+    await project_repository.add(other_project)
+    start = datetime.now(UTC) - timedelta(hours=1)
+    events = [
+        make_event(project_id=project.project_id, timestamp=start + timedelta(seconds=i))
+        for i in range(5)
+    ]
+    await event_repository.add_many(
+        [*events, make_event(project_id=other_project.project_id, timestamp=start)]
+    )
+
+    pages, cursor = [], None
+    while True:
+        params = {"limit": 2, "event_type": EventType.PAGE_VIEW}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(
+            "/api/v1/events", headers={"X-Api-Key": project.api_key}, params=params
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        lines = [orjson.loads(line) for line in response.content.splitlines()]
+        cursor = lines[-1].get("next_cursor")
+        pages.append([line["event_id"] for line in lines if "event_id" in line])
+        if cursor is None:
+            break
+
+    assert pages == [
+        [str(e.event_id) for e in events[:2]],
+        [str(e.event_id) for e in events[2:4]],
+        [str(events[4].event_id)],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_query_events_rejects_invalid_filter(client: AsyncClient, project_repository, make_project):
+    project = make_project()
+    await project_repository.add(project)
+
+    response = await client.get(
+        "/api/v1/events",
+        headers={"X-Api-Key": project.api_key},
+        params={"property": "price:free"},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["code"] == "ValidationError"
+
+
+@pytest.mark.asyncio
+async def test_query_events_requires_api_key(client: AsyncClient):
+    response = await client.get("/api/v1/events")
+
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_time_series_reads_rollups(
+    client: AsyncClient, project_repository, rollup_repository, make_project, make_event
+):
+    project = make_project()
+    await project_repository.add(project)
+    hour = datetime.now(UTC).replace(minute=0, second=0, microsecond=0) - timedelta(hours=2)
+    events = [make_event(project_id=project.project_id, timestamp=hour) for _ in range(3)]
+    await rollup_repository.add(count_events(events))
+
+    response = await client.get(
+        "/api/v1/events/series",
+        headers={"X-Api-Key": project.api_key},
+        params={"granularity": "hour", "start": (hour - timedelta(hours=1)).isoformat()},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["granularity"] == "hour"
+    assert data["complete_up_to"] is None
+    assert data["points"] == [
+        {"bucket": hour.isoformat().replace("+00:00", "Z"), "event_type": "page_view", "count": 3}
+    ]
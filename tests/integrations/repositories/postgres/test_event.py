@@ -1,6 +1,10 @@
+from datetime import UTC, datetime, timedelta
+
 import pytest
 from domain.exceptions.app import NotFoundError
 from domain.event.models import Properties
+from domain.event.query import EventCursor, EventFilter
+from domain.event.types import EventType
 from domain.utils.generate_uuid import generate_uuid
 
 
@@ -86,3 +90,101 @@ async def test_add_event_with_nullable_fields(event_repository, project_reposito
     assert fetched.properties.country is None
     assert fetched.properties.browser is None
     assert fetched.properties.os is None
+
+
+async def test_add_many_skips_duplicates(event_repository, project_repository, make_event, make_project):
+    project = make_project()
+    await project_repository.add(project)
+    existing = make_event(project_id=project.project_id)
+    new_event = make_event(project_id=project.project_id, user_id=None)
+    await event_repository.add(existing)
+
+    inserted = await event_repository.add_many([existing, new_event])
+
+    assert inserted == 1
+    fetched = await event_repository.get_by_id(new_event.event_id)
+    assert fetched.user_id is None
+    assert fetched.properties.page_url == new_event.properties.page_url
+
+
+async def test_copy_many_skips_duplicates(db_conn, event_repository, project_repository, make_event, make_project):
+    project = make_project()
+    await project_repository.add(project)
+    existing = make_event(project_id=project.project_id)
+    new_event = make_event(project_id=project.project_id, user_id=None)
+    await event_repository.add(existing)
+
+    async with db_conn.transaction():
+        inserted = await event_repository.copy_many([existing, new_event])
+
+    assert inserted == 1
+    fetched = await event_repository.get_by_id(new_event.event_id)
+    assert fetched.user_id is None
+    assert fetched.properties == new_event.properties
+
+
+async def test_stream_filters_in_keyset_order(db_conn, event_repository, project_repository, make_event, make_project):
+    project = make_project()
+    await project_repository.add(project)
+    start = datetime(2026, 3, 1, tzinfo=UTC)
+    purchases = [
+        make_event(
+            project_id=project.project_id,
+            user_id="u1",
+            event_type=EventType.PURCHASE,
+            timestamp=start + timedelta(minutes=i),
+            properties=Properties(product_id="p1", price=1999, quantity=1, country="NZ"),
+        )
+        for i in range(3)
+    ]
+    other_country = make_event(
+        project_id=project.project_id,
+        user_id="u1",
+        event_type=EventType.PURCHASE,
+        timestamp=start,
+        properties=Properties(product_id="p1", price=1999, quantity=1, country="US"),
+    )
+    page_view = make_event(project_id=project.project_id, user_id="u1", timestamp=start)
+    too_late = make_event(
+        project_id=project.project_id,
+        user_id="u1",
+        event_type=EventType.PURCHASE,
+        timestamp=start + timedelta(days=1),
+        properties=Properties(product_id="p1", price=1999, quantity=1, country="NZ"),
+    )
+    await event_repository.add_many([*reversed(purchases), other_country, page_view, too_late])
+    query = EventFilter(
+        project_id=project.project_id,
+        start=start,
+        end=start + timedelta(hours=1),
+        event_types=(EventType.PURCHASE,),
+        user_id="u1",
+        properties={"country": "NZ", "price": 1999},
+    )
+
+    async with db_conn.transaction():
+        events = [event async for event in event_repository.stream(query)]
+        first_page = [event async for event in event_repository.stream(query, limit=2)]
+        after = EventCursor(first_page[-1].timestamp, first_page[-1].event_id)
+        rest = [
+            event
+            async for event in event_repository.stream(
+                EventFilter(project_id=project.project_id, event_types=(EventType.PURCHASE,), after=after)
+            )
+        ]
+
+    assert [e.event_id for e in events] == [e.event_id for e in purchases]
+    assert [e.event_id for e in first_page] == [e.event_id for e in purchases[:2]]
+    assert [e.event_id for e in rest] == [purchases[2].event_id, too_late.event_id]
+
+
+async def test_add_new_returns_only_inserted(event_repository, project_repository, make_event, make_project):
+    project = make_project()
+    await project_repository.add(project)
+    existing = make_event(project_id=project.project_id)
+    new_event = make_event(project_id=project.project_id)
+    await event_repository.add(existing)
+
+    inserted = await event_repository.add_new([existing, new_event])
+
+    assert inserted == [new_event]
@@ -0,0 +1,87 @@
+from datetime import UTC, datetime, timedelta
+
+from domain.event.types import EventType
+from domain.rollup.models import RollupBucket, count_events
+from domain.rollup.types import Granularity
+
+
+async def test_add_accumulates_counts(rollup_repository, project_repository, make_event, make_project):
+    project = make_project()
+    await project_repository.add(project)
+    base = datetime(2026, 3, 1, 10, tzinfo=UTC)
+    first = [make_event(project_id=project.project_id, timestamp=base + timedelta(minutes=i)) for i in range(3)]
+    second = [make_event(project_id=project.project_id, timestamp=base, event_type=EventType.PURCHASE)]
+
+    await rollup_repository.add(count_events(first))
+    await rollup_repository.add(count_events(first[:1] + second))
+
+    hours = await rollup_repository.get_series(
+        project.project_id, Granularity.HOUR, base, base + timedelta(hours=1)
+    )
+    minutes = await rollup_repository.get_series(
+        project.project_id, Granularity.MINUTE, base, base + timedelta(hours=1), (EventType.PAGE_VIEW,)
+    )
+
+    assert [(c.event_type, c.count) for c in hours] == [
+        (EventType.PAGE_VIEW, 4),
+        (EventType.PURCHASE, 1),
+    ]
+    assert [(c.bucket, c.count) for c in minutes] == [
+        (base, 2),
+        (base + timedelta(minutes=1), 1),
+        (base + timedelta(minutes=2), 1),
+    ]
+
+
+async def test_add_empty_is_noop(rollup_repository):
+    await rollup_repository.add([])
+
+
+async def test_advance_watermarks_never_moves_back(rollup_repository, project_repository, make_project):
+    project = make_project()
+    await project_repository.add(project)
+    watermark = datetime(2026, 3, 1, 10, tzinfo=UTC)
+
+    await rollup_repository.advance_watermarks({project.project_id: watermark})
+    await rollup_repository.advance_watermarks({project.project_id: watermark - timedelta(hours=1)})
+
+    assert await rollup_repository.get_watermarks([project.project_id]) == {
+        project.project_id: watermark
+    }
+
+
+async def test_recompute_rebuilds_hour_and_its_day_from_raw_events(
+    db_conn, rollup_repository, event_repository, project_repository, make_event, make_project
+):
+    project = make_project()
+    await project_repository.add(project)
+    hour = datetime(2026, 3, 1, 10, tzinfo=UTC)
+    counted = [make_event(project_id=project.project_id, timestamp=hour + timedelta(hours=i)) for i in range(2)]
+    late = make_event(project_id=project.project_id, timestamp=hour + timedelta(minutes=5))
+    await event_repository.add_many(counted + [late])
+    await rollup_repository.add(count_events(counted))
+    await rollup_repository.advance_watermarks({project.project_id: hour + timedelta(hours=3)})
+    await rollup_repository.mark_dirty([RollupBucket(project.project_id, hour)])
+
+    assert await rollup_repository.get_complete_up_to(project.project_id) == hour
+    (dirty,) = await rollup_repository.get_dirty(10)
+    async with db_conn.transaction():
+        assert await rollup_repository.recompute(dirty) is True
+    async with db_conn.transaction():
+        assert await rollup_repository.recompute(dirty) is False
+
+    day = datetime(2026, 3, 1, tzinfo=UTC)
+    hours = await rollup_repository.get_series(
+        project.project_id, Granularity.HOUR, day, day + timedelta(days=1)
+    )
+    days = await rollup_repository.get_series(
+        project.project_id, Granularity.DAY, day, day + timedelta(days=1)
+    )
+    minutes = await rollup_repository.get_series(
+        project.project_id, Granularity.MINUTE, hour, hour + timedelta(hours=1)
+    )
+    assert [(c.bucket, c.count) for c in hours] == [(hour, 2), (hour + timedelta(hours=1), 1)]
+    assert [c.count for c in days] == [3]
+    assert [(c.bucket, c.count) for c in minutes] == [(hour, 1), (hour + timedelta(minutes=5), 1)]
+    assert await rollup_repository.get_dirty(10) == []
+    assert await rollup_repository.get_complete_up_to(project.project_id) == hour + timedelta(hours=3)
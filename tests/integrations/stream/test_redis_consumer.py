@@ -5,8 +5,16 @@ from datetime import datetime, UTC
 
 from domain.event.models import Event, Properties
 from domain.event.types import EventType
+from domain.project.types import Plan
 from domain.utils.generate_uuid import generate_uuid
-from infrastructure.stream.redis_consumer import RedisEventConsumer
+from infrastructure.metrics.worker import (
+    CONSUMER_IDLE,
+    CONSUMER_PENDING,
+    OLDEST_PENDING_AGE,
+    OLDEST_PENDING_DELIVERY_COUNT,
+    OLDEST_UNACKED_AGE,
+)
+from infrastructure.stream.redis_consumer import RedisEventConsumer, delivery_count_buckets
 from infrastructure.stream.redis_producer import RedisEventProducer
 
 
@@ -116,3 +124,62 @@ async def test_consume_malformed_message_sends_to_dlq(fake_stream_redis, mock_lo
     assert dlq_payload["raw_data"] == malformed_data
     assert "DeserializationError" in dlq_payload["error"]
     assert "failed_at" in dlq_payload
+
+
+async def test_consume_event_carries_plan(fake_stream_redis, sample_event, mock_logger):
+    producer = RedisEventProducer(fake_stream_redis, stream_name="plans")
+    consumer = RedisEventConsumer(fake_stream_redis, mock_logger, "group1", "worker1", "plans")
+    await consumer.ensure_group()
+
+    await producer.publish_batch([sample_event], plan=Plan.PRO)
+    await producer.publish(sample_event)
+    consumed_batch = await consumer.read_batch(count=2)
+
+    assert [consumed.plan for consumed in consumed_batch] == [Plan.PRO, None]
+
+
+async def test_update_stream_metrics_reports_oldest_unacked_age(
+    fake_stream_redis, sample_event, mock_logger
+):
+    consumer = RedisEventConsumer(fake_stream_redis, mock_logger, "group1", "worker1", "ages")
+    await consumer.ensure_group()
+
+    await consumer.update_stream_metrics()
+    assert OLDEST_UNACKED_AGE._value.get() == 0
+
+    # Undelivered entry
+    old_ms = int(datetime.now(UTC).timestamp() * 1000) - 30_000
+    await fake_stream_redis.xadd("ages", {"data": b"x"}, id=f"{old_ms}-0")
+    await consumer.update_stream_metrics()
+    assert OLDEST_UNACKED_AGE._value.get() >= 30
+
+    # Delivered but still pending
+    await consumer._fetch_messages(count=1, block_ms=0)
+    await consumer.update_stream_metrics()
+    assert OLDEST_UNACKED_AGE._value.get() >= 30
+
+    await consumer.ack([f"{old_ms}-0"])
+    await consumer.update_stream_metrics()
+    assert OLDEST_UNACKED_AGE._value.get() == 0
+
+
+async def test_update_stream_metrics_reports_pel_health(fake_stream_redis, mock_logger):
+    consumer = RedisEventConsumer(fake_stream_redis, mock_logger, "group1", "worker1", "pel")
+    await consumer.ensure_group()
+    for _ in range(3):
+        await fake_stream_redis.xadd("pel", {"data": b"x"})
+    await consumer._fetch_messages(count=2, block_ms=0)
+
+    await consumer.update_stream_metrics()
+
+    assert CONSUMER_PENDING.labels(consumer="worker1")._value.get() == 2
+    assert CONSUMER_IDLE.labels(consumer="worker1")._value.get() >= 0
+    assert OLDEST_PENDING_AGE._value.get() >= 0
+    assert OLDEST_PENDING_DELIVERY_COUNT.labels(deliveries="1")._value.get() == 2
+    assert OLDEST_PENDING_DELIVERY_COUNT.labels(deliveries="2")._value.get() == 0
+
+
+def test_delivery_count_buckets():
+    sample = [{"times_delivered": n} for n in (1, 1, 2, 4, 10, 11, 50)]
+
+    assert delivery_count_buckets(sample) == {"1": 2, "2": 1, "3-5": 1, "6-10": 1, "11+": 2}
@@ -0,0 +1,96 @@
+import math
+from collections.abc import Iterator
+
+
+class HdrHistogram:
+    """
+    HDR-style latency histogram: constant relative precision over a wide range.
+
+    Values (integers, e.g. microseconds) below `2 * 10**significant_figures` are stored
+    exactly; above that each power of two is split into the same number of linear
+    sub-buckets, so any recorded value is reported within 10**-significant_figures of
+    its true value. Counts are kept sparse, so memory grows with the distinct buckets hit.
+    """
+
+    def __init__(self, significant_figures: int = 3) -> None:
+        self.sub_bucket_bits = math.ceil(math.log2(2 * 10**significant_figures))
+        self.sub_bucket_count = 1 << self.sub_bucket_bits
+        self.half_count = self.sub_bucket_count // 2
+        self.counts: dict[int, int] = {}
+        self.total_count = 0
+        self.min_value = 0
+        self.max_value = 0
+        self._sum = 0
+
+    def record(self, value: int, count: int = 1) -> None:
+        value = max(value, 0)
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        if not self.total_count or value < self.min_value:
+            self.min_value = value
+        self.max_value = max(self.max_value, value)
+        self.total_count += count
+        self._sum += value * count
+
+    def merge(self, other: "HdrHistogram") -> None:
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("cannot merge histograms with different precision")
+        if not other.total_count:
+            return
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.min_value = (
+            min(self.min_value, other.min_value) if self.total_count else other.min_value
+        )
+        self.max_value = max(self.max_value, other.max_value)
+        self.total_count += other.total_count
+        self._sum += other._sum
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.total_count if self.total_count else 0.0
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """Highest value equivalent to the bucket holding `percentile` (0-100)."""
+        if not self.total_count:
+            return 0
+        target = max(1, math.ceil(percentile / 100 * self.total_count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._highest_equivalent(index), self.max_value)
+        return self.max_value
+
+    def percentile_distribution(self, ticks_per_half: int = 5) -> Iterator[tuple[float, int, int]]:
+        """(percentile, value, cumulative count) rows in HdrHistogram's `.hgrm` progression."""
+        if not self.total_count:
+            return
+        percentile = 0.0
+        while True:
+            value = self.value_at_percentile(percentile)
+            count = self._count_at_or_below(value)
+            if count >= self.total_count:
+                break
+            yield percentile, value, count
+            # Halve the distance to 100% every `ticks_per_half` rows
+            halvings = math.floor(math.log2(100.0 / (100.0 - percentile)))
+            percentile += 100.0 / (ticks_per_half * 2 ** (halvings + 1))
+        yield 100.0, self.max_value, self.total_count
+
+    def _index(self, value: int) -> int:
+        if value < self.sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return self.sub_bucket_count + (shift - 1) * self.half_count + (value >> shift) - self.half_count
+
+    def _highest_equivalent(self, index: int) -> int:
+        if index < self.sub_bucket_count:
+            return index
+        shift, offset = divmod(index - self.sub_bucket_count, self.half_count)
+        shift += 1
+        return ((self.half_count + offset + 1) << shift) - 1
+
+    def _count_at_or_below(self, value: int) -> int:
+        limit = self._index(value)
+        return sum(count for index, count in self.counts.items() if index <= limit)
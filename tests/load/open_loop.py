@@ -0,0 +1,224 @@
+"""
+Open-loop load generator (coordinated-omission correct).
+
+Locust users and `scripts/seeder.py` are closed-loop: a user waits for its response before
+sending the next request, so when the API slows down the offered load drops with it and the
+slow period is under-sampled (coordinated omission). Here requests are sent on a fixed
+arrival schedule computed up front, whatever the API does, and latency is measured from the
+*scheduled* send time. Time a request spends waiting for a free connection or for a stalled
+generator is therefore counted, the same correction HdrHistogram's expected-interval
+recording applies after the fact.
+
+Two histograms are reported:
+    response: scheduled send -> response (what a client at this arrival rate experiences)
+    service:  actual send -> response (what closed-loop tools report)
+A large gap between them means the API (or this generator) could not keep up with the rate.
+
+Command:
+    python -m tests.load.open_loop --host http://localhost:8000 --rate 2000 --duration 60 \
+        --batch-size 10 --hgrm tests/load/results/open_loop_2000.hgrm
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+import structlog
+
+from tests.load.data_generator import generate_batch_events, generate_random_event, setup_projects
+from tests.load.hdr import HdrHistogram
+
+
+logger = structlog.get_logger("load_test")
+
+PAYLOAD_POOL_SIZE = 2_000
+# Schedule lag above this means the generator itself fell behind and results are suspect
+MAX_SENDER_LAG_US = 10_000
+
+
+@dataclass
+class OpenLoopStats:
+    response: HdrHistogram = field(default_factory=HdrHistogram)
+    service: HdrHistogram = field(default_factory=HdrHistogram)
+    sender_lag: HdrHistogram = field(default_factory=HdrHistogram)
+    statuses: dict[str, int] = field(default_factory=dict)
+    sent: int = 0
+    events: int = 0
+    elapsed: float = 0.0
+
+    def count_status(self, status: str) -> None:
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+
+def arrival_schedule(
+    request_rate: float, duration: float, arrival: str, seed: int
+) -> list[float]:
+    """Send offsets in seconds: evenly spaced, or exponential gaps for a Poisson process."""
+    if arrival == "constant":
+        return [i / request_rate for i in range(int(request_rate * duration))]
+
+    rng = random.Random(seed)
+    offsets, offset = [], 0.0
+    while True:
+        offset += rng.expovariate(request_rate)
+        if offset >= duration:
+            return offsets
+        offsets.append(offset)
+
+
+def build_payloads(batch_size: int, pool_size: int = PAYLOAD_POOL_SIZE) -> list[tuple[str, Any]]:
+    """Pre-generated (url, body) pairs so payload generation stays off the timed path."""
+    if batch_size == 1:
+        return [("/api/v1/event", generate_random_event()) for _ in range(pool_size)]
+    return [
+        ("/api/v1/event/batch", {"events": generate_batch_events(count=batch_size)})
+        for _ in range(max(1, pool_size // batch_size))
+    ]
+
+
+async def send(
+    client: httpx.AsyncClient,
+    slots: asyncio.Semaphore,
+    url: str,
+    body: Any,
+    api_key: str,
+    scheduled: float,
+    expected_status: int,
+    stats: OpenLoopStats,
+) -> None:
+    async with slots:
+        started = time.perf_counter()
+        try:
+            response = await client.post(url, json=body, headers={"X-Api-Key": api_key})
+            status = str(response.status_code)
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+        finished = time.perf_counter()
+
+    stats.response.record(int((finished - scheduled) * 1_000_000))
+    stats.service.record(int((finished - started) * 1_000_000))
+    stats.count_status(status if status != str(expected_status) else "ok")
+
+
+async def run(
+    host: str,
+    api_keys: list[str],
+    rate: float,
+    duration: float,
+    batch_size: int,
+    arrival: str,
+    max_in_flight: int,
+    seed: int,
+) -> OpenLoopStats:
+    request_rate = rate / batch_size
+    offsets = arrival_schedule(request_rate, duration, arrival, seed)
+    payloads = itertools.cycle(build_payloads(batch_size))
+    keys = itertools.cycle(api_keys)
+    expected_status = 202
+
+    stats = OpenLoopStats()
+    slots = asyncio.Semaphore(max_in_flight)
+    limits = httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=max_in_flight)
+    async with httpx.AsyncClient(base_url=host, timeout=30.0, limits=limits) as client:
+        tasks = set()
+        start = time.perf_counter()
+        for offset in offsets:
+            scheduled = start + offset
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            stats.sender_lag.record(int(max(0.0, time.perf_counter() - scheduled) * 1_000_000))
+
+            url, body = next(payloads)
+            task = asyncio.create_task(
+                send(client, slots, url, body, next(keys), scheduled, expected_status, stats)
+            )
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            stats.sent += 1
+            stats.events += batch_size
+        await asyncio.gather(*tasks)
+        stats.elapsed = time.perf_counter() - start
+
+    return stats
+
+
+def write_hgrm(histogram: HdrHistogram, path: Path, unit_ratio: float = 1000.0) -> None:
+    """Percentile distribution in HdrHistogram's text format (values in ms)."""
+    lines = [f"{'Value':>12} {'Percentile':>14} {'TotalCount':>10} {'1/(1-Percentile)':>14}", ""]
+    for percentile, value, count in histogram.percentile_distribution():
+        fraction = percentile / 100
+        inverse = f"{1 / (1 - fraction):14.2f}" if fraction < 1 else f"{'inf':>14}"
+        lines.append(f"{value / unit_ratio:12.3f} {fraction:14.12f} {count:10d} {inverse}")
+    lines += [
+        f"#[Mean    = {histogram.mean / unit_ratio:12.3f}]",
+        f"#[Max     = {histogram.max_value / unit_ratio:12.3f}]",
+        f"#[Total count    = {histogram.total_count:12d}]",
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n")
+
+
+def report(stats: OpenLoopStats, rate: float) -> None:
+    achieved = stats.events / stats.elapsed if stats.elapsed else 0.0
+    print(f"target: {rate:,.0f} events/s, achieved: {achieved:,.0f} events/s")
+    print(f"requests: {stats.sent}, outcomes: {stats.statuses}")
+    print(f"{'ms':<10} {'p50':>9} {'p90':>9} {'p99':>9} {'p99.9':>9} {'max':>9}")
+    for name, histogram in (("response", stats.response), ("service", stats.service)):
+        values = [histogram.value_at_percentile(p) for p in (50, 90, 99, 99.9)]
+        values.append(histogram.max_value)
+        print(f"{name:<10} " + " ".join(f"{v / 1000:9.1f}" for v in values))
+
+    lag_p99 = stats.sender_lag.value_at_percentile(99)
+    if lag_p99 > MAX_SENDER_LAG_US:
+        print(
+            f"WARNING: generator p99 schedule lag {lag_p99 / 1000:.1f} ms; it could not keep "
+            "the rate, lower --rate or raise --batch-size / run more generators"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Open-loop load generator")
+    parser.add_argument("--host", default=os.getenv("API_HOST", "http://localhost:8000"))
+    parser.add_argument("--rate", type=float, required=True, help="target events per second")
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds")
+    parser.add_argument("--batch-size", type=int, default=1, help="1 = POST /event")
+    parser.add_argument("--arrival", choices=["constant", "poisson"], default="constant")
+    parser.add_argument("--max-in-flight", type=int, default=512, help="connection limit")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--hgrm", type=Path, default=None, help="write response .hgrm here")
+    args = parser.parse_args()
+
+    api_keys = [k.strip() for k in os.getenv("LOAD_TEST_API_KEYS", "").split(",") if k.strip()]
+    api_keys = api_keys or setup_projects(args.host)
+    if not api_keys:
+        raise SystemExit("no API keys: set LOAD_TEST_API_KEYS or SECRET_TOKEN")
+
+    logger.info("open_loop_start", rate=args.rate, duration=args.duration, batch=args.batch_size)
+    stats = asyncio.run(
+        run(
+            host=args.host,
+            api_keys=api_keys,
+            rate=args.rate,
+            duration=args.duration,
+            batch_size=args.batch_size,
+            arrival=args.arrival,
+            max_in_flight=args.max_in_flight,
+            seed=args.seed,
+        )
+    )
+    report(stats, args.rate)
+    if args.hgrm is not None:
+        write_hgrm(stats.response, args.hgrm)
+        write_hgrm(stats.service, args.hgrm.with_suffix(".service.hgrm"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+from datetime import UTC, datetime
+
+from pydantic import ValidationError
+import pytest
+
+from application.event.schemas.query_dto import (
+    EventQueryDTO,
+    decode_cursor,
+    encode_cursor,
+    parse_property_filter,
+)
+from domain.event.query import EventCursor
+from domain.event.types import EventType
+from domain.utils.generate_uuid import generate_uuid
+
+
+class TestCursor:
+    def test_round_trip(self):
+        cursor = EventCursor(datetime(2026, 3, 1, 12, 30, tzinfo=UTC), generate_uuid())
+
+        token = encode_cursor(cursor)
+
+        assert "=" not in token
+        assert decode_cursor(token) == cursor
+
+    @pytest.mark.parametrize("token", ["", "not-base64!", "WyJ4Il0", "WzFd"])
+    def test_rejects_garbage(self, token):
+        with pytest.raises(ValueError, match="invalid cursor"):
+            decode_cursor(token)
+
+
+class TestPropertyFilter:
+    def test_converts_price_to_cents(self):
+        assert parse_property_filter("price:19.99") == ("price", 1999)
+
+    def test_keeps_value_after_first_colon(self):
+        assert parse_property_filter("page_url:https://example.com/a") == (
+            "page_url",
+            "https://example.com/a",
+        )
+
+    @pytest.mark.parametrize("value", ["country", "unknown:1", "country:nz", "quantity:0"])
+    def test_rejects_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_property_filter(value)
+
+
+class TestEventQueryDTO:
+    def test_to_filter(self):
+        project_id = generate_uuid()
+        cursor = EventCursor(datetime(2026, 3, 1, tzinfo=UTC), generate_uuid())
+        dto = EventQueryDTO.model_validate(
+            {
+                "start": "2026-03-01T00:00:00",
+                "event_type": ["purchase", "add_to_cart"],
+                "user_id": "u1",
+                "property": ["country:NZ", "quantity:2"],
+                "cursor": encode_cursor(cursor),
+            }
+        )
+
+        query = dto.to_filter(project_id)
+
+        assert query.project_id == project_id
+        assert query.start == datetime(2026, 3, 1, tzinfo=UTC)
+        assert query.end is None
+        assert query.event_types == (EventType.PURCHASE, EventType.ADD_TO_CART)
+        assert query.user_id == "u1"
+        assert query.properties == {"country": "NZ", "quantity": 2}
+        assert query.after == cursor
+
+    def test_rejects_empty_range(self):
+        with pytest.raises(ValidationError, match="start must be before end"):
+            EventQueryDTO(start=datetime(2026, 3, 2, tzinfo=UTC), end=datetime(2026, 3, 1, tzinfo=UTC))
+
+    @pytest.mark.parametrize("limit", [0, 10_001])
+    def test_rejects_limit_out_of_range(self, limit):
+        with pytest.raises(ValidationError):
+            EventQueryDTO(limit=limit)
+
+    def test_rejects_bad_cursor(self):
+        with pytest.raises(ValidationError, match="invalid cursor"):
+            EventQueryDTO(cursor="abc")
@@ -0,0 +1,37 @@
+from datetime import UTC, datetime, timedelta
+
+from pydantic import ValidationError
+import pytest
+
+from application.event.schemas.series_dto import MAX_SERIES_BUCKETS, TimeSeriesQueryDTO
+from domain.rollup.types import Granularity
+
+
+def test_defaults():
+    dto = TimeSeriesQueryDTO(start=datetime.now(UTC) - timedelta(days=1))
+
+    assert dto.granularity == Granularity.HOUR
+    assert dto.end > dto.start
+    assert dto.event_type == []
+
+
+def test_naive_datetimes_are_utc():
+    dto = TimeSeriesQueryDTO(start=datetime(2026, 3, 1), end=datetime(2026, 3, 2))
+
+    assert dto.start.tzinfo == UTC
+    assert dto.end.tzinfo == UTC
+
+
+def test_rejects_empty_range():
+    with pytest.raises(ValidationError, match="start must be before end"):
+        TimeSeriesQueryDTO(start=datetime(2026, 3, 2, tzinfo=UTC), end=datetime(2026, 3, 1, tzinfo=UTC))
+
+
+def test_limits_number_of_buckets():
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    end = start + timedelta(minutes=MAX_SERIES_BUCKETS + 1)
+
+    with pytest.raises(ValidationError, match="minute buckets"):
+        TimeSeriesQueryDTO(granularity=Granularity.MINUTE, start=start, end=end)
+
+    assert TimeSeriesQueryDTO(granularity=Granularity.HOUR, start=start, end=end)
@@ -0,0 +1,36 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+from application.event.schemas.series_dto import TimeSeriesQueryDTO
+from application.event.services.series import GetTimeSeriesService
+from domain.event.types import EventType
+from domain.rollup.models import RollupCount
+from domain.rollup.types import Granularity
+from domain.utils.generate_uuid import generate_uuid
+
+
+async def test_reads_rollups_from_aligned_start(mock_uow, mock_logger):
+    project_id = generate_uuid()
+    bucket = datetime(2026, 3, 1, 10, tzinfo=UTC)
+    mock_uow.rollup.get_series = AsyncMock(
+        return_value=[RollupCount(project_id, Granularity.HOUR, bucket, EventType.PURCHASE, 7)]
+    )
+    mock_uow.rollup.get_complete_up_to.return_value = bucket
+    service = GetTimeSeriesService(mock_uow, mock_logger)
+    query = TimeSeriesQueryDTO(
+        start=datetime(2026, 3, 1, 10, 30, tzinfo=UTC),
+        end=datetime(2026, 3, 1, 12, tzinfo=UTC),
+        event_type=[EventType.PURCHASE],
+    )
+
+    result = await service(project_id, query)
+
+    mock_uow.rollup.get_series.assert_awaited_once_with(
+        project_id, Granularity.HOUR, bucket, query.end, (EventType.PURCHASE,)
+    )
+    assert result.start == bucket
+    assert result.complete_up_to == bucket
+    mock_uow.rollup.get_complete_up_to.assert_awaited_once_with(project_id)
+    assert [(p.bucket, p.event_type, p.count) for p in result.points] == [
+        (bucket, EventType.PURCHASE, 7)
+    ]
@@ -0,0 +1,93 @@
+from datetime import UTC, datetime, timedelta
+
+import orjson
+
+from application.event.schemas.query_dto import EventQueryDTO, decode_cursor
+from application.event.services import query as query_module
+from application.event.services.query import QueryEventsService, event_payload
+from domain.event.models import Event, Properties
+from domain.event.types import EventType
+from domain.utils.generate_uuid import generate_uuid
+
+
+def make_events(count):
+    start = datetime(2026, 3, 1, tzinfo=UTC)
+    return [
+        Event(
+            event_id=generate_uuid(),
+            project_id=generate_uuid(),
+            user_id="u1",
+            session_id="s1",
+            event_type=EventType.PURCHASE,
+            timestamp=start + timedelta(seconds=i),
+            properties=Properties(product_id="p1", price=1999, quantity=1),
+            created_at=start,
+        )
+        for i in range(count)
+    ]
+
+
+def stream_of(events):
+    def stream(query, limit=None):
+        async def rows():
+            for event in events[:limit]:
+                yield event
+
+        return rows()
+
+    return stream
+
+
+async def collect(service, dto):
+    body = b"".join([chunk async for chunk in service(generate_uuid(), dto)])
+    return [orjson.loads(line) for line in body.splitlines()]
+
+
+def test_event_payload_matches_ingestion_shape():
+    payload = event_payload(make_events(1)[0])
+
+    assert payload["properties"] == {"product_id": "p1", "price": 19.99, "quantity": 1}
+    assert payload["event_type"] == EventType.PURCHASE
+
+
+async def test_streams_all_events_without_limit(mock_uow, mock_logger):
+    events = make_events(3)
+    mock_uow.event.stream = stream_of(events)
+    service = QueryEventsService(mock_uow, mock_logger)
+
+    lines = await collect(service, EventQueryDTO())
+
+    assert [line["event_id"] for line in lines] == [str(e.event_id) for e in events]
+    mock_uow.__aenter__.assert_awaited_once()
+
+
+async def test_limit_adds_cursor_when_more_events_match(mock_uow, mock_logger):
+    events = make_events(5)
+    mock_uow.event.stream = stream_of(events)
+    service = QueryEventsService(mock_uow, mock_logger)
+
+    lines = await collect(service, EventQueryDTO(limit=2))
+
+    assert len(lines) == 3
+    cursor = decode_cursor(lines[-1]["next_cursor"])
+    assert (cursor.timestamp, cursor.event_id) == (events[1].timestamp, events[1].event_id)
+
+
+async def test_limit_without_more_events_has_no_cursor(mock_uow, mock_logger):
+    mock_uow.event.stream = stream_of(make_events(2))
+    service = QueryEventsService(mock_uow, mock_logger)
+
+    lines = await collect(service, EventQueryDTO(limit=2))
+
+    assert len(lines) == 2
+    assert "next_cursor" not in lines[-1]
+
+
+async def test_buffers_lines_into_chunks(mock_uow, mock_logger, monkeypatch):
+    monkeypatch.setattr(query_module, "STREAM_CHUNK_BYTES", 1)
+    mock_uow.event.stream = stream_of(make_events(3))
+    service = QueryEventsService(mock_uow, mock_logger)
+
+    chunks = [chunk async for chunk in service(generate_uuid(), EventQueryDTO())]
+
+    assert len(chunks) == 3
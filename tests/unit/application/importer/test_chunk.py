@@ -0,0 +1,102 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from application.importer.chunk import ImportChunkService, build_events
+from domain.event.types import EventType
+from domain.utils.generate_uuid import generate_uuid
+
+
+def make_row(**overrides):
+    row = {
+        "user_id": "user_1",
+        "session_id": "session_1",
+        "event_type": "page_view",
+        "timestamp": (datetime.now(UTC) - timedelta(days=365)).isoformat(),
+        "properties": {"page_url": "https://example.com", "country": "US"},
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def project_id():
+    return generate_uuid()
+
+
+class TestBuildEvents:
+    def test_accepts_timestamps_older_than_ingest_window(self, project_id):
+        events, rejected = build_events(project_id, "file.ndjson:10", [(1, make_row())])
+
+        assert rejected == []
+        assert events[0].event_type == EventType.PAGE_VIEW
+        assert events[0].project_id == project_id
+        assert events[0].timestamp < datetime.now(UTC) - timedelta(days=300)
+
+    def test_rejects_rows_failing_domain_rules(self, project_id):
+        rows = [
+            (1, make_row(event_type="purchase", properties={"product_id": "p1"})),
+            (2, make_row(timestamp=(datetime.now(UTC) + timedelta(hours=1)).isoformat())),
+            (3, None),
+            (4, make_row()),
+        ]
+
+        events, rejected = build_events(project_id, "file.ndjson:10", rows)
+
+        assert len(events) == 1
+        assert [r.row for r in rejected] == [1, 2, 3]
+        assert "PURCHASE requires price" in rejected[0].error
+        assert rejected[1].error.startswith("timestamp:")
+
+    def test_derives_stable_event_ids(self, project_id):
+        rows = [(1, make_row()), (2, make_row())]
+
+        first, _ = build_events(project_id, "file.ndjson:10", rows)
+        second, _ = build_events(project_id, "file.ndjson:10", rows)
+        other_file, _ = build_events(project_id, "other.ndjson:10", rows)
+
+        assert [e.event_id for e in first] == [e.event_id for e in second]
+        assert first[0].event_id != first[1].event_id
+        assert first[0].event_id != other_file[0].event_id
+        assert first[0].event_id.version == 7
+
+    def test_keeps_provided_event_id(self, project_id):
+        event_id = generate_uuid()
+
+        events, _ = build_events(project_id, "f:1", [(1, make_row(event_id=str(event_id)))])
+
+        assert events[0].event_id == event_id
+
+
+class TestImportChunkService:
+    @pytest.fixture
+    def service(self, mock_uow, mock_logger):
+        mock_uow.event.copy_many.side_effect = lambda events: len(events)
+        return ImportChunkService(uow=mock_uow, logger=mock_logger)
+
+    async def test_copies_valid_rows_in_one_transaction(self, service, mock_uow, project_id):
+        result = await service(project_id, "f:1", [(1, make_row()), (2, {"event_type": "x"})])
+
+        mock_uow.__aenter__.assert_awaited_once()
+        assert len(mock_uow.event.copy_many.await_args.args[0]) == 1
+        mock_uow.rollup.mark_dirty.assert_awaited_once()
+        mock_uow.commit.assert_awaited_once()
+        assert result.rows == 2
+        assert result.inserted == 1
+        assert result.duplicates == 0
+        assert [r.row for r in result.rejected] == [2]
+
+    async def test_reports_duplicates(self, service, mock_uow, project_id):
+        mock_uow.event.copy_many.side_effect = None
+        mock_uow.event.copy_many.return_value = 0
+
+        result = await service(project_id, "f:1", [(1, make_row())])
+
+        assert result.duplicates == 1
+
+    async def test_skips_transaction_when_every_row_is_rejected(self, service, mock_uow, project_id):
+        result = await service(project_id, "f:1", [(1, None)])
+
+        mock_uow.__aenter__.assert_not_awaited()
+        assert result.inserted == 0
+        assert len(result.rejected) == 1
@@ -0,0 +1,117 @@
+import io
+
+import orjson
+import pytest
+
+from application.importer.chunk import ChunkResult, RejectedRow
+from application.importer.runner import ImportRunner, chunked, source_key
+from domain.utils.generate_uuid import generate_uuid
+from infrastructure.importer.checkpoint import ImportCheckpoint
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "events.ndjson"
+    path.write_bytes(b"".join(orjson.dumps({"n": i}) + b"\n" for i in range(10)))
+    return path
+
+
+class RecordingLoader:
+    def __init__(self, fail_on_chunk=None):
+        self.chunks = []
+        self.fail_on_chunk = fail_on_chunk
+
+    async def __call__(self, project_id, source, rows):
+        if rows[0][0] == self.fail_on_chunk:
+            raise ConnectionError("database went away")
+        self.chunks.append([number for number, _ in rows])
+        rejected = [RejectedRow(number, "bad") for number, row in rows if row["n"] == 0]
+        return ChunkResult(rows=len(rows), inserted=len(rows) - len(rejected), rejected=rejected)
+
+
+def make_runner(loader, checkpoint, mock_logger, chunk_size=3, **kwargs):
+    return ImportRunner(
+        load_chunk=loader,
+        checkpoint=checkpoint,
+        logger=mock_logger,
+        chunk_size=chunk_size,
+        parallel=2,
+        **kwargs,
+    )
+
+
+def test_source_key_depends_on_content_not_location(tmp_path):
+    first, second, other = tmp_path / "a", tmp_path / "b", tmp_path / "c"
+    for directory in (first, second, other):
+        directory.mkdir()
+    (first / "events.ndjson").write_bytes(b'{"n": 1}\n')
+    (second / "events.ndjson").write_bytes(b'{"n": 2}\n')
+    (other / "events.ndjson").write_bytes(b'{"n": 1}\n')
+
+    assert source_key(first / "events.ndjson") != source_key(second / "events.ndjson")
+    assert source_key(first / "events.ndjson") == source_key(other / "events.ndjson")
+
+
+def test_chunked():
+    assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+async def test_loads_every_row_in_chunks(source_file, tmp_path, mock_logger):
+    loader = RecordingLoader()
+    rejects = io.BytesIO()
+    runner = make_runner(loader, ImportCheckpoint(tmp_path / "cp"), mock_logger, rejects=rejects)
+
+    progress = await runner.run(generate_uuid(), [source_file])
+
+    assert sorted(loader.chunks) == [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10]]
+    assert progress.rows == 10
+    assert progress.inserted == 9
+    assert progress.rejected == 1
+    assert progress.chunks == 4
+    assert orjson.loads(rejects.getvalue()) == {
+        "source": source_key(source_file),
+        "row": 1,
+        "error": "bad",
+    }
+
+
+async def test_resumes_after_last_committed_chunk(source_file, tmp_path, mock_logger):
+    checkpoint_path = tmp_path / "cp"
+    failing = RecordingLoader(fail_on_chunk=7)
+
+    with pytest.raises(ConnectionError):
+        await make_runner(failing, ImportCheckpoint(checkpoint_path), mock_logger).run(
+            generate_uuid(), [source_file]
+        )
+
+    resumed = RecordingLoader()
+    progress = await make_runner(resumed, ImportCheckpoint(checkpoint_path), mock_logger).run(
+        generate_uuid(), [source_file]
+    )
+
+    assert [1, 2, 3] not in resumed.chunks
+    assert [7, 8, 9] in resumed.chunks
+    assert progress.skipped + progress.rows == 10
+
+
+async def test_resume_with_another_chunk_size_loads_every_uncommitted_row(
+    source_file, tmp_path, mock_logger
+):
+    checkpoint_path = tmp_path / "cp"
+    failing = RecordingLoader(fail_on_chunk=4)
+
+    with pytest.raises(ConnectionError):
+        await make_runner(
+            failing, ImportCheckpoint(checkpoint_path), mock_logger, chunk_size=3
+        ).run(generate_uuid(), [source_file])
+
+    committed = {number for chunk in failing.chunks for number in chunk}
+    resumed = RecordingLoader()
+    progress = await make_runner(
+        resumed, ImportCheckpoint(checkpoint_path), mock_logger, chunk_size=5
+    ).run(generate_uuid(), [source_file])
+
+    loaded = {number for chunk in resumed.chunks for number in chunk}
+    assert loaded == set(range(1, 11)) - committed
+    assert progress.skipped == len(committed)
+    assert progress.rows == 10 - len(committed)
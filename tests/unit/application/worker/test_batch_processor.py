@@ -1,7 +1,20 @@
-from unittest.mock import AsyncMock, MagicMock
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
 import pytest
 
 from application.worker.batch_processor import BatchProcessor
+from domain.event.consumer import ConsumedEvent
+from domain.project.types import Plan
+from domain.rollup.models import RollupBucket
+from domain.rollup.types import Granularity
+from infrastructure.metrics.worker import (
+    BATCH_PROCESSING_TIME,
+    BATCH_STAGE_DURATION,
+    INGEST_TO_COMMIT_LATENCY,
+    ROLLUP_LATE_EVENTS,
+    ROWS_WRITTEN,
+)
 
 @pytest.fixture
 def mock_consumer():
@@ -12,6 +25,15 @@ def mock_consumer():
     return consumer
 
 
+@pytest.fixture
+def mock_uow(mock_uow):
+    async def add_new(events):
+        return events
+
+    mock_uow.event.add_new = AsyncMock(side_effect=add_new)
+    return mock_uow
+
+
 @pytest.fixture
 def processor(mock_consumer, mock_uow, mock_logger, mock_settings):
     return BatchProcessor(
@@ -22,6 +44,16 @@ def processor(mock_consumer, mock_uow, mock_logger, mock_settings):
     )
 
 
+def _sample(metric, suffix: str, **labels: str) -> float:
+    for collected in metric.collect():
+        for sample in collected.samples:
+            if sample.name.endswith(suffix) and all(
+                sample.labels.get(k) == v for k, v in labels.items()
+            ):
+                return sample.value
+    return 0.0
+
+
 async def test_ensure_startup_calls_consumer(processor, mock_consumer):
     await processor.ensure_startup()
     mock_consumer.ensure_group.assert_called_once()
@@ -36,11 +68,119 @@ async def test_process_empty_batch(processor, mock_consumer):
     mock_consumer.ack.assert_not_called()
 
 
-async def test_process_batch_success(processor, mock_consumer):
-    event1 = MagicMock(msg_id="1")
-    event2 = MagicMock(msg_id="2")
+async def test_process_batch_success(processor, mock_consumer, make_event):
+    event1 = ConsumedEvent(msg_id="1", event=make_event())
+    event2 = ConsumedEvent(msg_id="2", event=make_event())
     mock_consumer.read_batch.return_value = [event1, event2]
 
     await processor.process()
 
     mock_consumer.ack.assert_called_once_with(["1", "2"])
+
+
+async def test_process_batch_observes_ingest_latency_by_plan(processor, mock_consumer, make_event):
+    count_before = _sample(INGEST_TO_COMMIT_LATENCY, "_count", plan="pro")
+    sum_before = _sample(INGEST_TO_COMMIT_LATENCY, "_sum", plan="pro")
+    unknown_before = _sample(INGEST_TO_COMMIT_LATENCY, "_count", plan="unknown")
+
+    stale = replace(make_event(), created_at=datetime.now(UTC) - timedelta(seconds=5))
+    mock_consumer.read_batch.return_value = [
+        ConsumedEvent(msg_id="1", event=stale, plan=Plan.PRO),
+        ConsumedEvent(msg_id="2", event=make_event()),
+    ]
+
+    await processor.process()
+
+    assert _sample(INGEST_TO_COMMIT_LATENCY, "_count", plan="pro") == count_before + 1
+    assert _sample(INGEST_TO_COMMIT_LATENCY, "_sum", plan="pro") - sum_before >= 5
+    assert _sample(INGEST_TO_COMMIT_LATENCY, "_count", plan="unknown") == unknown_before + 1
+
+
+
+async def test_process_batch_counts_inserted_and_deduplicated_rows(
+    processor, mock_consumer, mock_uow, make_event
+):
+    inserted_before = _sample(ROWS_WRITTEN, "_total", result="inserted")
+    deduplicated_before = _sample(ROWS_WRITTEN, "_total", result="deduplicated")
+    events = [make_event() for _ in range(3)]
+    mock_uow.event.add_new = AsyncMock(return_value=events[:1])
+    mock_consumer.read_batch.return_value = [
+        ConsumedEvent(msg_id=str(i), event=event) for i, event in enumerate(events)
+    ]
+
+    await processor.process()
+
+    assert _sample(ROWS_WRITTEN, "_total", result="inserted") == inserted_before + 1
+    assert _sample(ROWS_WRITTEN, "_total", result="deduplicated") == deduplicated_before + 2
+
+
+async def test_process_batch_rolls_up_only_inserted_events_before_commit(
+    processor, mock_consumer, mock_uow, make_event
+):
+    new_event, duplicate = make_event(), make_event()
+    mock_uow.event.add_new = AsyncMock(return_value=[new_event])
+    mock_consumer.read_batch.return_value = [
+        ConsumedEvent(msg_id="1", event=new_event),
+        ConsumedEvent(msg_id="2", event=duplicate),
+    ]
+    calls = []
+    mock_uow.rollup.add.side_effect = lambda counts: calls.append(("rollup", counts))
+    mock_uow.commit.side_effect = lambda: calls.append(("commit", None))
+
+    await processor.process()
+
+    assert [name for name, _ in calls] == ["rollup", "commit"]
+    counts = calls[0][1]
+    assert len(counts) == 3
+    assert {c.granularity for c in counts} == set(Granularity)
+    assert all(c.count == 1 and c.project_id == new_event.project_id for c in counts)
+
+
+async def test_process_batch_defers_late_events_to_recomputation(
+    processor, mock_consumer, mock_uow, make_event
+):
+    late_before = _sample(ROLLUP_LATE_EVENTS, "_total")
+    now = datetime.now(UTC)
+    on_time = make_event(timestamp=now)
+    late = make_event(project_id=on_time.project_id, timestamp=now - timedelta(days=2))
+    mock_uow.rollup.get_watermarks.return_value = {on_time.project_id: now - timedelta(hours=1)}
+    mock_consumer.read_batch.return_value = [
+        ConsumedEvent(msg_id="1", event=on_time),
+        ConsumedEvent(msg_id="2", event=late),
+    ]
+
+    await processor.process()
+
+    counts = mock_uow.rollup.add.await_args.args[0]
+    assert {c.bucket for c in counts if c.granularity == Granularity.MINUTE} == {
+        Granularity.MINUTE.truncate(now)
+    }
+    mock_uow.rollup.mark_dirty.assert_awaited_once_with(
+        [RollupBucket(late.project_id, Granularity.HOUR.truncate(late.timestamp))]
+    )
+    (watermarks,) = mock_uow.rollup.advance_watermarks.await_args.args
+    assert watermarks == {on_time.project_id: now - timedelta(seconds=300)}
+    assert _sample(ROLLUP_LATE_EVENTS, "_total") == late_before + 1
+
+
+async def test_process_batch_times_each_stage(processor, mock_consumer, make_event):
+    before = {
+        stage: _sample(BATCH_STAGE_DURATION, "_count", stage=stage)
+        for stage in ("insert", "rollup", "commit", "ack")
+    }
+    mock_consumer.read_batch.return_value = [ConsumedEvent(msg_id="1", event=make_event())]
+
+    await processor.process()
+
+    for stage, count in before.items():
+        assert _sample(BATCH_STAGE_DURATION, "_count", stage=stage) == count + 1
+
+
+async def test_process_read_failure_propagates_without_observing_batch(processor, mock_consumer):
+    count_before = _sample(BATCH_PROCESSING_TIME, "_count")
+    mock_consumer.read_batch.side_effect = ConnectionError("redis down")
+
+    with pytest.raises(ConnectionError):
+        await processor.process()
+
+    assert _sample(BATCH_PROCESSING_TIME, "_count") == count_before
@@ -0,0 +1,61 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from application.worker.graceful_killer import GracefulKiller
+from application.worker.rollup_recompute import RollupRecomputer
+from domain.rollup.models import RollupBucket
+from domain.utils.generate_uuid import generate_uuid
+
+
+@pytest.fixture
+def killer():
+    return GracefulKiller()
+
+
+@pytest.fixture
+def recomputer(mock_uow, killer, mock_logger, mock_settings):
+    return RollupRecomputer(uow=mock_uow, killer=killer, logger=mock_logger, settings=mock_settings)
+
+
+def _buckets(count: int) -> list[RollupBucket]:
+    project_id = generate_uuid()
+    start = datetime(2026, 3, 1, tzinfo=UTC)
+    return [RollupBucket(project_id, start + timedelta(hours=i)) for i in range(count)]
+
+
+async def test_run_once_recomputes_each_bucket_in_its_own_transaction(recomputer, mock_uow):
+    buckets = _buckets(2)
+    mock_uow.rollup.get_dirty.return_value = buckets
+    mock_uow.rollup.recompute = AsyncMock(side_effect=[True, False])
+
+    assert await recomputer.run_once() == 1
+
+    mock_uow.rollup.get_dirty.assert_awaited_once_with(20)
+    assert [call.args[0] for call in mock_uow.rollup.recompute.await_args_list] == buckets
+    assert mock_uow.__aenter__.await_count == 2
+    assert mock_uow.commit.await_count == 2
+
+
+async def test_run_once_stops_on_shutdown(recomputer, mock_uow, killer):
+    mock_uow.rollup.get_dirty.return_value = _buckets(3)
+    killer.shutdown_event.set()
+
+    assert await recomputer.run_once() == 0
+
+    mock_uow.rollup.recompute.assert_not_awaited()
+
+
+async def test_run_survives_failed_job_and_exits_on_shutdown(
+    recomputer, mock_uow, killer, mock_logger
+):
+    async def get_dirty(limit):
+        killer.shutdown_event.set()
+        raise ConnectionError("db down")
+
+    mock_uow.rollup.get_dirty = AsyncMock(side_effect=get_dirty)
+
+    await recomputer.run()
+
+    mock_logger.error.assert_called_once_with("rollup_recompute_failed", error="db down")
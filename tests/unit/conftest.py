@@ -10,9 +10,13 @@ def mock_uow():
 
     uow.project = AsyncMock()
     uow.event = AsyncMock()
+    uow.rollup = AsyncMock()
     uow.project.add = AsyncMock()
     uow.project.get_by_api_key = AsyncMock(return_value=None)
     uow.project.get_by_id = AsyncMock(return_value=None)
+    uow.rollup.get_watermarks = AsyncMock(return_value={})
+    uow.rollup.get_dirty = AsyncMock(return_value=[])
+    uow.rollup.get_complete_up_to = AsyncMock(return_value=None)
 
     uow.__aenter__.return_value = uow
     uow.__aexit__.return_value = None
@@ -50,6 +54,16 @@ def mock_cache() -> AsyncMock:
     return cache
 
 
+@pytest.fixture
+def mock_project_cache() -> AsyncMock:
+    async def resolve(api_key, loader):
+        return await loader(api_key)
+
+    project_cache = AsyncMock()
+    project_cache.resolve = AsyncMock(side_effect=resolve)
+    return project_cache
+
+
 @pytest.fixture
 def mock_validator() -> MagicMock:
     validator = MagicMock(spec=SecretTokenValidator)
@@ -0,0 +1,121 @@
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from domain.event.types import EventType
+from domain.rollup.models import (
+    RollupBucket,
+    count_events,
+    dirty_hours,
+    next_watermarks,
+    split_late,
+)
+from domain.rollup.types import Granularity
+from domain.utils.generate_uuid import generate_uuid
+
+
+@pytest.mark.parametrize(
+    ("granularity", "expected"),
+    [
+        (Granularity.MINUTE, datetime(2026, 3, 1, 23, 45, tzinfo=UTC)),
+        (Granularity.HOUR, datetime(2026, 3, 1, 23, tzinfo=UTC)),
+        (Granularity.DAY, datetime(2026, 3, 1, tzinfo=UTC)),
+    ],
+)
+def test_truncate_to_utc_bucket(granularity, expected):
+    # 2026-03-02 01:45:30 at +02:00 is 2026-03-01 23:45:30 UTC
+    timestamp = datetime(2026, 3, 2, 1, 45, 30, 500, tzinfo=timezone(timedelta(hours=2)))
+
+    assert granularity.truncate(timestamp) == expected
+
+
+def test_count_events_per_bucket_type_and_granularity(make_event):
+    project_id = generate_uuid()
+    base = datetime(2026, 3, 1, 10, 0, 5, tzinfo=UTC)
+    events = [
+        make_event(project_id=project_id, timestamp=base),
+        make_event(project_id=project_id, timestamp=base + timedelta(seconds=30)),
+        make_event(project_id=project_id, timestamp=base + timedelta(minutes=1)),
+        make_event(project_id=project_id, timestamp=base, event_type=EventType.PURCHASE),
+    ]
+
+    counts = {(c.granularity, c.bucket, c.event_type): c.count for c in count_events(events)}
+
+    page_view, purchase = EventType.PAGE_VIEW, EventType.PURCHASE
+    assert counts == {
+        (Granularity.MINUTE, datetime(2026, 3, 1, 10, 0, tzinfo=UTC), page_view): 2,
+        (Granularity.MINUTE, datetime(2026, 3, 1, 10, 1, tzinfo=UTC), page_view): 1,
+        (Granularity.MINUTE, datetime(2026, 3, 1, 10, 0, tzinfo=UTC), purchase): 1,
+        (Granularity.HOUR, datetime(2026, 3, 1, 10, tzinfo=UTC), page_view): 3,
+        (Granularity.HOUR, datetime(2026, 3, 1, 10, tzinfo=UTC), purchase): 1,
+        (Granularity.DAY, datetime(2026, 3, 1, tzinfo=UTC), page_view): 3,
+        (Granularity.DAY, datetime(2026, 3, 1, tzinfo=UTC), purchase): 1,
+    }
+
+
+def test_count_events_sorted_by_primary_key(make_event):
+    base = datetime(2026, 3, 1, tzinfo=UTC)
+    events = [
+        make_event(timestamp=base + timedelta(hours=i), event_type=event_type)
+        for i in (3, 1, 2)
+        for event_type in (EventType.PURCHASE, EventType.PAGE_VIEW)
+    ]
+
+    counts = count_events(events)
+
+    keys = [(c.project_id, c.granularity, c.bucket, c.event_type) for c in counts]
+    assert keys == sorted(keys)
+
+
+def test_count_events_empty():
+    assert count_events([]) == []
+
+
+def test_split_late_against_project_watermark(make_event):
+    project_id, other_project = generate_uuid(), generate_uuid()
+    watermark = datetime(2026, 3, 1, 10, tzinfo=UTC)
+    late = make_event(project_id=project_id, timestamp=watermark - timedelta(seconds=1))
+    on_time = make_event(project_id=project_id, timestamp=watermark)
+    # A project without a watermark has no late events yet
+    first = make_event(project_id=other_project, timestamp=watermark - timedelta(days=1))
+
+    assert split_late([late, on_time, first], {project_id: watermark}) == (
+        [on_time, first],
+        [late],
+    )
+
+
+def test_next_watermarks_trails_newest_event_per_project(make_event):
+    project_id = generate_uuid()
+    now = datetime(2026, 3, 1, 12, tzinfo=UTC)
+    events = [
+        replace(make_event(project_id=project_id, timestamp=now - timedelta(hours=h)), created_at=now)
+        for h in (1, 2)
+    ]
+
+    assert next_watermarks(events, timedelta(minutes=5)) == {
+        project_id: now - timedelta(hours=1, minutes=5)
+    }
+
+
+def test_next_watermarks_caps_future_timestamps_at_receive_time(make_event):
+    now = datetime(2026, 3, 1, 12, tzinfo=UTC)
+    event = replace(make_event(timestamp=now + timedelta(days=1)), created_at=now)
+
+    assert next_watermarks([event], timedelta(0)) == {event.project_id: now}
+
+
+def test_dirty_hours_are_unique_and_sorted(make_event):
+    project_id = generate_uuid()
+    base = datetime(2026, 3, 1, 10, 30, tzinfo=UTC)
+    events = [
+        make_event(project_id=project_id, timestamp=base + timedelta(hours=1)),
+        make_event(project_id=project_id, timestamp=base),
+        make_event(project_id=project_id, timestamp=base + timedelta(minutes=10)),
+    ]
+
+    assert dirty_hours(events) == [
+        RollupBucket(project_id, datetime(2026, 3, 1, 10, tzinfo=UTC)),
+        RollupBucket(project_id, datetime(2026, 3, 1, 11, tzinfo=UTC)),
+    ]
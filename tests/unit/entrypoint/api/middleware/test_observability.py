@@ -0,0 +1,122 @@
+import pytest
+import structlog
+from unittest.mock import AsyncMock, MagicMock, patch
+from prometheus_client import REGISTRY
+
+from domain.exceptions.app import UnauthorizedError
+from entrypoint.api.middleware.observability import ObservabilityMiddleware
+
+
+@pytest.fixture(name="mock_app")
+def fixture_mock_app():
+    return AsyncMock()
+
+@pytest.fixture(name="middleware")
+def fixture_middleware(mock_app):
+    return ObservabilityMiddleware(app=mock_app)
+
+@pytest.fixture(name="scope")
+def fixture_scope():
+    route = MagicMock()
+    route.path = "/api/v1/event"
+    return {
+        "type": "http",
+        "path": "/api/v1/event",
+        "method": "POST",
+        "headers": [
+            (b"user-agent", b"pytest-agent"),
+            (b"x-request-id", b"123-custom-id"),
+        ],
+        "client": ("127.0.0.1", 8000),
+        "route": route,
+    }
+
+@pytest.fixture(name="send")
+def fixture_send():
+    return AsyncMock()
+
+
+def _requests_total(status: str, handler: str = "/api/v1/event") -> float:
+    value = REGISTRY.get_sample_value(
+        "http_requests_total", {"method": "POST", "status": status, "handler": handler}
+    )
+    return value or 0.0
+
+
+async def test_non_http_scope_is_passed_through(middleware, mock_app, send):
+    scope = {"type": "lifespan"}
+
+    with patch("structlog.contextvars.bind_contextvars") as mock_bind:
+        await middleware(scope, AsyncMock(), send)
+
+    mock_app.assert_awaited_once()
+    mock_bind.assert_not_called()
+
+async def test_successful_request_binds_context_logs_and_counts(middleware, mock_app, scope, send):
+    async def app_side_effect(sc, rec, snd):
+        await snd({"type": "http.response.start", "status": 202})
+
+    mock_app.side_effect = app_side_effect
+    before = _requests_total("2xx")
+
+    with patch("structlog.contextvars.bind_contextvars") as mock_bind:
+        with structlog.testing.capture_logs() as cap_logs:
+            await middleware(scope, AsyncMock(), send)
+
+    call_kwargs = mock_bind.call_args[1]
+    assert call_kwargs["request_id"] == "123-custom-id"
+    assert call_kwargs["user_agent"] == "pytest-agent"
+    assert call_kwargs["client_ip"] == "127.0.0.1"
+    assert cap_logs[-1]["event"] == "request_completed"
+    assert cap_logs[-1]["status_code"] == 202
+    assert _requests_total("2xx") == before + 1
+
+async def test_app_error_is_mapped_and_logged_with_mapped_status(
+    middleware, mock_app, scope, send
+):
+    mock_app.side_effect = UnauthorizedError("Invalid API Key")
+    before = _requests_total("4xx")
+
+    with structlog.testing.capture_logs() as cap_logs:
+        await middleware(scope, AsyncMock(), send)
+
+    start_message = send.await_args_list[0].args[0]
+    assert start_message["status"] == 401
+    assert cap_logs[-1]["event"] == "request_completed"
+    assert cap_logs[-1]["status_code"] == 401
+    assert _requests_total("4xx") == before + 1
+
+async def test_failure_while_sending_error_is_logged_and_reraised(
+    middleware, mock_app, scope
+):
+    mock_app.side_effect = ValueError("Database error")
+    send = AsyncMock(side_effect=RuntimeError("client disconnected"))
+
+    with structlog.testing.capture_logs() as cap_logs:
+        with pytest.raises(RuntimeError, match="client disconnected"):
+            await middleware(scope, AsyncMock(), send)
+
+    assert cap_logs[-1]["event"] == "request_failed"
+    assert cap_logs[-1]["status_code"] == 500
+
+async def test_ignored_path_is_counted_but_not_logged(middleware, mock_app, scope, send):
+    scope["path"] = "/healthz"
+    scope["route"].path = "/healthz"
+    before = _requests_total("5xx", handler="/healthz")
+
+    with structlog.testing.capture_logs() as cap_logs:
+        await middleware(scope, AsyncMock(), send)
+
+    assert cap_logs == []
+    assert _requests_total("5xx", handler="/healthz") == before + 1
+
+async def test_generate_request_id_and_unmatched_route(middleware, mock_app, scope, send):
+    scope["headers"] = []
+    del scope["route"]
+
+    with patch("structlog.contextvars.bind_contextvars") as mock_bind:
+        await middleware(scope, AsyncMock(), send)
+
+    assert len(mock_bind.call_args[1]["request_id"]) > 10
+    assert mock_bind.call_args[1]["user_agent"] == "unknown"
+    assert ObservabilityMiddleware._handler(scope) == "none"
@@ -0,0 +1,128 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fakeredis import aioredis
+
+from domain.exceptions.app import NotFoundError
+from domain.project.models import ProjectIdentity
+from domain.project.types import Plan
+from infrastructure.cache.project import TwoTierProjectCache, project_loader
+
+
+@pytest.fixture
+def redis_client():
+    return aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def cache_settings(mock_settings: MagicMock) -> MagicMock:
+    mock_settings.project_cache_ttl = 300
+    mock_settings.project_cache_local_ttl = 30
+    mock_settings.project_cache_negative_ttl = 15
+    mock_settings.project_cache_max_size = 100
+    mock_settings.project_cache_refresh_ahead = 60
+    return mock_settings
+
+
+@pytest.fixture
+def project_cache(redis_client, cache_settings, mock_logger) -> TwoTierProjectCache:
+    return TwoTierProjectCache(redis_client, cache_settings, mock_logger)
+
+
+@pytest.fixture
+def identity(make_project) -> ProjectIdentity:
+    return ProjectIdentity.from_project(make_project(plan=Plan.PRO))
+
+
+async def test_resolve_loads_once_and_serves_from_local_tier(project_cache, identity):
+    loader = AsyncMock(return_value=identity)
+
+    assert await project_cache.resolve("wk_test_key", loader) == identity
+    assert await project_cache.resolve("wk_test_key", loader) == identity
+
+    loader.assert_awaited_once_with("wk_test_key")
+
+
+async def test_resolve_reads_shared_tier_from_another_replica(
+    redis_client, cache_settings, mock_logger, identity
+):
+    first = TwoTierProjectCache(redis_client, cache_settings, mock_logger)
+    second = TwoTierProjectCache(redis_client, cache_settings, mock_logger)
+    await first.resolve("wk_test_key", AsyncMock(return_value=identity))
+
+    loader = AsyncMock()
+    assert await second.resolve("wk_test_key", loader) == identity
+    loader.assert_not_awaited()
+
+
+async def test_unknown_key_is_cached_negatively(project_cache, redis_client, cache_settings):
+    loader = AsyncMock(return_value=None)
+
+    assert await project_cache.resolve("wk_test_unknown", loader) is None
+    assert await project_cache.resolve("wk_test_unknown", loader) is None
+
+    loader.assert_awaited_once()
+    ttl = await redis_client.ttl("project:api_key:wk_test_unknown")
+    assert 0 < ttl <= cache_settings.project_cache_negative_ttl
+
+
+async def test_concurrent_misses_share_one_load(project_cache, identity):
+    async def slow_load(api_key: str) -> ProjectIdentity:
+        await asyncio.sleep(0.01)
+        return identity
+
+    loader = AsyncMock(side_effect=slow_load)
+
+    results = await asyncio.gather(
+        *(project_cache.resolve("wk_test_key", loader) for _ in range(20))
+    )
+
+    assert results == [identity] * 20
+    loader.assert_awaited_once()
+
+
+async def test_shared_entry_close_to_expiry_is_refreshed_ahead(
+    redis_client, cache_settings, mock_logger, identity
+):
+    first = TwoTierProjectCache(redis_client, cache_settings, mock_logger)
+    await first.resolve("wk_test_key", AsyncMock(return_value=identity))
+    await redis_client.expire("project:api_key:wk_test_key", 10)
+
+    second = TwoTierProjectCache(redis_client, cache_settings, mock_logger)
+    loader = AsyncMock(return_value=identity)
+    assert await second.resolve("wk_test_key", loader) == identity
+    await asyncio.sleep(0.01)
+
+    loader.assert_awaited_once_with("wk_test_key")
+    assert await redis_client.ttl("project:api_key:wk_test_key") > 10
+
+
+async def test_invalidate_drops_both_tiers_and_publishes(project_cache, redis_client, identity):
+    await project_cache.resolve("wk_test_key", AsyncMock(return_value=identity))
+
+    async with redis_client.pubsub() as pubsub:
+        await pubsub.subscribe("project_cache:invalidate")
+        await project_cache.invalidate("wk_test_key")
+        await pubsub.get_message(timeout=1)  # subscribe confirmation
+        message = await pubsub.get_message(timeout=1)
+
+    assert message["data"] == "project:api_key:wk_test_key"
+    assert await redis_client.exists("project:api_key:wk_test_key") == 0
+
+    loader = AsyncMock(return_value=identity)
+    await project_cache.resolve("wk_test_key", loader)
+    loader.assert_awaited_once()
+
+
+async def test_project_loader_maps_not_found_to_none(mock_uow: AsyncMock) -> None:
+    mock_uow.project.get_by_api_key.side_effect = NotFoundError("missing")
+
+    assert await project_loader(mock_uow)("wk_test_missing") is None
+
+
+async def test_project_loader_returns_identity(mock_uow: AsyncMock, make_project) -> None:
+    project = make_project()
+    mock_uow.project.get_by_api_key.return_value = project
+
+    assert await project_loader(mock_uow)(project.api_key) == ProjectIdentity.from_project(project)
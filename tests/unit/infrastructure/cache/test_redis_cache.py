@@ -0,0 +1,30 @@
+import pytest
+from fakeredis import aioredis
+
+from infrastructure.cache.redis import RedisCache
+
+
+@pytest.fixture
+def redis_cache() -> RedisCache:
+    return RedisCache(aioredis.FakeRedis(decode_responses=True))
+
+
+async def test_get_with_ttl_returns_value_and_ttl(redis_cache: RedisCache) -> None:
+    await redis_cache.set("key", {"a": 1}, ttl=100)
+
+    value, ttl = await redis_cache.get_with_ttl("key")
+
+    assert value == {"a": 1}
+    assert 0 < ttl <= 100
+
+
+async def test_get_with_ttl_missing_key(redis_cache: RedisCache) -> None:
+    assert await redis_cache.get_with_ttl("missing") == (None, -2)
+
+
+async def test_delete(redis_cache: RedisCache) -> None:
+    await redis_cache.set("key", "value")
+
+    await redis_cache.delete("key")
+
+    assert await redis_cache.get("key") is None
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from infrastructure.cache.single_flight import SingleFlight
+
+
+async def test_concurrent_calls_share_result():
+    flight: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(flight.run("key", work) for _ in range(10)))
+
+    assert results == [42] * 10
+    assert calls == 1
+    assert len(flight) == 0
+
+
+async def test_different_keys_run_separately():
+    flight: SingleFlight[str] = SingleFlight()
+
+    async def work(value: str) -> str:
+        await asyncio.sleep(0)
+        return value
+
+    results = await asyncio.gather(
+        flight.run("a", lambda: work("a")), flight.run("b", lambda: work("b"))
+    )
+
+    assert results == ["a", "b"]
+
+
+async def test_exception_is_shared_and_key_released():
+    flight: SingleFlight[int] = SingleFlight()
+
+    async def fail() -> int:
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flight.run("key", fail), flight.run("key", fail), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(flight) == 0
+
+
+async def test_cancelled_caller_does_not_cancel_shared_work():
+    flight: SingleFlight[int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def work() -> int:
+        await release.wait()
+        return 1
+
+    first = asyncio.create_task(flight.run("key", work))
+    second = asyncio.create_task(flight.run("key", work))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+
+    assert await second == 1
+    with pytest.raises(asyncio.CancelledError):
+        await first
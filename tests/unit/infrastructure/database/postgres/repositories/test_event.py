@@ -0,0 +1,15 @@
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock
+
+from infrastructure.database.postgres.repositories.event import PostgresEventRepository
+
+
+async def test_add_new_returns_an_id_repeated_in_the_batch_once(make_event):
+    event, stored = make_event(), make_event()
+    retried = replace(event)
+    connection = MagicMock()
+    # ON CONFLICT DO NOTHING inserts the repeated id once and skips the stored event
+    connection.fetch = AsyncMock(return_value=[{"event_id": event.event_id}])
+    repository = PostgresEventRepository(connection)
+
+    assert await repository.add_new([event, stored, retried]) == [event]
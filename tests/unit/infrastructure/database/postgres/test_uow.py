@@ -0,0 +1,115 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from infrastructure.database.postgres.connection import LazyConnection
+from infrastructure.database.postgres.uow import PostgresUnitOfWork
+
+
+@pytest.fixture
+def mock_transaction() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_pool_connection(mock_transaction: AsyncMock) -> MagicMock:
+    connection = MagicMock()
+    connection.transaction = MagicMock(return_value=mock_transaction)
+    connection.fetchrow = AsyncMock(return_value={"id": 1})
+    return connection
+
+
+@pytest.fixture
+def mock_pool(mock_pool_connection: MagicMock) -> MagicMock:
+    pool = MagicMock()
+    pool.acquire = AsyncMock(return_value=mock_pool_connection)
+    pool.release = AsyncMock()
+    pool.fetchrow = AsyncMock(return_value={"id": 2})
+    pool.execute = AsyncMock(return_value="INSERT 0 1")
+    return pool
+
+
+async def test_lazy_connection_does_not_acquire_on_creation(mock_pool):
+    connection = LazyConnection(mock_pool)
+    PostgresUnitOfWork(connection)
+
+    assert connection.is_acquired is False
+    mock_pool.acquire.assert_not_called()
+
+
+async def test_query_outside_transaction_uses_pool(mock_pool):
+    connection = LazyConnection(mock_pool)
+
+    row = await connection.fetchrow("SELECT 1")
+
+    assert row == {"id": 2}
+    mock_pool.fetchrow.assert_awaited_once_with("SELECT 1")
+    mock_pool.acquire.assert_not_called()
+
+
+async def test_transaction_pins_connection_until_commit(
+    mock_pool, mock_pool_connection, mock_transaction
+):
+    connection = LazyConnection(mock_pool)
+    uow = PostgresUnitOfWork(connection)
+
+    async with uow:
+        assert connection.is_acquired is True
+        row = await connection.fetchrow("SELECT 1")
+        await uow.commit()
+
+    assert row == {"id": 1}
+    mock_pool.fetchrow.assert_not_called()
+    mock_transaction.start.assert_awaited_once()
+    mock_transaction.commit.assert_awaited_once()
+    mock_transaction.rollback.assert_not_called()
+    mock_pool.release.assert_awaited_once_with(mock_pool_connection)
+    assert connection.is_acquired is False
+
+
+async def test_exception_rolls_back_and_releases(
+    mock_pool, mock_pool_connection, mock_transaction
+):
+    connection = LazyConnection(mock_pool)
+    uow = PostgresUnitOfWork(connection)
+
+    with pytest.raises(ValueError):
+        async with uow:
+            raise ValueError("boom")
+
+    mock_transaction.rollback.assert_awaited_once()
+    mock_pool.release.assert_awaited_once_with(mock_pool_connection)
+
+
+async def test_exit_without_commit_rolls_back(mock_pool, mock_transaction):
+    connection = LazyConnection(mock_pool)
+
+    async with PostgresUnitOfWork(connection):
+        pass
+
+    mock_transaction.rollback.assert_awaited_once()
+    assert connection.is_acquired is False
+
+
+async def test_failed_transaction_start_releases_connection(
+    mock_pool, mock_pool_connection, mock_transaction
+):
+    mock_transaction.start.side_effect = ConnectionError("db down")
+    connection = LazyConnection(mock_pool)
+
+    with pytest.raises(ConnectionError):
+        async with PostgresUnitOfWork(connection):
+            pass
+
+    mock_pool.release.assert_awaited_once_with(mock_pool_connection)
+    assert connection.is_acquired is False
+
+
+async def test_release_is_idempotent(mock_pool):
+    connection = LazyConnection(mock_pool)
+
+    await connection.acquire()
+    await connection.release()
+    await connection.release()
+
+    mock_pool.release.assert_awaited_once()
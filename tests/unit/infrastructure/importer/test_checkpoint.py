@@ -0,0 +1,41 @@
+from infrastructure.importer.checkpoint import ImportCheckpoint
+
+
+def test_tracks_ranges_finished_out_of_order(tmp_path):
+    checkpoint = ImportCheckpoint(tmp_path / "cp")
+
+    checkpoint.mark_done("a.csv:ab", 20, 30)
+    checkpoint.mark_done("a.csv:ab", 0, 10)
+
+    assert checkpoint.pending("a.csv:ab", 0, 10) == []
+    assert checkpoint.pending("a.csv:ab", 10, 20) == [(10, 20)]
+    assert checkpoint.pending("a.csv:ab", 20, 30) == []
+    assert checkpoint.pending("b.csv:ab", 0, 10) == [(0, 10)]
+
+
+def test_pending_splits_ranges_with_different_boundaries(tmp_path):
+    checkpoint = ImportCheckpoint(tmp_path / "cp")
+    checkpoint.mark_done("a.csv:ab", 0, 10)
+    checkpoint.mark_done("a.csv:ab", 20, 30)
+
+    assert checkpoint.pending("a.csv:ab", 0, 50) == [(10, 20), (30, 50)]
+    assert checkpoint.pending("a.csv:ab", 5, 25) == [(10, 20)]
+
+
+def test_compacts_into_committed_offset_and_persists(tmp_path):
+    path = tmp_path / "cp"
+    checkpoint = ImportCheckpoint(path)
+    for start, end in ((10, 20), (0, 10), (30, 40), (15, 35)):
+        checkpoint.mark_done("a.csv:ab", start, end)
+    checkpoint.mark_done("a.csv:ab", 50, 60)
+
+    assert path.read_text() == '{"a.csv:ab":{"committed":40,"spans":[[50,60]]}}'
+    assert ImportCheckpoint(path).pending("a.csv:ab", 30, 60) == [(40, 50)]
+
+
+def test_without_path_keeps_state_in_memory():
+    checkpoint = ImportCheckpoint(None)
+
+    checkpoint.mark_done("a.csv:ab", 0, 3)
+
+    assert checkpoint.pending("a.csv:ab", 0, 3) == []
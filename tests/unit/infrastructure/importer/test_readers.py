@@ -0,0 +1,53 @@
+import gzip
+from pathlib import Path
+
+import pytest
+
+from infrastructure.importer.readers import FileFormat, detect_format, read_rows
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("events.ndjson", FileFormat.NDJSON),
+        ("events.jsonl.gz", FileFormat.NDJSON),
+        ("events.csv.gz", FileFormat.CSV),
+        ("events.parquet", FileFormat.PARQUET),
+    ],
+)
+def test_detect_format(name, expected):
+    assert detect_format(Path(name)) == expected
+
+
+def test_detect_format_rejects_unknown_suffix():
+    with pytest.raises(ValueError, match="Cannot detect format"):
+        detect_format(Path("events.txt"))
+
+
+def test_read_ndjson_numbers_rows_and_keeps_broken_lines(tmp_path):
+    path = tmp_path / "events.ndjson.gz"
+    with gzip.open(path, "wb") as file:
+        file.write(b'{"event_type": "page_view"}\n\nnot json\n[1, 2]\n')
+
+    assert list(read_rows(path)) == [(1, {"event_type": "page_view"}), (2, None), (3, None)]
+
+
+def test_read_csv_builds_properties(tmp_path):
+    path = tmp_path / "events.csv"
+    path.write_text(
+        "event_type,timestamp,user_id,properties,properties.price\n"
+        'purchase,2025-01-01T00:00:00Z,,"{""product_id"": ""p1""}",9.99\n'
+        "page_view,2025-01-01T00:00:00Z,u1,{broken,\n"
+    )
+
+    rows = list(read_rows(path))
+
+    assert rows[0] == (
+        1,
+        {
+            "event_type": "purchase",
+            "timestamp": "2025-01-01T00:00:00Z",
+            "properties": {"product_id": "p1", "price": "9.99"},
+        },
+    )
+    assert rows[1] == (2, None)
@@ -0,0 +1,50 @@
+import pytest
+import structlog
+
+from infrastructure.logger.processors import EventSampler, WarningCallsiteAdder
+
+
+def test_sampler_passes_events_without_rate() -> None:
+    sampler = EventSampler({"request_completed": 0.01}, rand=lambda: 0.99)
+    event = {"event": "project_created"}
+
+    assert sampler(None, "info", event) is event
+
+
+def test_sampler_drops_events_above_rate() -> None:
+    sampler = EventSampler({"request_completed": 0.01}, rand=lambda: 0.5)
+
+    with pytest.raises(structlog.DropEvent):
+        sampler(None, "info", {"event": "request_completed", "status_code": 202})
+
+
+def test_sampler_keeps_sampled_events_with_rate() -> None:
+    sampler = EventSampler({"request_completed": 0.01}, rand=lambda: 0.001)
+
+    event = sampler(None, "info", {"event": "request_completed", "status_code": 202})
+
+    assert event["sample_rate"] == 0.01
+
+
+@pytest.mark.parametrize(
+    ("method_name", "event"),
+    [
+        ("error", {"event": "request_completed"}),
+        ("warning", {"event": "request_completed"}),
+        ("info", {"event": "request_completed", "status_code": 500}),
+    ],
+)
+def test_sampler_always_keeps_errors(method_name: str, event: dict) -> None:
+    sampler = EventSampler({"request_completed": 0.0}, rand=lambda: 0.99)
+
+    assert sampler(None, method_name, event) is event
+
+
+def test_callsite_only_added_for_warnings() -> None:
+    adder = WarningCallsiteAdder()
+
+    info = adder(None, "info", {"event": "batch_received"})
+    warning = adder(None, "warning", {"event": "batch_failed"})
+
+    assert "lineno" not in info
+    assert warning["func_name"] == "test_callsite_only_added_for_warnings"
@@ -0,0 +1,26 @@
+import logging
+
+from infrastructure.logger import setup
+from infrastructure.logger.setup import RecordQueueHandler, start_queue_listener
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def test_queue_listener_hands_records_over_unformatted() -> None:
+    target = CollectingHandler()
+    queue_handler = start_queue_listener(target)
+    event = {"event": "hello", "a": 1}
+    record = logging.LogRecord("x", logging.INFO, __file__, 1, event, None, None)
+
+    queue_handler.handle(record)
+    setup._listener.stop()  # drains the queue before returning
+
+    assert isinstance(queue_handler, RecordQueueHandler)
+    assert target.records[0].msg is event
@@ -0,0 +1,55 @@
+import asyncio
+import time
+from contextlib import suppress
+
+from infrastructure.metrics.event_loop import EVENT_LOOP_LAG, EventLoopMonitor
+
+
+def _sample(suffix: str) -> float:
+    for metric in EVENT_LOOP_LAG.collect():
+        for sample in metric.samples:
+            if sample.name.endswith(suffix):
+                return sample.value
+    return 0.0
+
+
+async def _run_briefly(monitor: EventLoopMonitor, blocking_call) -> None:
+    task = asyncio.create_task(monitor.run())
+    await asyncio.sleep(0.05)
+    blocking_call()
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+
+
+def block_the_loop() -> None:
+    time.sleep(0.2)
+
+
+async def test_monitor_observes_lag_from_blocking_call(mock_logger):
+    count_before = _sample("_count")
+    sum_before = _sample("_sum")
+
+    await _run_briefly(EventLoopMonitor(mock_logger, interval=0.01), block_the_loop)
+
+    assert _sample("_count") > count_before
+    assert _sample("_sum") - sum_before >= 0.15
+    mock_logger.warning.assert_not_called()
+
+
+async def test_monitor_reports_stack_of_blocking_call(mock_logger):
+    monitor = EventLoopMonitor(mock_logger, interval=0.5, block_threshold=0.05)
+
+    await _run_briefly(monitor, block_the_loop)
+
+    mock_logger.warning.assert_called_once()
+    args, kwargs = mock_logger.warning.call_args
+    assert args == ("event_loop_blocked",)
+    assert kwargs["blocked_for"] >= 0.05
+    assert "block_the_loop" in kwargs["stack"]
+
+
+def test_monitor_ticks_often_enough_for_block_threshold(mock_logger):
+    assert EventLoopMonitor(mock_logger, interval=0.5)._interval == 0.5
+    assert EventLoopMonitor(mock_logger, interval=0.5, block_threshold=0.1)._interval == 0.05
@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from prometheus_client import REGISTRY
+
+from infrastructure.metrics.registry import MULTIPROC_DIR_ENV, exposition_registry
+
+SRC_DIR = Path(__file__).parents[4] / "src"
+
+INCREMENT = """
+from infrastructure.metrics.worker import EVENTS_PROCESSED
+EVENTS_PROCESSED.inc({count})
+"""
+
+
+def test_single_process_uses_default_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(MULTIPROC_DIR_ENV, raising=False)
+
+    assert exposition_registry() is REGISTRY
+
+
+def test_multiprocess_registry_aggregates_processes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    env = {**os.environ, MULTIPROC_DIR_ENV: str(tmp_path), "PYTHONPATH": str(SRC_DIR)}
+    for count in (3, 4):
+        subprocess.run(
+            [sys.executable, "-c", INCREMENT.format(count=count)], env=env, check=True
+        )
+    monkeypatch.setenv(MULTIPROC_DIR_ENV, str(tmp_path))
+
+    registry = exposition_registry()
+
+    assert registry is not REGISTRY
+    assert registry.get_sample_value("worker_events_processed_total") == 7
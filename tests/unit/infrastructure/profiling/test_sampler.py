@@ -0,0 +1,60 @@
+import sys
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from domain.exceptions.app import ConflictError
+from infrastructure.profiling import sampler
+from infrastructure.profiling.sampler import collapse, profile, render_collapsed, sample_stacks
+
+
+def spin_in_thread(stop: threading.Event) -> None:
+    while not stop.is_set():
+        time.sleep(0.001)
+
+
+@pytest.fixture
+def busy_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=spin_in_thread, args=(stop,), name="busy")
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+def test_collapse_orders_frames_from_outermost():
+    def inner():
+        return collapse("main", sys._getframe())
+
+    def outer():
+        return inner()
+
+    stack = outer()
+
+    assert stack.startswith("main;")
+    assert stack.endswith(f"{__name__}:outer;{__name__}:inner")
+
+
+def test_sample_stacks_sees_other_threads_but_not_itself(busy_thread):
+    counts = sample_stacks(seconds=0.05, interval=0.001)
+
+    busy = [stack for stack in counts if stack.startswith("busy;")]
+    assert busy
+    assert all("spin_in_thread" in stack for stack in busy)
+    assert not any("sample_stacks" in stack for stack in counts)
+
+
+def test_render_collapsed_lists_most_frequent_first():
+    counts = Counter({"main;a:f": 1, "main;a:g": 3})
+
+    assert render_collapsed(counts) == "main;a:g 3\nmain;a:f 1\n"
+
+
+def test_profile_rejects_concurrent_runs():
+    with sampler._profile_lock, pytest.raises(ConflictError):
+        profile(seconds=0.01)
+
+    assert isinstance(profile(seconds=0.01), str)
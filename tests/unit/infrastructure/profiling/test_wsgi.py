@@ -0,0 +1,57 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from infrastructure.profiling import wsgi
+from infrastructure.profiling.wsgi import PROFILE_PATH, with_profiler
+
+
+@pytest.fixture
+def inner_app():
+    app = MagicMock(return_value=[b"metrics"])
+    return app
+
+
+@pytest.fixture
+def profiled_app(inner_app, monkeypatch):
+    monkeypatch.setattr(wsgi, "profile", lambda seconds, interval: f"main;m:f {seconds}\n")
+    return with_profiler(inner_app, secret_token="secret")
+
+
+def call(app, path, query="", token=None):
+    environ = {"PATH_INFO": path, "QUERY_STRING": query}
+    if token is not None:
+        environ["HTTP_AUTHORIZATION"] = f"Bearer {token}"
+    start_response = MagicMock()
+    body = b"".join(app(environ, start_response))
+    return start_response.call_args[0][0] if start_response.called else None, body
+
+
+def test_other_paths_go_to_wrapped_app(profiled_app, inner_app):
+    _, body = call(profiled_app, "/metrics")
+
+    assert body == b"metrics"
+    inner_app.assert_called_once()
+
+
+def test_profile_requires_token(profiled_app):
+    assert call(profiled_app, PROFILE_PATH)[0] == "403 Forbidden"
+    assert call(profiled_app, PROFILE_PATH, token="wrong")[0] == "403 Forbidden"
+
+
+def test_profile_disabled_without_configured_token(inner_app):
+    app = with_profiler(inner_app, secret_token="")
+
+    assert call(app, PROFILE_PATH, token="")[0] == "403 Forbidden"
+
+
+def test_profile_returns_collapsed_stacks(profiled_app):
+    status, body = call(profiled_app, PROFILE_PATH, query="seconds=2", token="secret")
+
+    assert status == "200 OK"
+    assert body == b"main;m:f 2.0\n"
+
+
+@pytest.mark.parametrize("query", ["seconds=abc", "seconds=0", "seconds=61", "interval_ms=0.5"])
+def test_profile_rejects_bad_parameters(profiled_app, query):
+    assert call(profiled_app, PROFILE_PATH, query=query, token="secret")[0] == "400 Bad Request"
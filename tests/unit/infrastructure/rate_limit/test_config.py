@@ -2,7 +2,11 @@ import pytest
 
 from domain.project.types import Plan
 from infrastructure.config.settings import Settings
-from infrastructure.rate_limit.config import get_plan_rate_limit
+from infrastructure.rate_limit.config import (
+    get_plan_byte_rate_limit,
+    get_plan_event_rate_limit,
+    get_plan_rate_limit,
+)
 
 
 @pytest.fixture
@@ -29,3 +33,19 @@ def test_get_plan_rate_limit_pro(mock_settings: Settings) -> None:
 def test_get_plan_rate_limit_enterprise(mock_settings: Settings) -> None:
     result = get_plan_rate_limit(Plan.ENTERPRISE, mock_settings)
     assert result == 10000
+
+
+@pytest.mark.parametrize(
+    ("plan", "expected"),
+    [(Plan.FREE, 1_000), (Plan.PRO, 10_000), (Plan.ENTERPRISE, 100_000)],
+)
+def test_get_plan_event_rate_limit(mock_settings: Settings, plan: Plan, expected: int) -> None:
+    assert get_plan_event_rate_limit(plan, mock_settings) == expected
+
+
+@pytest.mark.parametrize(
+    ("plan", "expected"),
+    [(Plan.FREE, 1_048_576), (Plan.PRO, 10_485_760), (Plan.ENTERPRISE, 104_857_600)],
+)
+def test_get_plan_byte_rate_limit(mock_settings: Settings, plan: Plan, expected: int) -> None:
+    assert get_plan_byte_rate_limit(plan, mock_settings) == expected
@@ -2,9 +2,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from domain.exceptions.app import RateLimitExceededError
+from domain.project.models import ProjectIdentity
 from domain.project.types import Plan
 from infrastructure.config.settings import AppEnv, Settings
 from infrastructure.rate_limit.dependencies import IPRateLimiter, PlanBasedRateLimiter
+from infrastructure.rate_limit.token_bucket import Charge
+from infrastructure.security.project_context import ProjectContext
 
 
 @pytest.fixture
@@ -18,6 +22,12 @@ def mock_settings() -> Settings:
     settings.rate_limit_enterprise_rpm = 10000
     settings.rate_limit_no_auth_rpm = 10
     settings.rate_limit_project_create_rpm = 5
+    settings.rate_limit_free_events_per_minute = 1_000
+    settings.rate_limit_pro_events_per_minute = 10_000
+    settings.rate_limit_enterprise_events_per_minute = 100_000
+    settings.rate_limit_free_bytes_per_minute = 100_000
+    settings.rate_limit_pro_bytes_per_minute = 1_000_000
+    settings.rate_limit_enterprise_bytes_per_minute = 10_000_000
     return settings
 
 
@@ -28,141 +38,180 @@ def mock_settings_disabled() -> Settings:
     return settings
 
 
+@pytest.fixture
+def mock_buckets() -> MagicMock:
+    buckets = MagicMock()
+    buckets.consume.return_value = 0
+    buckets.consume_all.return_value = 0
+    return buckets
+
+
 class TestPlanBasedRateLimiter:
     async def test_rate_limit_disabled_returns_early(
         self,
         mock_settings_disabled: Settings,
-        mock_uow: AsyncMock,
-        mock_cache: AsyncMock,
+        mock_buckets: MagicMock,
         mock_request: MagicMock,
         mock_response: MagicMock,
     ) -> None:
         limiter = PlanBasedRateLimiter(
-            settings=mock_settings_disabled, uow=mock_uow, cache=mock_cache
+            settings=mock_settings_disabled, context=ProjectContext(api_key=None, project=None),
+            buckets=mock_buckets,
         )
 
         await limiter(mock_request, mock_response)
 
-        # Should return early without checking headers
-        mock_uow.project.get_by_api_key.assert_not_called()
-        mock_cache.get.assert_not_called()
+        mock_buckets.consume.assert_not_called()
 
-    async def test_no_api_key_returns_ip_identifier(
+    async def test_allowed_request_consumes_one_token(
         self,
         mock_settings: Settings,
-        mock_uow: AsyncMock,
-        mock_cache: AsyncMock,
+        mock_buckets: MagicMock,
         mock_request: MagicMock,
+        mock_response: MagicMock,
     ) -> None:
-        mock_request.headers = {}
         limiter = PlanBasedRateLimiter(
-            settings=mock_settings, uow=mock_uow, cache=mock_cache
+            settings=mock_settings,
+            context=ProjectContext(api_key=None, project=None),
+            buckets=mock_buckets,
         )
 
-        identifier, rpm = await limiter._get_identifier_and_rpm(None, mock_request)
+        await limiter(mock_request, mock_response)
 
-        assert identifier == "ip:127.0.0.1"
-        assert rpm == 10
+        mock_buckets.consume.assert_called_once_with("ip:127.0.0.1", 10)
 
-    async def test_invalid_api_key_prefix_returns_ip_identifier(
+    async def test_exhausted_bucket_raises_with_fixed_retry_after(
         self,
         mock_settings: Settings,
-        mock_uow: AsyncMock,
-        mock_cache: AsyncMock,
+        mock_buckets: MagicMock,
         mock_request: MagicMock,
+        mock_response: MagicMock,
     ) -> None:
+        mock_buckets.consume.return_value = 7
         limiter = PlanBasedRateLimiter(
-            settings=mock_settings, uow=mock_uow, cache=mock_cache
+            settings=mock_settings,
+            context=ProjectContext(api_key=None, project=None),
+            buckets=mock_buckets,
         )
 
-        identifier, rpm = await limiter._get_identifier_and_rpm(
-            "invalid_key", mock_request
-        )
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            await limiter(mock_request, mock_response)
 
-        assert identifier == "ip:127.0.0.1"
-        assert rpm == 10
+        assert exc_info.value.retry_after == 60
 
-    async def test_valid_api_key_from_cache(
+    async def test_charge_events_uses_event_and_byte_budgets(
         self,
         mock_settings: Settings,
-        mock_uow: AsyncMock,
-        mock_cache: AsyncMock,
+        mock_buckets: MagicMock,
         mock_request: MagicMock,
         make_project,
     ) -> None:
+        mock_request.body = AsyncMock(return_value=b"x" * 2048)
         project = make_project(plan=Plan.PRO)
-        mock_cache.get.return_value = str(project.project_id)
-        mock_uow.project.get_by_id.return_value = project
-
         limiter = PlanBasedRateLimiter(
-            settings=mock_settings, uow=mock_uow, cache=mock_cache
+            settings=mock_settings,
+            context=ProjectContext(
+                api_key=project.api_key, project=ProjectIdentity.from_project(project)
+            ),
+            buckets=mock_buckets,
         )
 
-        identifier, rpm = await limiter._get_identifier_and_rpm(
-            project.api_key, mock_request
-        )
+        await limiter.charge_events(mock_request, events=250)
 
-        assert identifier == f"project:{project.project_id}"
-        assert rpm == 1000  # PRO plan
-        mock_cache.get.assert_called_once_with(f"api_key:{project.api_key}")
-        mock_uow.project.get_by_id.assert_called_once()
+        mock_buckets.consume_all.assert_called_once_with(
+            [
+                Charge(f"events:project:{project.project_id}", 10_000, 250),
+                Charge(f"bytes:project:{project.project_id}", 1_000_000, 2048),
+            ]
+        )
 
-    async def test_valid_api_key_from_database(
+    async def test_charge_events_over_budget_raises(
         self,
         mock_settings: Settings,
-        mock_uow: AsyncMock,
-        mock_cache: AsyncMock,
+        mock_buckets: MagicMock,
         mock_request: MagicMock,
         make_project,
     ) -> None:
-        project = make_project(plan=Plan.ENTERPRISE)
-        mock_cache.get.return_value = None
-        mock_uow.project.get_by_api_key.return_value = project
-
+        mock_request.body = AsyncMock(return_value=b"{}")
+        mock_buckets.consume_all.return_value = 12
+        project = make_project(plan=Plan.FREE)
         limiter = PlanBasedRateLimiter(
-            settings=mock_settings, uow=mock_uow, cache=mock_cache
+            settings=mock_settings,
+            context=ProjectContext(
+                api_key=project.api_key, project=ProjectIdentity.from_project(project)
+            ),
+            buckets=mock_buckets,
         )
 
-        identifier, rpm = await limiter._get_identifier_and_rpm(
-            project.api_key, mock_request
-        )
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            await limiter.charge_events(mock_request, events=500)
 
-        assert identifier == f"project:{project.project_id}"
-        assert rpm == 10000  # ENTERPRISE plan
-        mock_uow.project.get_by_api_key.assert_called_once_with(project.api_key)
-        mock_cache.set.assert_called_once_with(project.api_key, project.project_id)
+        assert exc_info.value.retry_after == 60
 
-    async def test_api_key_not_found_returns_ip_identifier(
+    async def test_charge_events_skipped_without_project(
         self,
         mock_settings: Settings,
-        mock_uow: AsyncMock,
-        mock_cache: AsyncMock,
+        mock_buckets: MagicMock,
         mock_request: MagicMock,
     ) -> None:
-        mock_cache.get.return_value = None
-        mock_uow.project.get_by_api_key.return_value = None
-
         limiter = PlanBasedRateLimiter(
-            settings=mock_settings, uow=mock_uow, cache=mock_cache
+            settings=mock_settings,
+            context=ProjectContext(api_key=None, project=None),
+            buckets=mock_buckets,
         )
 
-        identifier, rpm = await limiter._get_identifier_and_rpm(
-            "wk_test_nonexistent", mock_request
+        await limiter.charge_events(mock_request, events=10)
+
+        mock_buckets.consume_all.assert_not_called()
+
+    def test_no_project_returns_ip_identifier(
+        self,
+        mock_settings: Settings,
+        mock_buckets: MagicMock,
+        mock_request: MagicMock,
+    ) -> None:
+        limiter = PlanBasedRateLimiter(
+            settings=mock_settings,
+            context=ProjectContext(api_key="invalid_key", project=None, error="Bad API Key"),
+            buckets=mock_buckets,
         )
 
+        identifier, rpm = limiter._get_identifier_and_rpm(mock_request)
+
         assert identifier == "ip:127.0.0.1"
         assert rpm == 10
 
+    def test_resolved_project_uses_plan_limit(
+        self,
+        mock_settings: Settings,
+        mock_buckets: MagicMock,
+        mock_request: MagicMock,
+        make_project,
+    ) -> None:
+        project = make_project(plan=Plan.PRO)
+        limiter = PlanBasedRateLimiter(
+            settings=mock_settings,
+            context=ProjectContext(
+                api_key=project.api_key, project=ProjectIdentity.from_project(project)
+            ),
+            buckets=mock_buckets,
+        )
+
+        identifier, rpm = limiter._get_identifier_and_rpm(mock_request)
+
+        assert identifier == f"project:{project.project_id}"
+        assert rpm == 1000  # PRO plan
+
     def test_get_ip_identifier_with_client(
         self,
         mock_settings: Settings,
-        mock_uow: AsyncMock,
-        mock_cache: AsyncMock,
+        mock_buckets: MagicMock,
         mock_request: MagicMock,
     ) -> None:
         mock_request.client.host = "192.168.1.1"
         limiter = PlanBasedRateLimiter(
-            settings=mock_settings, uow=mock_uow, cache=mock_cache
+            settings=mock_settings, context=ProjectContext(api_key=None, project=None),
+            buckets=mock_buckets,
         )
 
         result = limiter._get_ip_identifier(mock_request)
@@ -172,13 +221,13 @@ class TestPlanBasedRateLimiter:
     def test_get_ip_identifier_without_client(
         self,
         mock_settings: Settings,
-        mock_uow: AsyncMock,
-        mock_cache: AsyncMock,
+        mock_buckets: MagicMock,
         mock_request: MagicMock,
     ) -> None:
         mock_request.client = None
         limiter = PlanBasedRateLimiter(
-            settings=mock_settings, uow=mock_uow, cache=mock_cache
+            settings=mock_settings, context=ProjectContext(api_key=None, project=None),
+            buckets=mock_buckets,
         )
 
         result = limiter._get_ip_identifier(mock_request)
@@ -1,13 +1,14 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from fastapi import Request, Response
+from unittest.mock import MagicMock
+from fastapi import Request
 
-from infrastructure.rate_limit.dependencies import PlanBasedRateLimiter, IPRateLimiter
-from domain.exceptions.app import RateLimitExceededError
+from infrastructure.rate_limit.dependencies import PlanBasedRateLimiter
+from infrastructure.security.project_context import ProjectContext
+from domain.project.models import ProjectIdentity
 from domain.project.types import Plan
 
 @pytest.fixture
-def mock_deps():
+def mock_settings_rl():
     settings = MagicMock()
     settings.is_rate_limit_enabled = True
     settings.app_env = "test"
@@ -15,63 +16,44 @@ def mock_deps():
     settings.rate_limit_free_rpm = 10
     settings.rate_limit_project_create_rpm = 2
 
-    uow = AsyncMock()
-    cache = AsyncMock()
+    return settings
 
-    return settings, uow, cache
-
-@pytest.mark.asyncio
-async def test_plan_limiter_no_api_key(mock_deps):
-    settings, uow, cache = mock_deps
-    limiter_cls = PlanBasedRateLimiter(settings, uow, cache)
+def test_plan_limiter_no_api_key(mock_settings_rl):
+    limiter_cls = PlanBasedRateLimiter(
+        mock_settings_rl, ProjectContext(api_key=None, project=None), MagicMock()
+    )
 
     request = MagicMock(spec=Request)
     request.headers.get.return_value = None
     request.client.host = "127.0.0.1"
 
-    ident, rpm = await limiter_cls._get_identifier_and_rpm(None, request)
+    ident, rpm = limiter_cls._get_identifier_and_rpm(request)
 
     assert ident == "ip:127.0.0.1"
     assert rpm == 5 # rate_limit_no_auth_rpm
 
-@pytest.mark.asyncio
-async def test_plan_limiter_cache_hit(mock_deps):
-    settings, uow, cache = mock_deps
-    limiter_cls = PlanBasedRateLimiter(settings, uow, cache)
-
-    api_key = "wk_test_123"
+def test_plan_limiter_resolved_project(mock_settings_rl):
     project_id = "proj_abc"
+    context = ProjectContext(
+        api_key="wk_test_123",
+        project=ProjectIdentity(project_id=project_id, plan=Plan.FREE),
+    )
+    limiter_cls = PlanBasedRateLimiter(mock_settings_rl, context, MagicMock())
 
-    request = MagicMock(spec=Request)
-    cache.get.return_value = project_id
-
-    project_mock = MagicMock()
-    project_mock.project_id = project_id
-    project_mock.plan = Plan.FREE
-    uow.project.get_by_id.return_value = project_mock
-
-    ident, rpm = await limiter_cls._get_identifier_and_rpm(api_key, request)
+    ident, rpm = limiter_cls._get_identifier_and_rpm(MagicMock(spec=Request))
 
     assert ident == f"project:{project_id}"
     assert rpm == 10 # rate_limit_free_rpm
-    cache.get.assert_awaited_with(f"api_key:{api_key}")
 
-@pytest.mark.asyncio
-async def test_plan_limiter_db_fallback(mock_deps):
-    settings, uow, cache = mock_deps
-    limiter_cls = PlanBasedRateLimiter(settings, uow, cache)
+def test_plan_limiter_unknown_key_falls_back_to_ip(mock_settings_rl):
+    context = ProjectContext(api_key="wk_test_123", project=None, error="Invalid API Key")
+    limiter_cls = PlanBasedRateLimiter(mock_settings_rl, context, MagicMock())
 
-    api_key = "wk_test_123"
     request = MagicMock(spec=Request)
+    request.headers.get.return_value = None
+    request.client.host = "10.0.0.1"
 
-    cache.get.return_value = None
-
-    project_mock = MagicMock()
-    project_mock.project_id = "proj_db"
-    project_mock.plan = Plan.FREE
-    uow.project.get_by_api_key.return_value = project_mock
-
-    ident, rpm = await limiter_cls._get_identifier_and_rpm(api_key, request)
+    ident, rpm = limiter_cls._get_identifier_and_rpm(request)
 
-    assert ident == "project:proj_db"
-    cache.set.assert_awaited_with(api_key, "proj_db")
+    assert ident == "ip:10.0.0.1"
+    assert rpm == 5
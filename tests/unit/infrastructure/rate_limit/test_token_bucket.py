@@ -0,0 +1,145 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fakeredis import aioredis
+
+from infrastructure.rate_limit.token_bucket import Charge, LocalTokenBuckets, TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def redis_client():
+    return aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def bucket_settings(mock_settings: MagicMock) -> MagicMock:
+    mock_settings.rate_limit_sync_interval = 0.25
+    mock_settings.rate_limit_bucket_idle_ttl = 120
+    return mock_settings
+
+
+def make_buckets(redis_client, bucket_settings, mock_logger, clock) -> LocalTokenBuckets:
+    return LocalTokenBuckets(redis_client, bucket_settings, mock_logger, clock=clock)
+
+
+class TestTokenBucket:
+    def test_take_until_empty(self) -> None:
+        bucket = TokenBucket.per_minute(limit=2, now=0.0)
+
+        assert bucket.take(1, now=0.0) == 0
+        assert bucket.take(1, now=0.0) == 0
+        assert bucket.take(1, now=0.0) == pytest.approx(30.0)
+
+    def test_refills_over_time(self) -> None:
+        bucket = TokenBucket.per_minute(limit=60, now=0.0)
+        bucket.tokens = 0
+
+        assert bucket.take(1, now=1.0) == 0
+
+    def test_drain_is_capped_at_one_bucket_of_debt(self) -> None:
+        bucket = TokenBucket.per_minute(limit=10, now=0.0)
+
+        bucket.drain(100, now=0.0)
+
+        assert bucket.tokens == -10
+
+
+class TestLocalTokenBuckets:
+    def test_consume_returns_retry_after_when_exhausted(
+        self, redis_client, bucket_settings, mock_logger, clock
+    ) -> None:
+        buckets = make_buckets(redis_client, bucket_settings, mock_logger, clock)
+
+        assert [buckets.consume("ip:1", 3) for _ in range(3)] == [0, 0, 0]
+        assert buckets.consume("ip:1", 3) == 20
+
+    def test_consume_all_is_all_or_nothing(
+        self, redis_client, bucket_settings, mock_logger, clock
+    ) -> None:
+        buckets = make_buckets(redis_client, bucket_settings, mock_logger, clock)
+        charges = [Charge("events:project:1", 1_000, 400), Charge("bytes:project:1", 1_000, 600)]
+
+        assert buckets.consume_all(charges) == 0
+        assert buckets.consume_all(charges) > 0
+        assert buckets.consume("events:project:1", 1_000, 600) == 0
+
+    def test_cost_above_capacity_needs_full_bucket(
+        self, redis_client, bucket_settings, mock_logger, clock
+    ) -> None:
+        buckets = make_buckets(redis_client, bucket_settings, mock_logger, clock)
+
+        assert buckets.consume("events:project:1", 100, 500) == 0
+        assert buckets.consume("events:project:1", 100, 1) > 0
+
+    def test_plan_change_resizes_bucket(
+        self, redis_client, bucket_settings, mock_logger, clock
+    ) -> None:
+        buckets = make_buckets(redis_client, bucket_settings, mock_logger, clock)
+        buckets.consume("project:1", 100)
+
+        buckets.consume("project:1", 1)
+
+        assert buckets.consume("project:1", 1) > 0
+
+    async def test_sync_flushes_local_consumption(
+        self, redis_client, bucket_settings, mock_logger, clock
+    ) -> None:
+        buckets = make_buckets(redis_client, bucket_settings, mock_logger, clock)
+        for _ in range(5):
+            buckets.consume("project:1", 100)
+
+        await buckets.sync()
+
+        assert await redis_client.get("rate_limit:consumed:project:1") == "5"
+
+    async def test_sync_drains_consumption_of_other_replicas(
+        self, redis_client, bucket_settings, mock_logger, clock
+    ) -> None:
+        local = make_buckets(redis_client, bucket_settings, mock_logger, clock)
+        remote = make_buckets(redis_client, bucket_settings, mock_logger, clock)
+        local.consume("project:1", 10)
+        await local.sync()
+
+        for _ in range(9):
+            remote.consume("project:1", 10)
+        await remote.sync()
+        await local.sync()
+
+        assert local.consume("project:1", 10) > 0
+
+    async def test_failed_sync_keeps_pending_consumption(
+        self, redis_client, bucket_settings, mock_logger, clock
+    ) -> None:
+        buckets = make_buckets(redis_client, bucket_settings, mock_logger, clock)
+        buckets.consume("project:1", 10)
+        redis_client.pipeline = MagicMock(side_effect=ConnectionError("down"))
+
+        with pytest.raises(ConnectionError):
+            await buckets.sync()
+
+        assert buckets._pending == {"project:1": 1}
+
+    async def test_idle_buckets_are_evicted(
+        self, redis_client, bucket_settings, mock_logger, clock
+    ) -> None:
+        buckets = make_buckets(redis_client, bucket_settings, mock_logger, clock)
+        buckets.consume("ip:1", 10)
+        await buckets.sync()
+
+        clock.now += 121
+        await buckets.sync()
+
+        assert buckets._buckets == {}
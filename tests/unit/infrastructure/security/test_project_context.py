@@ -0,0 +1,62 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from domain.exceptions.app import NotFoundError, UnauthorizedError
+from domain.project.models import ProjectIdentity
+from infrastructure.security.project_context import ProjectContext, resolve_project_context
+
+
+async def test_missing_api_key_skips_lookup(
+    mock_settings: MagicMock, mock_uow: AsyncMock, mock_project_cache: AsyncMock
+) -> None:
+    context = await resolve_project_context(None, mock_settings, mock_uow, mock_project_cache)
+
+    assert context.project is None
+    mock_project_cache.resolve.assert_not_called()
+    with pytest.raises(UnauthorizedError) as exc_info:
+        context.require()
+    assert exc_info.value.message == "Missing API Key"
+
+async def test_foreign_env_api_key_skips_lookup(
+    mock_settings: MagicMock, mock_uow: AsyncMock, mock_project_cache: AsyncMock
+) -> None:
+    context = await resolve_project_context(
+        "wk_prod_key", mock_settings, mock_uow, mock_project_cache
+    )
+
+    mock_project_cache.resolve.assert_not_called()
+    with pytest.raises(UnauthorizedError) as exc_info:
+        context.require()
+    assert exc_info.value.message == "Bad API Key"
+
+async def test_unknown_api_key(
+    mock_settings: MagicMock, mock_uow: AsyncMock, mock_project_cache: AsyncMock
+) -> None:
+    mock_uow.project.get_by_api_key.side_effect = NotFoundError("not found")
+
+    context = await resolve_project_context(
+        "wk_test_unknown", mock_settings, mock_uow, mock_project_cache
+    )
+
+    assert context.api_key == "wk_test_unknown"
+    with pytest.raises(UnauthorizedError) as exc_info:
+        context.require()
+    assert exc_info.value.message == "Invalid API Key"
+
+async def test_known_api_key_resolves_project(
+    mock_settings: MagicMock, mock_uow: AsyncMock, mock_project_cache: AsyncMock, make_project
+) -> None:
+    project = make_project()
+    mock_uow.project.get_by_api_key.return_value = project
+
+    context = await resolve_project_context(
+        project.api_key, mock_settings, mock_uow, mock_project_cache
+    )
+
+    assert context.require() == ProjectIdentity.from_project(project)
+    mock_project_cache.resolve.assert_awaited_once()
+
+def test_require_without_error_message() -> None:
+    with pytest.raises(UnauthorizedError):
+        ProjectContext(api_key=None, project=None).require()
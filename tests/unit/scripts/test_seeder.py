@@ -0,0 +1,34 @@
+import asyncio
+import importlib.util
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+SEEDER_PATH = Path(__file__).parents[3] / "scripts" / "seeder.py"
+
+
+@pytest.fixture(scope="module")
+def seeder():
+    spec = importlib.util.spec_from_file_location("seeder", SEEDER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("batch_size", [50, 100, 500])
+async def test_rate_worker_spreads_batches_over_every_project(seeder, monkeypatch, batch_size):
+    monkeypatch.setattr(seeder, "BATCH_SIZE", batch_size)
+    api_keys = [f"key_{plan}" for plan in ("free", "pro", "enterprise", "free_2")]
+    worker = seeder.RateWorker(0, api_keys, [(0.0, 1.0)], [0] * len(seeder.COUNTER_FIELDS))
+    worker.payloads = [[{"event_type": "page_view"}]]
+    client = MagicMock()
+    client.post = AsyncMock(return_value=MagicMock(status_code=202))
+    slots = asyncio.Semaphore(0)
+
+    for sequence in range(0, 8 * batch_size, batch_size):
+        await worker._send(client, slots, sequence)
+
+    used = [call.kwargs["headers"]["X-Api-Key"] for call in client.post.await_args_list]
+    assert used == api_keys * 2